@@ -275,11 +275,14 @@ class ManimConfig(MutableMapping):
         "from_animation_number",
         "images_dir",
         "input_file",
+        "jobs",
         "media_embed",
         "media_width",
         "log_dir",
         "log_to_file",
+        "max_bytes_cached",
         "max_files_cached",
+        "max_svg_cache_bytes",
         "media_dir",
         "movie_file_extension",
         "notify_outdated_version",
@@ -289,14 +292,18 @@ class ManimConfig(MutableMapping):
         "pixel_width",
         "plugins",
         "preview",
+        "profile",
         "progress_bar",
         "quality",
         "save_as_gif",
         "save_sections",
         "save_last_frame",
         "save_pngs",
+        "scene_jobs",
         "scene_names",
+        "shared_cache",
         "show_in_file_browser",
+        "svg_cache_dir",
         "tex_dir",
         "tex_template",
         "tex_template_file",
@@ -591,6 +598,7 @@ class ManimConfig(MutableMapping):
             "enable_wireframe",
             "force_window",
             "no_latex_cleanup",
+            "profile",
         ]:
             setattr(self, key, parser["CLI"].getboolean(key, fallback=False))
 
@@ -599,6 +607,10 @@ class ManimConfig(MutableMapping):
             "from_animation_number",
             "upto_animation_number",
             "max_files_cached",
+            "max_bytes_cached",
+            "max_svg_cache_bytes",
+            "jobs",
+            "scene_jobs",
             # the next two must be set BEFORE digesting frame_width and frame_height
             "pixel_height",
             "pixel_width",
@@ -618,7 +630,9 @@ class ManimConfig(MutableMapping):
             "images_dir",
             "text_dir",
             "tex_dir",
+            "svg_cache_dir",
             "partial_movie_dir",
+            "shared_cache",
             "input_file",
             "output_file",
             "movie_file_extension",
@@ -751,6 +765,7 @@ class ManimConfig(MutableMapping):
             "disable_caching",
             "format",
             "flush_cache",
+            "shared_cache",
             "progress_bar",
             "transparent",
             "scene_names",
@@ -767,6 +782,9 @@ class ManimConfig(MutableMapping):
             "dry_run",
             "no_latex_cleanup",
             "preview_command",
+            "jobs",
+            "scene_jobs",
+            "profile",
         ]:
             if hasattr(args, key):
                 attr = getattr(args, key)
@@ -823,6 +841,7 @@ class ManimConfig(MutableMapping):
                 "images_dir",
                 "text_dir",
                 "tex_dir",
+                "svg_cache_dir",
                 "log_dir",
                 "partial_movie_dir",
             ]:
@@ -1214,6 +1233,48 @@ class ManimConfig(MutableMapping):
     def max_files_cached(self, value: int) -> None:
         self._set_pos_number("max_files_cached", value, True)
 
+    @property
+    def max_bytes_cached(self) -> int:
+        """Maximum total size in bytes of the files cached.  Use -1 for infinity (no flag)."""
+        return self._d["max_bytes_cached"]
+
+    @max_bytes_cached.setter
+    def max_bytes_cached(self, value: int) -> None:
+        self._set_pos_number("max_bytes_cached", value, True)
+
+    @property
+    def max_svg_cache_bytes(self) -> int:
+        """Maximum total size in bytes of the cache of parsed SVG files.  Use -1 for infinity (no flag)."""
+        return self._d["max_svg_cache_bytes"]
+
+    @max_svg_cache_bytes.setter
+    def max_svg_cache_bytes(self, value: int) -> None:
+        self._set_pos_number("max_svg_cache_bytes", value, True)
+
+    @property
+    def jobs(self) -> int:
+        """Number of processes used to render the animations of a scene (-j).
+
+        Use 0 to start one process per CPU core.
+        """
+        return self._d["jobs"]
+
+    @jobs.setter
+    def jobs(self, value: int) -> None:
+        self._set_pos_number("jobs", value, False)
+
+    @property
+    def scene_jobs(self) -> int:
+        """Number of processes used to render the scenes of the input file.
+
+        Use 0 to start one process per CPU core.
+        """
+        return self._d["scene_jobs"]
+
+    @scene_jobs.setter
+    def scene_jobs(self, value: int) -> None:
+        self._set_pos_number("scene_jobs", value, False)
+
     @property
     def window_monitor(self) -> int:
         """The monitor on which the scene will be rendered."""
@@ -1241,6 +1302,15 @@ class ManimConfig(MutableMapping):
     def disable_caching(self, value: bool) -> None:
         self._set_boolean("disable_caching", value)
 
+    @property
+    def shared_cache(self) -> str:
+        """Directory or HTTP URL through which partial movie files are shared between machines (--shared_cache)."""
+        return self._d["shared_cache"]
+
+    @shared_cache.setter
+    def shared_cache(self, value: str | Path) -> None:
+        self._set_str("shared_cache", str(value) if value else value)
+
     @property
     def disable_caching_warning(self) -> bool:
         """Whether a warning is raised if there are too much submobjects to hash."""
@@ -1311,6 +1381,15 @@ class ManimConfig(MutableMapping):
         self._d["background_opacity"] = float(not value)
         self.resolve_movie_file_extension(value)
 
+    @property
+    def profile(self) -> bool:
+        """Whether to write the timings of the render pipeline next to the output file (--profile)."""
+        return self._d["profile"]
+
+    @profile.setter
+    def profile(self, value: bool) -> None:
+        self._set_boolean("profile", value)
+
     @property
     def dry_run(self) -> bool:
         """Whether dry run is enabled."""
@@ -1612,6 +1691,7 @@ class ManimConfig(MutableMapping):
             "images_dir",
             "text_dir",
             "tex_dir",
+            "svg_cache_dir",
             "log_dir",
             "input_file",
             "output_file",
@@ -1711,6 +1791,15 @@ class ManimConfig(MutableMapping):
     def tex_dir(self, value: str | Path) -> None:
         self._set_dir("tex_dir", value)
 
+    @property
+    def svg_cache_dir(self) -> str:
+        """Directory to place the cache of parsed SVG files (no flag).  See :meth:`ManimConfig.get_dir`."""
+        return self._d["svg_cache_dir"]
+
+    @svg_cache_dir.setter
+    def svg_cache_dir(self, value: str | Path) -> None:
+        self._set_dir("svg_cache_dir", value)
+
     @property
     def partial_movie_dir(self) -> str:
         """Directory to place partial movie files (no flag).  See :meth:`ManimConfig.get_dir`."""
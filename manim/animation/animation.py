@@ -19,6 +19,7 @@ from copy import deepcopy
 from functools import partialmethod
 from typing import TYPE_CHECKING, Any, Callable
 
+import numpy as np
 from typing_extensions import Self
 
 if TYPE_CHECKING:
@@ -108,6 +109,10 @@ class Animation:
 
     """
 
+    # What interpolate_mobject() evaluates at every frame, see
+    # _build_interpolation_plan().
+    _interpolation_plan: _InterpolationPlan | None = None
+
     def __new__(
         cls,
         mobject=None,
@@ -213,6 +218,7 @@ class Animation:
             # the internal updaters of self.starting_mobject,
             # or any others among self.get_all_mobjects()
             self.mobject.suspend_updating()
+        self._build_interpolation_plan()
         self.interpolate(0)
 
     def finish(self) -> None:
@@ -345,11 +351,25 @@ class Animation:
             is completed. For example, alpha-values of 0, 0.5, and 1 correspond
             to the animation being completed 0%, 50%, and 100%, respectively.
         """
-        families = list(self.get_all_families_zipped())
-        for i, mobs in enumerate(families):
-            sub_alpha = self.get_sub_alpha(alpha, i, len(families))
+        plan = self._get_interpolation_plan()
+        for mobs, sub_alpha in zip(plan.families, plan.get_sub_alphas(self, alpha)):
             self.interpolate_submobject(*mobs, sub_alpha)
 
+    def _get_interpolation_plan(self) -> _InterpolationPlan:
+        plan = self._interpolation_plan
+        if plan is None or not plan.is_valid_for(self):
+            plan = self._build_interpolation_plan()
+        return plan
+
+    def _build_interpolation_plan(self) -> _InterpolationPlan:
+        """Precompute what :meth:`interpolate_mobject` needs at every frame.
+
+        The plan is built when the animation begins and rebuilt whenever the
+        family of one of :meth:`get_all_mobjects` or the lag ratio changes.
+        """
+        self._interpolation_plan = _InterpolationPlan(self)
+        return self._interpolation_plan
+
     def interpolate_submobject(
         self,
         submobject: Mobject,
@@ -539,6 +559,49 @@ class Animation:
             cls.__init__ = cls._original__init__
 
 
+class _InterpolationPlan:
+    """The zipped families of an animation together with the lag schedule of
+    its submobjects.
+
+    The families of the mobjects of an animation are cached lists which are
+    replaced, never modified, when the hierarchy changes, so comparing their
+    identity is enough to detect a plan that became stale.
+    """
+
+    __slots__ = ("families", "family_lists", "lag_ratio", "full_length", "lowers")
+
+    def __init__(self, animation: Animation) -> None:
+        self.family_lists = [mob.get_family() for mob in animation.get_all_mobjects()]
+        self.families = list(animation.get_all_families_zipped())
+        self.lag_ratio = animation.lag_ratio
+        num_submobjects = len(self.families)
+        self.full_length = (num_submobjects - 1) * self.lag_ratio + 1
+        self.lowers = np.arange(num_submobjects) * self.lag_ratio
+
+    def is_valid_for(self, animation: Animation) -> bool:
+        return animation.lag_ratio == self.lag_ratio and all(
+            mob.get_family() is family
+            for mob, family in zip(animation.get_all_mobjects(), self.family_lists)
+        )
+
+    def get_sub_alphas(self, animation: Animation, alpha: float) -> list[float]:
+        """Evaluate :meth:`.Animation.get_sub_alpha` for all submobjects."""
+        num_submobjects = len(self.families)
+        if type(animation).get_sub_alpha is not Animation.get_sub_alpha:
+            return [
+                animation.get_sub_alpha(alpha, i, num_submobjects)
+                for i in range(num_submobjects)
+            ]
+        values = alpha * self.full_length - self.lowers
+        if animation.reverse_rate_function:
+            values = 1 - values
+        rate_func = animation.rate_func
+        if self.lag_ratio == 0 and num_submobjects:
+            # All submobjects progress together.
+            return [rate_func(float(values[0]))] * num_submobjects
+        return [rate_func(value) for value in values.tolist()]
+
+
 def prepare_animation(
     anim: Animation | mobject._AnimationBuilder | opengl_mobject._AnimationBuilder,
 ) -> Animation:
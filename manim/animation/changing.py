@@ -170,4 +170,5 @@ class TracedPath(VMobject, metaclass=ConvertToOpenGL):
             self.time += dt
             if self.time - 1 > self.dissipating_time:
                 nppcc = self.n_points_per_curve
-                self.set_points(self.points[nppcc:])
+                # Keep a view, so that the next point is appended in place.
+                self.points = self.points[nppcc:]
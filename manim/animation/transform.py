@@ -45,10 +45,13 @@ from ..constants import (
     RendererType,
 )
 from ..mobject.mobject import Group, Mobject
-from ..utils.paths import path_along_arc, path_along_circles
+from ..mobject.types.vectorized_mobject import VMobject
+from ..utils.bezier import interpolate
+from ..utils.paths import _is_pointwise, path_along_arc, path_along_circles
 from ..utils.rate_functions import smooth, squish_rate_func
 
 if TYPE_CHECKING:
+    from ..animation.animation import _InterpolationPlan
     from ..scene.scene import Scene
 
 
@@ -129,6 +132,9 @@ class Transform(Animation):
     :class:`~.ReplacementTransform`, :meth:`~.Mobject.interpolate`, :meth:`~.Mobject.align_data`
     """
 
+    # See _get_batched_interpolation().
+    _batched_interpolation: _BatchedInterpolation | None = None
+
     def __init__(
         self,
         mobject: Mobject | None,
@@ -246,6 +252,133 @@ class Transform(Animation):
         submobject.interpolate(starting_submobject, target_copy, alpha, self.path_func)
         return self
 
+    def interpolate_mobject(self, alpha: float) -> None:
+        batch = self._get_batched_interpolation()
+        if batch is None:
+            super().interpolate_mobject(alpha)
+            return
+        sub_alpha = self.get_sub_alpha(alpha, 0, 1)
+        if sub_alpha == 1:
+            # The final colors are copies of those of the target, see
+            # VMobject.interpolate_color().
+            super().interpolate_mobject(alpha)
+            return
+        batch.interpolate(sub_alpha, self.path_func)
+        for mobs in batch.remaining:
+            self.interpolate_submobject(*mobs, sub_alpha)
+
+    def _get_batched_interpolation(self) -> _BatchedInterpolation | None:
+        """Return the packed families of the animation if all submobjects can
+        be interpolated at once in this frame, and ``None`` otherwise.
+
+        This is the case when the submobjects progress together, the path
+        function is pointwise and neither the starting nor the target
+        mobject is changed by updaters.
+        """
+        if (
+            config.renderer == RendererType.OPENGL
+            or self.lag_ratio != 0
+            or type(self).interpolate_submobject is not Transform.interpolate_submobject
+            or type(self).get_sub_alpha is not Animation.get_sub_alpha
+            or not _is_pointwise(self.path_func)
+        ):
+            return None
+        if any(
+            mob._get_family_updater_info()[0]
+            for mob in self.get_all_mobjects_to_update()
+        ):
+            return None
+        plan = self._get_interpolation_plan()
+        batch = self._batched_interpolation
+        if batch is None or batch.plan is not plan:
+            batch = self._batched_interpolation = _BatchedInterpolation(plan)
+        return batch
+
+
+class _BatchedInterpolation:
+    """The points and the style of the aligned families of a
+    :class:`Transform`, packed into contiguous arrays.
+
+    A frame is then interpolated by a single call of the path function and a
+    single linear interpolation of the style, whose results are scattered back
+    into the submobjects as views. Submobjects which
+    :meth:`.VMobject.interpolate` would not handle alike are interpolated
+    one by one, see :attr:`remaining`.
+    """
+
+    STYLE_ATTRS = (
+        "fill_rgbas",
+        "stroke_rgbas",
+        "background_stroke_rgbas",
+        "stroke_width",
+        "background_stroke_width",
+        "sheen_direction",
+        "sheen_factor",
+    )
+
+    def __init__(self, plan: _InterpolationPlan) -> None:
+        self.plan = plan
+        self.mobjects: list[VMobject] = []
+        self.remaining: list[tuple] = []
+        point_bounds = [0]
+        style_layout: list[tuple[int, tuple[int, ...]]] = []
+        style_size = 0
+        starts, ends, style_starts, style_ends = [], [], [], []
+        for mobs in plan.families:
+            if not self._can_batch(mobs):
+                self.remaining.append(mobs)
+                continue
+            mob, start, end = mobs
+            self.mobjects.append(mob)
+            starts.append(start.points)
+            ends.append(end.points)
+            point_bounds.append(point_bounds[-1] + len(start.points))
+            for attr in self.STYLE_ATTRS:
+                value = np.asarray(getattr(start, attr), dtype=float)
+                style_layout.append((style_size, value.shape))
+                style_size += value.size
+                style_starts.append(value.ravel())
+                style_ends.append(np.asarray(getattr(end, attr), dtype=float).ravel())
+        self.point_bounds = point_bounds
+        self.style_layout = style_layout
+        if self.mobjects:
+            self.start_points = np.concatenate(starts)
+            self.end_points = np.concatenate(ends)
+            self.start_style = np.concatenate(style_starts)
+            self.end_style = np.concatenate(style_ends)
+
+    def _can_batch(self, mobs: tuple) -> bool:
+        if len(mobs) != 3 or not all(isinstance(mob, VMobject) for mob in mobs):
+            return False
+        mob, start, end = mobs
+        if (
+            type(mob).interpolate is not Mobject.interpolate
+            or type(mob).interpolate_color is not VMobject.interpolate_color
+            or start.points.shape != end.points.shape
+        ):
+            return False
+        return all(
+            np.shape(getattr(start, attr)) == np.shape(getattr(end, attr))
+            for attr in self.STYLE_ATTRS
+        )
+
+    def interpolate(self, alpha: float, path_func: Callable) -> None:
+        if not self.mobjects:
+            return
+        points = path_func(self.start_points, self.end_points, alpha)
+        style = interpolate(self.start_style, self.end_style, alpha)
+        bounds = self.point_bounds
+        layout = iter(self.style_layout)
+        for i, mob in enumerate(self.mobjects):
+            mob.points = points[bounds[i] : bounds[i + 1]]
+            for attr in self.STYLE_ATTRS:
+                offset, shape = next(layout)
+                if shape:
+                    size = int(np.prod(shape))
+                    setattr(mob, attr, style[offset : offset + size].reshape(shape))
+                else:
+                    setattr(mob, attr, float(style[offset]))
+
 
 class ReplacementTransform(Transform):
     """Replaces and morphs a mobject into a target mobject.
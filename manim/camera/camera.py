@@ -8,6 +8,7 @@ import copy
 import itertools as it
 import operator as op
 import pathlib
+import weakref
 from collections.abc import Iterable
 from functools import reduce
 from typing import Any, Callable
@@ -27,6 +28,7 @@ from ..utils.color import ManimColor, ParsableManimColor, color_to_int_rgba
 from ..utils.family import extract_mobject_family_members
 from ..utils.images import get_full_raster_image_path
 from ..utils.iterables import list_difference_update
+from ..utils.profiling import profiler
 from ..utils.space_ops import angle_of_vector
 
 LINE_JOIN_MAP = {
@@ -130,6 +132,14 @@ class Camera:
 
         self.rgb_max_val = np.iinfo(self.pixel_array_dtype).max
         self.pixel_array_to_cairo_context = {}
+        # Maps every VMobject to the points its cairo path was last compiled
+        # from, and to that path.
+        self.cairo_path_cache: weakref.WeakKeyDictionary[
+            VMobject, tuple[np.ndarray, float, list]
+        ] = weakref.WeakKeyDictionary()
+        # Pixel rectangles (x0, y0, x1, y1) outside of which VMobjects are not
+        # drawn, see set_cairo_context_clip().
+        self.clip_regions: list[tuple[int, int, int, int]] | None = None
 
         # Contains the correct method to process a list of Mobjects of the
         # corresponding class.  If a Mobject is not an instance of a class in
@@ -481,6 +491,99 @@ class Camera:
             ],
         )
 
+    def remove_mobjects_outside_frame(self, mobjects: list[Mobject]) -> list[Mobject]:
+        """Removes the :class:`~.VMobject` instances which lie entirely outside
+        of the frame, so that their paths are neither built nor drawn.
+
+        The bounding box of the points of a VMobject is widened by its stroke,
+        including the miters cairo may draw at its corners. Cameras which map
+        points to the frame differently, such as :class:`~.ThreeDCamera`,
+        capture all the mobjects.
+
+        Parameters
+        ----------
+        mobjects
+            The mobjects to display, with their submobjects.
+
+        Returns
+        -------
+        list
+            The mobjects which may be visible, in the same order.
+        """
+        if (
+            type(self).points_to_pixel_coords is not Camera.points_to_pixel_coords
+            or type(self).transform_points_pre_display
+            is not Camera.transform_points_pre_display
+        ):
+            return mobjects
+        fc = self.frame_center
+        half_width = self.frame_width / 2
+        half_height = self.frame_height / 2
+        visible = []
+        for mobject in mobjects:
+            if isinstance(mobject, VMobject) and len(mobject.points):
+                points = mobject.points
+                margin = self.get_stroke_reach(mobject)
+                x_min, y_min = points[:, :2].min(axis=0)
+                x_max, y_max = points[:, :2].max(axis=0)
+                if (
+                    x_max < fc[0] - half_width - margin
+                    or x_min > fc[0] + half_width + margin
+                    or y_max < fc[1] - half_height - margin
+                    or y_min > fc[1] + half_height + margin
+                ):
+                    continue
+            visible.append(mobject)
+        return visible
+
+    def get_stroke_reach(self, vmobject: VMobject) -> float:
+        """Returns how far the stroke of a VMobject may be drawn past its
+        points, in frame units.
+
+        Cairo's default miter limit of 10 times the half line width bounds
+        this distance.
+        """
+        width = max(
+            vmobject.get_stroke_width(),
+            vmobject.get_stroke_width(background=True),
+        )
+        return 5 * self.cairo_line_width_multiple * width
+
+    def get_pixel_region(self, vmobject: VMobject) -> tuple[int, int, int, int]:
+        """Returns the pixel rectangle which a VMobject may cover when it is
+        displayed, including its stroke and antialiasing.
+
+        Parameters
+        ----------
+        vmobject
+            The VMobject, which must have points.
+
+        Returns
+        -------
+        tuple[int, int, int, int]
+            The rectangle ``(x0, y0, x1, y1)``, clamped to the frame. It is
+            empty if the VMobject lies outside of the frame.
+        """
+        points = vmobject.points
+        margin = self.get_stroke_reach(vmobject)
+        x_min, y_min = points[:, :2].min(axis=0) - margin
+        x_max, y_max = points[:, :2].max(axis=0) + margin
+        fc = self.frame_center
+        width_mult = self.pixel_width / self.frame_width
+        height_mult = self.pixel_height / self.frame_height
+        # Two more pixels for antialiasing.
+        x0 = (x_min - fc[0]) * width_mult + self.pixel_width / 2 - 2
+        x1 = (x_max - fc[0]) * width_mult + self.pixel_width / 2 + 2
+        y0 = (fc[1] - y_max) * height_mult + self.pixel_height / 2 - 2
+        y1 = (fc[1] - y_min) * height_mult + self.pixel_height / 2 + 2
+        if not np.all(np.isfinite([x0, x1, y0, y1])):
+            return (0, 0, self.pixel_width, self.pixel_height)
+        x0 = min(max(int(x0), 0), self.pixel_width)
+        x1 = min(max(int(np.ceil(x1)), x0), self.pixel_width)
+        y0 = min(max(int(y0), 0), self.pixel_height)
+        y1 = min(max(int(np.ceil(y1)), y0), self.pixel_height)
+        return (x0, y0, x1, y1)
+
     def capture_mobject(self, mobject: Mobject, **kwargs: Any):
         """Capture mobjects by storing it in :attr:`pixel_array`.
 
@@ -523,9 +626,11 @@ class Camera:
         # VMobject], [PMobject, PMobject], and [VMobject].  This must be done
         # without altering their order.  it.groupby computes exactly this
         # partition while at the same time preserving order.
-        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
-        for group_type, group in it.groupby(mobjects, self.type_or_raise):
-            self.display_funcs[group_type](list(group), self.pixel_array)
+        with profiler.span("capture", "frame"):
+            mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+            mobjects = self.remove_mobjects_outside_frame(mobjects)
+            for group_type, group in it.groupby(mobjects, self.type_or_raise):
+                self.display_funcs[group_type](list(group), self.pixel_array)
 
     # Methods associated with svg rendering
 
@@ -605,6 +710,27 @@ class Camera:
         self.cache_cairo_context(pixel_array, ctx)
         return ctx
 
+    def set_cairo_context_clip(self, ctx: cairo.Context):
+        """Restricts drawing in the cairo context to :attr:`clip_regions`, or
+        lifts the restriction if it is ``None``.
+
+        Parameters
+        ----------
+        ctx
+            The cairo context.
+        """
+        ctx.reset_clip()
+        if self.clip_regions is None:
+            return
+        # The rectangles are given in pixels, that is in device space.
+        matrix = ctx.get_matrix()
+        ctx.identity_matrix()
+        ctx.new_path()
+        for x0, y0, x1, y1 in self.clip_regions:
+            ctx.rectangle(x0, y0, x1 - x0, y1 - y0)
+        ctx.clip()
+        ctx.set_matrix(matrix)
+
     def display_multiple_vectorized_mobjects(
         self, vmobjects: list, pixel_array: np.ndarray
     ):
@@ -643,8 +769,10 @@ class Camera:
             The Pixel array to add the VMobjects to.
         """
         ctx = self.get_cairo_context(pixel_array)
+        self.set_cairo_context_clip(ctx)
         for vmobject in vmobjects:
-            self.display_vectorized(vmobject, ctx)
+            with profiler.measure("draw", type(vmobject).__name__):
+                self.display_vectorized(vmobject, ctx)
 
     def display_vectorized(self, vmobject: VMobject, ctx: cairo.Context):
         """Displays a VMobject in the cairo context
@@ -661,12 +789,117 @@ class Camera:
         Camera
             The camera object
         """
+        if hasattr(vmobject, "use_mesh") and vmobject.use_mesh:
+            return self.display_mesh(vmobject, ctx)
         self.set_cairo_context_path(ctx, vmobject)
         self.apply_stroke(ctx, vmobject, background=True)
         self.apply_fill(ctx, vmobject)
         self.apply_stroke(ctx, vmobject)
         return self
 
+    def display_mesh(self, surface: VMobject, ctx: cairo.Context):
+        """Displays a :class:`.Surface` created with ``use_mesh=True`` in the
+        cairo context.
+
+        Every face is drawn as a closed path with its own fill color, in the
+        order given by :meth:`get_mesh_face_order`. The points of all the faces
+        are transformed for display at once.
+
+        Parameters
+        ----------
+        surface
+            The surface to display.
+        ctx
+            The cairo context to use.
+
+        Returns
+        -------
+        Camera
+            The camera object
+        """
+        points = self.transform_points_pre_display(surface, surface.points)
+        if len(points) == 0 or len(points) != len(surface.points):
+            return self
+        nppcc = surface.n_points_per_cubic_curve
+        num_faces = len(surface.get_mesh_face_points())
+        curves = points[:, :2].reshape(num_faces, -1, nppcc, 2)
+        starts = curves[:, 0, 0].tolist()
+        control_points = (
+            curves[:, :, 1:].reshape(num_faces, -1, 2 * (nppcc - 1)).tolist()
+        )
+        # Cairo encodes the colors in reverse order
+        fill_rgbas = self.get_mesh_fill_rgbas(surface)[:, [2, 1, 0, 3]].tolist()
+        strokes = []
+        for background in (True, False):
+            rgba = surface.get_stroke_rgbas(background)[0]
+            width = surface.get_stroke_width(background)
+            strokes.append(
+                (width * self.cairo_line_width_multiple, [*rgba[2::-1], rgba[3]])
+            )
+        background_stroke, stroke = strokes
+        if surface.joint_type != LineJointType.AUTO:
+            ctx.set_line_join(LINE_JOIN_MAP[surface.joint_type])
+        if surface.cap_style != CapStyleType.AUTO:
+            ctx.set_line_cap(CAP_STYLE_MAP[surface.cap_style])
+
+        def apply_stroke(width: float, rgba: list[float]) -> None:
+            if width == 0:
+                return
+            ctx.set_source_rgba(*rgba)
+            ctx.set_line_width(width)
+            ctx.stroke_preserve()
+
+        for i in self.get_mesh_face_order(surface).tolist():
+            ctx.new_path()
+            ctx.move_to(*starts[i])
+            for curve in control_points[i]:
+                ctx.curve_to(*curve)
+            ctx.close_path()
+            apply_stroke(*background_stroke)
+            ctx.set_source_rgba(*fill_rgbas[i])
+            ctx.fill_preserve()
+            apply_stroke(*stroke)
+        return self
+
+    def get_mesh_face_order(self, surface: VMobject) -> np.ndarray:
+        """Returns the order in which :meth:`display_mesh` draws the faces of
+        a :class:`.Surface` created with ``use_mesh=True``.
+
+        Parameters
+        ----------
+        surface
+            The surface to display.
+
+        Returns
+        -------
+        np.ndarray
+            The indices of the faces, in drawing order.
+        """
+        return np.arange(len(surface.get_mesh_face_points()))
+
+    def get_mesh_fill_rgbas(self, surface: VMobject) -> np.ndarray:
+        """Returns the RGBA array of the fill of every face of a
+        :class:`.Surface` created with ``use_mesh=True``.
+
+        The faces without a color of their own have the fill color of the
+        surface, and all the faces have its fill opacity.
+
+        Parameters
+        ----------
+        surface
+            The surface to display.
+
+        Returns
+        -------
+        np.ndarray
+            The RGBA array of every face.
+        """
+        num_faces = len(surface.get_mesh_face_points())
+        rgbas = np.repeat(surface.get_fill_rgbas()[:1], num_faces, axis=0)
+        if surface.face_colors is not None:
+            rgbas[:, :3] = surface.face_colors
+        return rgbas
+
     def set_cairo_context_path(self, ctx: cairo.Context, vmobject: VMobject):
         """Sets a path for the cairo context with the vmobject passed
 
@@ -689,18 +922,79 @@ class Camera:
             return
 
         ctx.new_path()
-        subpaths = vmobject.gen_subpaths_from_points_2d(points)
-        for subpath in subpaths:
-            quads = vmobject.gen_cubic_bezier_tuples_from_points(subpath)
+        for start, curves, closed in self.get_cairo_path(vmobject, points):
             ctx.new_sub_path()
-            start = subpath[0]
-            ctx.move_to(*start[:2])
-            for _p0, p1, p2, p3 in quads:
-                ctx.curve_to(*p1[:2], *p2[:2], *p3[:2])
-            if vmobject.consider_points_equals_2d(subpath[0], subpath[-1]):
+            ctx.move_to(*start)
+            for curve in curves:
+                ctx.curve_to(*curve)
+            if closed:
                 ctx.close_path()
         return self
 
+    def get_cairo_path(
+        self, vmobject: VMobject, points: np.ndarray
+    ) -> list[tuple[list[float], list[list[float]], bool]]:
+        """Compiles the points of a VMobject into the commands drawing its path.
+
+        The subpaths are split and checked for closedness with NumPy in one
+        pass over ``points``, the same way as
+        :meth:`.VMobject.gen_subpaths_from_points_2d` and
+        :meth:`.VMobject.consider_points_equals_2d` do curve by curve. The
+        result is cached until the points of ``vmobject`` change.
+
+        Parameters
+        ----------
+        vmobject
+            The VMobject
+        points
+            The points of ``vmobject``, as transformed for display.
+
+        Returns
+        -------
+        list
+            For every subpath, its starting point, the control points
+            ``[x1, y1, x2, y2, x3, y3]`` of its curves and whether it is closed.
+        """
+        tolerance = vmobject.tolerance_for_point_equality
+        cached = self.cairo_path_cache.get(vmobject)
+        if (
+            cached is not None
+            and cached[1] == tolerance
+            and cached[0].shape == points.shape
+            and np.array_equal(cached[0], points)
+        ):
+            return cached[2]
+
+        nppcc = vmobject.n_points_per_cubic_curve
+        n_curves = len(points) // nppcc
+        if n_curves == 0:
+            return []
+        curves = points[: n_curves * nppcc, :2].reshape(n_curves, nppcc, 2)
+
+        def are_equal_2d(p0: np.ndarray, p1: np.ndarray) -> np.ndarray:
+            # Same as np.isclose() with the tolerance of the VMobject.
+            return np.all(np.abs(p0 - p1) <= tolerance + 1.0e-5 * np.abs(p1), axis=-1)
+
+        # A new subpath starts at every curve not starting where the previous
+        # one ends.
+        breaks = ~are_equal_2d(curves[:-1, -1], curves[1:, 0])
+        subpath_starts = np.concatenate([[0], np.flatnonzero(breaks) + 1])
+        subpath_ends = np.append(subpath_starts[1:], n_curves)
+        closed = are_equal_2d(curves[subpath_starts, 0], curves[subpath_ends - 1, -1])
+
+        control_points = curves[:, 1:].reshape(n_curves, 2 * (nppcc - 1)).tolist()
+        path = [
+            (start_point, control_points[start:end], is_closed)
+            for start_point, start, end, is_closed in zip(
+                curves[subpath_starts, 0].tolist(),
+                subpath_starts.tolist(),
+                subpath_ends.tolist(),
+                closed.tolist(),
+            )
+        ]
+        self.cairo_path_cache[vmobject] = (points.copy(), tolerance, path)
+        return path
+
     def set_cairo_context_color(
         self, ctx: cairo.Context, rgbas: np.ndarray, vmobject: VMobject
     ):
@@ -863,8 +1157,9 @@ class Camera:
             The camera object.
         """
         displayer = self.get_background_colored_vmobject_displayer()
-        cvmobject_pixel_array = displayer.display(*cvmobjects)
-        self.overlay_rgba_array(pixel_array, cvmobject_pixel_array)
+        with profiler.measure("draw", "background colored VMobjects"):
+            cvmobject_pixel_array = displayer.display(*cvmobjects)
+            self.overlay_rgba_array(pixel_array, cvmobject_pixel_array)
         return self
 
     # Methods for other rendering
@@ -885,13 +1180,14 @@ class Camera:
             The pixel array to modify.
         """
         for pmobject in pmobjects:
-            self.display_point_cloud(
-                pmobject,
-                pmobject.points,
-                pmobject.rgbas,
-                self.adjusted_thickness(pmobject.stroke_width),
-                pixel_array,
-            )
+            with profiler.measure("draw", type(pmobject).__name__):
+                self.display_point_cloud(
+                    pmobject,
+                    pmobject.points,
+                    pmobject.rgbas,
+                    self.adjusted_thickness(pmobject.stroke_width),
+                    pixel_array,
+                )
 
     def display_point_cloud(
         self,
@@ -959,7 +1255,8 @@ class Camera:
             The pixel array to modify.
         """
         for image_mobject in image_mobjects:
-            self.display_image_mobject(image_mobject, pixel_array)
+            with profiler.measure("draw", type(image_mobject).__name__):
+                self.display_image_mobject(image_mobject, pixel_array)
 
     def display_image_mobject(
         self, image_mobject: AbstractImageMobject, pixel_array: np.ndarray
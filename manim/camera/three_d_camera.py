@@ -22,6 +22,7 @@ from .. import config
 from ..camera.camera import Camera
 from ..constants import *
 from ..mobject.types.point_cloud_mobject import Point
+from ..mobject.types.vectorized_mobject import VMobject
 from ..utils.color import get_shaded_rgb
 from ..utils.family import extract_mobject_family_members
 from ..utils.space_ops import rotation_about_z, rotation_matrix
@@ -50,6 +51,8 @@ class ThreeDCamera(Camera):
             Any keyword argument of Camera.
         """
         self._frame_center = Point(kwargs.get("frame_center", ORIGIN), stroke_width=0)
+        self._capturing = False
+        self._projected_points = {}
         super().__init__(**kwargs)
         self.focal_distance = focal_distance
         self.phi = phi
@@ -82,7 +85,12 @@ class ThreeDCamera(Camera):
 
     def capture_mobjects(self, mobjects, **kwargs):
         self.reset_rotation_matrix()
-        super().capture_mobjects(mobjects, **kwargs)
+        self._capturing = True
+        try:
+            super().capture_mobjects(mobjects, **kwargs)
+        finally:
+            self._capturing = False
+            self._projected_points = {}
 
     def get_value_trackers(self):
         """A list of :class:`ValueTrackers <.ValueTracker>` of phi, theta, focal_distance,
@@ -135,18 +143,122 @@ class ThreeDCamera(Camera):
     def get_fill_rgbas(self, vmobject):  # NOTE : DocStrings From parent
         return self.modified_rgbas(vmobject, vmobject.get_fill_rgbas())
 
+    def get_mesh_face_order(self, surface):  # NOTE : DocStrings From parent
+        # The faces are sorted like the mobjects in get_depth_keys().
+        centers = self._get_mesh_face_centers(surface)
+        depths = np.dot(centers, self.get_rotation_matrix().T)[:, 2]
+        return np.argsort(depths, kind="stable")
+
+    def get_mesh_fill_rgbas(self, surface):  # NOTE : DocStrings From parent
+        rgbas = super().get_mesh_fill_rgbas(surface)
+        if not (self.should_apply_shading and surface.shade_in_3d):
+            return rgbas
+        # Same shading as get_shaded_rgb(), at the center of every face.
+        corners = surface.get_mesh_face_points()[:, :: surface.n_points_per_curve]
+        normals = np.cross(corners[:, 2] - corners[:, 0], corners[:, 3] - corners[:, 1])
+        normals[np.linalg.norm(normals, axis=1) == 0] = UP
+        normals /= np.linalg.norm(normals, axis=1)[:, np.newaxis]
+        to_sun = self.light_source.points[0] - self._get_mesh_face_centers(surface)
+        to_sun_norms = np.linalg.norm(to_sun, axis=1)[:, np.newaxis]
+        to_sun = np.divide(
+            to_sun, to_sun_norms, out=np.zeros_like(to_sun), where=to_sun_norms != 0
+        )
+        light = 0.5 * np.sum(normals * to_sun, axis=1) ** 3
+        light[light < 0] *= 0.5
+        rgbas[:, :3] += light[:, np.newaxis]
+        return rgbas
+
+    def _get_mesh_face_centers(self, surface) -> np.ndarray:
+        corners = surface.get_mesh_face_points()[:, :: surface.n_points_per_curve]
+        return (corners.min(axis=1) + corners.max(axis=1)) / 2
+
     def get_mobjects_to_display(self, *args, **kwargs):  # NOTE : DocStrings From parent
         mobjects = super().get_mobjects_to_display(*args, **kwargs)
-        rot_matrix = self.get_rotation_matrix()
+        # Mobjects which are not shaded in 3D keep their order and are
+        # displayed after the others.
+        order = np.argsort(self.get_depth_keys(mobjects), kind="stable")
+        mobjects = [mobjects[i] for i in order]
+        if self._capturing:
+            self._project_vmobject_points(mobjects)
+        return mobjects
+
+    def get_depth_keys(self, mobjects: list[Mobject]) -> np.ndarray:
+        """Returns the keys by which the mobjects are sorted before being
+        displayed, which are larger for the mobjects closer to the camera.
+
+        The key of a mobject shaded in 3D is the depth of its
+        :meth:`~.Mobject.get_z_index_reference_point`, and the key of any
+        other mobject is ``np.inf``. The reference points of the
+        :class:`~.VMobject` instances without submobjects are the centers of
+        the bounding boxes of their anchors, which are computed for all of
+        them at once.
 
-        def z_key(mob):
-            if not (hasattr(mob, "shade_in_3d") and mob.shade_in_3d):
-                return np.inf
-            # Assign a number to a three dimensional mobjects
-            # based on how close it is to the camera
-            return np.dot(mob.get_z_index_reference_point(), rot_matrix.T)[2]
+        Parameters
+        ----------
+        mobjects
+            The mobjects to display.
 
-        return sorted(mobjects, key=z_key)
+        Returns
+        -------
+        np.ndarray
+            The depth key of each mobject.
+        """
+        rot_matrix = self.get_rotation_matrix()
+        keys = np.full(len(mobjects), np.inf)
+        batched = []
+        for i, mob in enumerate(mobjects):
+            if not (hasattr(mob, "shade_in_3d") and mob.shade_in_3d):
+                continue
+            if _has_anchor_center_reference_point(mob):
+                batched.append(i)
+            else:
+                # Assign a number to a three dimensional mobjects
+                # based on how close it is to the camera
+                keys[i] = np.dot(mob.get_z_index_reference_point(), rot_matrix.T)[2]
+        if not batched:
+            return keys
+
+        vmobjects = [mobjects[i] for i in batched]
+        points = np.concatenate([vmob.points for vmob in vmobjects])
+        lengths = np.array([len(vmob.points) for vmob in vmobjects])
+        nppccs = np.array([vmob.n_points_per_cubic_curve for vmob in vmobjects])
+        # The anchors are the first and last points of every curve.
+        point_nppccs = np.repeat(nppccs, lengths)
+        index_in_curve = (
+            np.arange(len(points)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        ) % point_nppccs
+        anchors = points[(index_in_curve == 0) | (index_in_curve == point_nppccs - 1)]
+        num_anchors = 2 * lengths // nppccs
+        anchor_starts = np.cumsum(num_anchors) - num_anchors
+        centers = (
+            np.minimum.reduceat(anchors, anchor_starts)
+            + np.maximum.reduceat(anchors, anchor_starts)
+        ) / 2
+        batched_keys = np.dot(centers, rot_matrix.T)[:, 2]
+        keys[batched] = batched_keys
+        return keys
+
+    def _project_vmobject_points(self, mobjects: list[Mobject]) -> None:
+        """Projects the points of all the :class:`~.VMobject` instances to
+        display at once, for :meth:`transform_points_pre_display`.
+        """
+        vmobjects = [
+            mob
+            for mob in mobjects
+            if isinstance(mob, VMobject)
+            and mob not in self.fixed_in_frame_mobjects
+            and mob not in self.fixed_orientation_mobjects
+        ]
+        self._projected_points = {}
+        if not vmobjects:
+            return
+        points = np.concatenate([vmob.points for vmob in vmobjects])
+        if not np.all(np.isfinite(points)):
+            return
+        projected = self.project_points(points)
+        splits = np.cumsum([len(vmob.points) for vmob in vmobjects])[:-1]
+        for vmob, vmob_points in zip(vmobjects, np.split(projected, splits)):
+            self._projected_points[vmob] = (vmob.points, vmob_points)
 
     def get_phi(self):
         """Returns the Polar angle (the angle off Z_AXIS) phi.
@@ -344,6 +456,9 @@ class ThreeDCamera(Camera):
         mobject,
         points,
     ):  # TODO: Write Docstrings for this Method.
+        projected = self._projected_points.get(mobject)
+        if projected is not None and projected[0] is points:
+            return projected[1]
         points = super().transform_points_pre_display(mobject, points)
         fixed_orientation = mobject in self.fixed_orientation_mobjects
         fixed_in_frame = mobject in self.fixed_in_frame_mobjects
@@ -441,3 +556,23 @@ class ThreeDCamera(Camera):
         for mobject in extract_mobject_family_members(mobjects):
             if mobject in self.fixed_in_frame_mobjects:
                 self.fixed_in_frame_mobjects.remove(mobject)
+
+
+def _has_anchor_center_reference_point(mobject: Mobject) -> bool:
+    """Returns whether the reference point of a mobject for depth sorting is
+    the center of the bounding box of its own anchors, as computed by
+    :meth:`ThreeDCamera.get_depth_keys`.
+    """
+    cls = type(mobject)
+    return (
+        isinstance(mobject, VMobject)
+        and not mobject.submobjects
+        and not hasattr(mobject, "z_index_group")
+        and len(mobject.points) > 0
+        and len(mobject.points) % mobject.n_points_per_cubic_curve == 0
+        and cls.get_z_index_reference_point is Mobject.get_z_index_reference_point
+        and cls.get_center is Mobject.get_center
+        and cls.get_critical_point is Mobject.get_critical_point
+        and cls.get_extremum_along_dim is Mobject.get_extremum_along_dim
+        and cls.get_points_defining_boundary is VMobject.get_points_defining_boundary
+    )
@@ -10,14 +10,21 @@ from __future__ import annotations
 
 import http.client
 import json
+import multiprocessing
+import os
 import sys
+import time
+import traceback
 import urllib.error
 import urllib.request
 from argparse import Namespace
+from dataclasses import dataclass
+from multiprocessing.connection import wait
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 import cloup
+from rich.table import Table
 
 from manim import __version__
 from manim._config import (
@@ -32,8 +39,15 @@ from manim.cli.render.global_options import global_options
 from manim.cli.render.output_options import output_options
 from manim.cli.render.render_options import render_options
 from manim.constants import EPILOG, RendererType
+from manim.utils.file_ops import is_gif_format, write_to_movie
 from manim.utils.module_ops import scene_classes_from_file
 
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
+    from manim.scene.scene import Scene
+
 __all__ = ["render"]
 
 
@@ -57,6 +71,126 @@ class ClickArgs(Namespace):
         return str(self.__dict__)
 
 
+@dataclass
+class SceneRenderResult:
+    """Outcome of rendering a single scene in its own process."""
+
+    scene_name: str
+    succeeded: bool
+    duration: float
+    output_file: str | None = None
+    error: str | None = None
+
+
+def get_output_file(scene: Scene) -> Path | None:
+    """Return the file written for a rendered scene: its movie or GIF, or its
+    last frame when no movie was written.
+    """
+    file_writer = scene.renderer.file_writer
+    if write_to_movie():
+        if is_gif_format():
+            return getattr(file_writer, "gif_file_path", None)
+        return getattr(file_writer, "movie_file_path", None)
+    if config.save_last_frame:
+        return getattr(file_writer, "image_file_path", None)
+    return None
+
+
+def render_scene_in_subprocess(
+    scene_class: type[Scene], connection: Connection
+) -> None:
+    """Render ``scene_class`` and send a :class:`SceneRenderResult` through
+    ``connection``. This is the entry point of the forked processes started by
+    :func:`render_scenes_in_parallel`.
+    """
+    # Progress bars of concurrent scenes would overwrite each other.
+    config.progress_bar = "none"
+    start_time = time.perf_counter()
+    result = SceneRenderResult(scene_class.__name__, False, 0.0)
+    try:
+        with tempconfig({}):
+            scene = scene_class()
+            scene.render()
+            output_file = get_output_file(scene)
+        result.succeeded = True
+        result.output_file = str(output_file) if output_file else None
+    except Exception:
+        error_console.print_exception()
+        result.error = traceback.format_exc().strip().splitlines()[-1]
+    result.duration = time.perf_counter() - start_time
+    connection.send(result)
+    connection.close()
+
+
+def render_scenes_in_parallel(
+    scene_classes: list[type[Scene]],
+) -> list[SceneRenderResult]:
+    """Render every scene in its own forked process, with at most
+    ``config.scene_jobs`` processes running at once.
+
+    Each process writes to the output directories of its scene and, if
+    ``config.log_to_file`` is set, to its own log file.
+
+    Returns
+    -------
+    list[SceneRenderResult]
+        The outcome of each scene, in the order of ``scene_classes``.
+    """
+    context = multiprocessing.get_context("fork")
+    max_processes = config.scene_jobs or os.cpu_count() or 1
+    pending = list(scene_classes)
+    running: dict[int, tuple[BaseProcess, Connection]] = {}
+    results: dict[str, SceneRenderResult] = {}
+
+    while pending or running:
+        while pending and len(running) < max_processes:
+            scene_class = pending.pop(0)
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(
+                target=render_scene_in_subprocess,
+                args=(scene_class, sender),
+                name=scene_class.__name__,
+            )
+            process.start()
+            sender.close()
+            running[process.sentinel] = (process, receiver)
+
+        for sentinel in wait(list(running)):
+            process, receiver = running.pop(cast(int, sentinel))
+            process.join()
+            if receiver.poll():
+                result = receiver.recv()
+            else:
+                # The process died before it could report anything.
+                result = SceneRenderResult(
+                    process.name,
+                    False,
+                    0.0,
+                    error=f"Process exited with code {process.exitcode}",
+                )
+            receiver.close()
+            results[result.scene_name] = result
+
+    return [results[scene_class.__name__] for scene_class in scene_classes]
+
+
+def print_render_summary(results: list[SceneRenderResult]) -> None:
+    """Print a table summarizing the scenes rendered in parallel."""
+    table = Table(title="Rendered scenes")
+    table.add_column("Scene")
+    table.add_column("Status")
+    table.add_column("Time", justify="right")
+    table.add_column("Output")
+    for result in results:
+        table.add_row(
+            result.scene_name,
+            "[green]done[/green]" if result.succeeded else "[red]failed[/red]",
+            f"{result.duration:.1f}s",
+            result.output_file or result.error or "",
+        )
+    console.print(table)
+
+
 @cloup.command(
     context_settings=None,
     no_args_is_help=True,
@@ -118,14 +252,33 @@ def render(**kwargs: Any) -> ClickArgs | dict[str, Any]:
             error_console.print_exception()
             sys.exit(1)
     else:
-        for SceneClass in scene_classes_from_file(file):
-            try:
-                with tempconfig({}):
-                    scene = SceneClass()
-                    scene.render()
-            except Exception:
-                error_console.print_exception()
+        scene_classes = scene_classes_from_file(file)
+        scene_jobs = config.scene_jobs
+        if (
+            scene_jobs != 1
+            and len(scene_classes) > 1
+            and "fork" not in multiprocessing.get_all_start_methods()
+        ):
+            logger.warning(
+                "Rendering scenes in parallel requires forking processes, "
+                "which is not supported on this platform. Rendering serially.",
+            )
+            scene_jobs = 1
+
+        if scene_jobs != 1 and len(scene_classes) > 1:
+            results = render_scenes_in_parallel(scene_classes)
+            print_render_summary(results)
+            if not all(result.succeeded for result in results):
                 sys.exit(1)
+        else:
+            for SceneClass in scene_classes:
+                try:
+                    with tempconfig({}):
+                        scene = SceneClass()
+                        scene.render()
+                except Exception:
+                    error_console.print_exception()
+                    sys.exit(1)
 
     if config.notify_outdated_version:
         manim_info_url = "https://pypi.org/pypi/manim/json"
@@ -80,6 +80,12 @@ global_options = option_group(
         help="Remove cached partial movie files.",
         default=None,
     ),
+    option(
+        "--shared_cache",
+        help="Share partial movie files with other machines through this "
+        "directory or http(s) URL.",
+        default=None,
+    ),
     option("--tex_template", help="Specify a custom TeX template file.", default=None),
     option(
         "-v",
@@ -165,6 +165,28 @@ render_options = option_group(
         default=None,
         help="Render at this frame rate.",
     ),
+    option(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Render the animations of a scene in this many parallel processes. "
+        "Use 0 for one process per CPU core.",
+    ),
+    option(
+        "--scene_jobs",
+        type=int,
+        default=None,
+        help="Render the scenes of the input file in this many parallel processes. "
+        "Use 0 for one process per CPU core.",
+    ),
+    option(
+        "--profile",
+        is_flag=True,
+        default=None,
+        help="Write the time spent in each stage of rendering next to the "
+        "output file, as a Chrome trace.",
+    ),
     option(
         "--renderer",
         type=Choice(
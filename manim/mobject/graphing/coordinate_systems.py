@@ -661,9 +661,10 @@ class CoordinateSystem:
 
 
         .. warning::
-            This method may not produce accurate graphs since Manim currently relies on interpolation between
+            This method may not produce accurate graphs since Manim relies by default on interpolation between
             evenly-spaced samples of the curve, instead of intelligent plotting.
-            See the example below for some solutions to this problem.
+            See the example below for some solutions to this problem, or pass ``use_adaptive_sampling=True``
+            to sample the curve where it bends, within ``sampling_tolerance`` of the graph in scene units.
 
         Examples
         --------
@@ -47,7 +47,17 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
         Values of t at which the function experiences discontinuity.
     dt
         The left and right tolerance for the discontinuities.
-
+    use_adaptive_sampling
+        Whether to adapt the samples of the function to its shape. The function
+        is first sampled with the step of ``t_range``, then intervals are
+        halved where the curve strays from its chords by more than
+        ``sampling_tolerance``, and points are removed where the curve is
+        almost straight. Jumps of the function and values which are not finite
+        start new paths, so they don't need to be listed in ``discontinuities``.
+    sampling_tolerance
+        The largest distance allowed between the samples of the function and
+        the segments joining the remaining points, in scene units. Only used
+        with ``use_adaptive_sampling``.
 
     Examples
     --------
@@ -81,7 +91,8 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
 
     .. attention::
         If your function has discontinuities, you'll have to specify the location
-        of the discontinuities manually. See the following example for guidance.
+        of the discontinuities manually, or use ``use_adaptive_sampling=True``.
+        See the following example for guidance.
 
     .. manim:: DiscontinuousExample
         :save_last_frame:
@@ -100,6 +111,20 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
                     color=GREEN,
                 )
                 self.add(ax1, ax2, incorrect, correct)
+
+    .. manim:: AdaptiveSamplingExample
+        :save_last_frame:
+
+        class AdaptiveSamplingExample(Scene):
+            def construct(self):
+                ax = Axes(x_range=(-8, 8), y_range=(-2, 2))
+                graph = ax.plot(
+                    lambda x: np.sin(x**2) + np.floor(x / 4),
+                    use_vectorized=True,
+                    use_adaptive_sampling=True,
+                    color=BLUE,
+                )
+                self.add(ax, graph)
     """
 
     def __init__(
@@ -111,6 +136,8 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
         discontinuities: Iterable[float] | None = None,
         use_smoothing: bool = True,
         use_vectorized: bool = False,
+        use_adaptive_sampling: bool = False,
+        sampling_tolerance: float = 0.001,
         **kwargs,
     ):
         def internal_parametric_function(t: float) -> Point3D:
@@ -127,6 +154,8 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
         self.discontinuities = discontinuities
         self.use_smoothing = use_smoothing
         self.use_vectorized = use_vectorized
+        self.use_adaptive_sampling = use_adaptive_sampling
+        self.sampling_tolerance = sampling_tolerance
         self.t_min, self.t_max, self.t_step = t_range
 
         super().__init__(**kwargs)
@@ -157,28 +186,38 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
             boundary_times = [self.t_min, self.t_max]
 
         for t1, t2 in zip(boundary_times[0::2], boundary_times[1::2]):
-            t_range = np.array(
-                [
-                    *self.scaling.function(np.arange(t1, t2, self.t_step)),
-                    self.scaling.function(t2),
-                ],
-            )
-
-            if self.use_vectorized:
-                x, y, z = self.function(t_range)
-                if not isinstance(z, np.ndarray):
-                    z = np.zeros_like(x)
-                points = np.stack([x, y, z], axis=1)
+            if self.use_adaptive_sampling:
+                paths = _sample_adaptively(
+                    lambda t: self._get_points_at(self.scaling.function(t)),
+                    np.append(np.arange(t1, t2, self.t_step), t2),
+                    self.sampling_tolerance,
+                )
             else:
-                points = np.array([self.function(t) for t in t_range])
+                t_range = np.array(
+                    [
+                        *self.scaling.function(np.arange(t1, t2, self.t_step)),
+                        self.scaling.function(t2),
+                    ],
+                )
+                paths = [self._get_points_at(t_range)]
 
-            self.start_new_path(points[0])
-            self.add_points_as_corners(points[1:])
+            for points in paths:
+                self.start_new_path(points[0])
+                self.add_points_as_corners(points[1:])
         if self.use_smoothing:
             # TODO: not in line with upstream, approx_smooth does not exist
             self.make_smooth()
         return self
 
+    def _get_points_at(self, t_values: np.ndarray) -> np.ndarray:
+        """Returns the points of the function at each of the ``t_values``."""
+        if self.use_vectorized:
+            x, y, z = self.function(t_values)
+            if not isinstance(z, np.ndarray):
+                z = np.zeros_like(x)
+            return np.stack([x, y, z], axis=1)
+        return np.array([self.function(t) for t in t_values])
+
     init_points = generate_points
 
 
@@ -318,3 +357,149 @@ class ImplicitFunction(VMobject, metaclass=ConvertToOpenGL):
         return self
 
     init_points = generate_points
+
+
+def _distances_to_segments(
+    points: np.ndarray, starts: np.ndarray, ends: np.ndarray
+) -> np.ndarray:
+    """Returns the distance of each point to the segment from the start to the
+    end of the same index.
+    """
+    chords = ends - starts
+    lengths_squared = np.einsum("ij,ij->i", chords, chords)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        alphas = np.einsum("ij,ij->i", points - starts, chords) / lengths_squared
+    alphas = np.clip(np.nan_to_num(alphas), 0, 1)
+    return np.linalg.norm(points - starts - alphas[:, None] * chords, axis=1)
+
+
+def _sample_adaptively(
+    get_points: Callable[[np.ndarray], np.ndarray],
+    t_values: np.ndarray,
+    tolerance: float,
+    max_depth: int = 10,
+    jump_ratio: float = 0.95,
+) -> list[np.ndarray]:
+    """Samples a curve so that it doesn't stray from the polyline joining the
+    samples by more than ``tolerance``.
+
+    Every round of refinement evaluates the curve at the midpoints of all the
+    intervals which are not yet precise enough in one call of ``get_points``.
+    An interval still halved in the last round, with one half spanning almost
+    all of its chord, contains a jump of the curve. The curve is split there
+    and at its values which are not finite.
+
+    Parameters
+    ----------
+    get_points
+        Returns the points of the curve at an array of parameters.
+    t_values
+        The initial parameters, in increasing order.
+    tolerance
+        The largest distance allowed between the samples and the polyline.
+    max_depth
+        The number of times an interval of ``t_values`` can be halved.
+    jump_ratio
+        The fraction of the chord of an interval which one of its halves must
+        span for the interval to contain a jump.
+
+    Returns
+    -------
+    list[np.ndarray]
+        The points of each continuous path of the curve.
+    """
+    t_values = np.asarray(t_values, dtype=float)
+    points = np.asarray(get_points(t_values), dtype=float)
+    finite = np.isfinite(points).all(axis=1)
+    active = np.ones(len(t_values) - 1, dtype=bool)
+    jumps = np.zeros(len(t_values) - 1, dtype=bool)
+    # The distance from the sample taken in each interval to its chord.
+    interval_errors = np.zeros(len(t_values) - 1)
+    for depth in range(max_depth):
+        # Intervals without any finite value are not refined.
+        active &= finite[:-1] | finite[1:]
+        indices = np.flatnonzero(active)
+        if len(indices) == 0:
+            break
+        mid_t_values = (t_values[indices] + t_values[indices + 1]) / 2
+        mid_points = np.asarray(get_points(mid_t_values), dtype=float)
+        mid_finite = np.isfinite(mid_points).all(axis=1)
+        starts, ends = points[indices], points[indices + 1]
+        with np.errstate(invalid="ignore"):
+            errors = _distances_to_segments(mid_points, starts, ends)
+        errors[~mid_finite] = np.inf
+        both_finite = finite[indices] & finite[indices + 1]
+        split = (both_finite & (errors > tolerance)) | (
+            finite[indices] != finite[indices + 1]
+        )
+        split_indices = indices[split]
+        interval_errors[indices[~split]] = errors[~split]
+        interval_errors[split_indices] = 0
+
+        active = np.zeros_like(active)
+        active[split_indices] = True
+        active = np.insert(active, split_indices + 1, True)
+        jumps = np.insert(jumps, split_indices + 1, False)
+        interval_errors = np.insert(interval_errors, split_indices + 1, 0)
+        t_values = np.insert(t_values, split_indices + 1, mid_t_values[split])
+        points = np.insert(points, split_indices + 1, mid_points[split], axis=0)
+        finite = np.insert(finite, split_indices + 1, mid_finite[split])
+
+        if depth == max_depth - 1:
+            with np.errstate(invalid="ignore"):
+                chords = np.linalg.norm(ends - starts, axis=1)[split]
+                left_halves = np.linalg.norm(mid_points - starts, axis=1)[split]
+                right_halves = np.linalg.norm(ends - mid_points, axis=1)[split]
+            is_jump = (both_finite & mid_finite)[split] & (
+                np.maximum(left_halves, right_halves) > jump_ratio * chords
+            )
+            # The jump is in the longer half of the interval.
+            halves = (
+                split_indices
+                + np.arange(len(split_indices))
+                + (right_halves > left_halves)
+            )
+            jumps[halves[is_jump]] = True
+
+    # A new path starts after every jump and around the values which are not
+    # finite, which are left out.
+    cuts = jumps | ~finite[:-1] | ~finite[1:]
+    paths = np.split(np.arange(len(points)), np.flatnonzero(cuts) + 1)
+    return [
+        _remove_redundant_points(points[path], tolerance, interval_errors[path[:-1]])
+        for path in paths
+        if len(path) > 1
+    ]
+
+
+def _remove_redundant_points(
+    points: np.ndarray, tolerance: float, errors: np.ndarray
+) -> np.ndarray:
+    """Removes points from a polyline while all the removed points stay within
+    ``tolerance`` of the new polyline.
+
+    Every round considers every other point of the polyline, so that the
+    points removed in the same round are not neighbours. The error of each
+    segment bounds the distance from the points removed within it, and from
+    the samples left out of the polyline, whose initial ``errors`` are given
+    for every segment.
+    """
+    errors = np.array(errors, dtype=float)
+    first = 1
+    stalled_rounds = 0
+    while stalled_rounds < 2 and len(points) > 2:
+        candidates = np.arange(first, len(points) - 1, 2)
+        first = 3 - first
+        distances = _distances_to_segments(
+            points[candidates], points[candidates - 1], points[candidates + 1]
+        )
+        bounds = np.maximum(errors[candidates - 1], errors[candidates]) + distances
+        removed = candidates[bounds <= tolerance]
+        if len(removed) == 0:
+            stalled_rounds += 1
+            continue
+        stalled_rounds = 0
+        errors[removed - 1] = bounds[bounds <= tolerance]
+        errors = np.delete(errors, removed)
+        points = np.delete(points, removed, axis=0)
+    return points
@@ -27,6 +27,7 @@ from manim.mobject.types.vectorized_mobject import VGroup, VMobject
 from manim.utils.bezier import interpolate
 from manim.utils.config_ops import merge_dicts_recursively
 from manim.utils.space_ops import normalize
+from manim.utils.tex_file_writing import map_with_batched_tex
 
 
 class NumberLine(Line):
@@ -532,18 +533,17 @@ class NumberLine(Line):
         if label_constructor is None:
             label_constructor = self.label_constructor
 
-        numbers = VGroup()
-        for x in x_values:
-            if x in excluding:
-                continue
-            numbers.add(
-                self.get_number_mobject(
+        numbers = VGroup(
+            *map_with_batched_tex(
+                lambda x: self.get_number_mobject(
                     x,
                     font_size=font_size,
                     label_constructor=label_constructor,
                     **kwargs,
-                )
+                ),
+                [x for x in x_values if x not in excluding],
             )
+        )
         self.add(numbers)
         self.numbers = numbers
         return self
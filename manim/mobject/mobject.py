@@ -14,6 +14,7 @@ import random
 import sys
 import types
 import warnings
+import weakref
 from collections.abc import Iterable
 from functools import partialmethod, reduce
 from pathlib import Path
@@ -85,6 +86,14 @@ class Mobject:
 
     animation_overrides = {}
 
+    # The mobjects having self as a submobject, and what is cached about the
+    # family of self: the family itself, whether it has updaters, the
+    # dependencies of these updaters and the submobjects whose family has
+    # updaters. See _invalidate_family_info().
+    _parents: weakref.WeakSet[Mobject] | None = None
+    _family: list[Mobject] | None = None
+    _family_updater_info: tuple[bool, list[Mobject], list[Mobject]] | None = None
+
     @classmethod
     def __init_subclass__(cls, **kwargs) -> None:
         super().__init_subclass__(**kwargs)
@@ -110,7 +119,9 @@ class Mobject:
         self.z_index = z_index
         self.point_hash = None
         self.submobjects = []
-        self.updaters: list[Updater] = []
+        self.updaters = []
+        # The mobjects passed as depends_on to add_updater, by updater.
+        self.updater_dependencies: dict[Updater, list[Mobject]] = {}
         self.updating_suspended = False
         self.color = ManimColor.parse(color)
 
@@ -118,6 +129,80 @@ class Mobject:
         self.generate_points()
         self.init_colors()
 
+    @property
+    def submobjects(self) -> list[Mobject]:
+        """The contained mobjects."""
+        return self._submobjects
+
+    @submobjects.setter
+    def submobjects(self, submobjects: Iterable[Mobject]) -> None:
+        self._submobjects = _SubmobjectList(self, submobjects)
+        self._invalidate_family_info()
+
+    @property
+    def updaters(self) -> list[Updater]:
+        """The update functions of this mobject, see :meth:`add_updater`."""
+        return self._updaters
+
+    @updaters.setter
+    def updaters(self, updaters: Iterable[Updater]) -> None:
+        self._updaters = _FamilyTrackingList(self, updaters)
+        self._invalidate_family_info()
+
+    def _add_parent(self, parent: Mobject) -> None:
+        if self._parents is None:
+            self._parents = weakref.WeakSet()
+        self._parents.add(parent)
+
+    def _invalidate_family_info(self) -> None:
+        """Discard what is cached about the family of this mobject and of its
+        ancestors.
+
+        This is called whenever the submobjects or the updaters of the mobject
+        change. Computing a cached value of a mobject computes that of all its
+        descendants, so the propagation can stop at the first ancestor whose
+        caches are already empty. Parents from which the mobject has been
+        removed since are not forgotten, which only discards their caches
+        needlessly.
+        """
+        if self._family is None and self._family_updater_info is None:
+            return
+        self._family = None
+        self._family_updater_info = None
+        if self._parents:
+            for parent in self._parents:
+                parent._invalidate_family_info()
+
+    def _get_family_updater_info(
+        self,
+    ) -> tuple[bool, list[Mobject], list[Mobject]]:
+        if self._family_updater_info is None:
+            infos = [submob._get_family_updater_info() for submob in self.submobjects]
+            submobjects_to_update = [
+                submob for submob, info in zip(self.submobjects, infos) if info[0]
+            ]
+            has_updaters = (
+                bool(self.updaters)
+                or type(self).update is not Mobject.update
+                or bool(submobjects_to_update)
+            )
+            dependencies = list(
+                it.chain(
+                    *(
+                        mobjects
+                        for updater, mobjects in self.updater_dependencies.items()
+                        if updater in self.updaters
+                    ),
+                    *(info[1] for info in infos),
+                )
+            )
+            self._family_updater_info = (
+                has_updaters,
+                dependencies,
+                submobjects_to_update,
+            )
+        return self._family_updater_info
+
     def _assert_valid_submobjects(self, submobjects: Iterable[Mobject]) -> Self:
         """Check that all submobjects are actually instances of
         :class:`Mobject`, and that none of them is ``self`` (a
@@ -394,11 +479,54 @@ class Mobject:
         """
         return _AnimationBuilder(self)
 
+    # The attributes which only hold caches, and aren't copied or pickled.
+    _uncopied_attributes = (
+        "_parents",
+        "_family",
+        "_family_updater_info",
+        "_point_buffer",
+    )
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        for k in self._uncopied_attributes:
+            state.pop(k, None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Shallow copies and unpickled mobjects get their own tracking lists,
+        # which notify them instead of the original mobject.
+        state = state.copy()
+        submobjects = state.pop("_submobjects", None)
+        updaters = state.pop("_updaters", None)
+        if "updater_dependencies" in state:
+            state["updater_dependencies"] = {
+                updater: list(mobjects)
+                for updater, mobjects in state["updater_dependencies"].items()
+            }
+        self.__dict__.update(state)
+        if submobjects is not None:
+            self.submobjects = submobjects
+        if updaters is not None:
+            self.updaters = updaters
+
     def __deepcopy__(self, clone_from_id) -> Self:
         cls = self.__class__
         result = cls.__new__(cls)
         clone_from_id[id(self)] = result
         for k, v in self.__dict__.items():
+            if k in self._uncopied_attributes:
+                continue
+            if k == "updater_dependencies":
+                # The mobjects depended on are not part of the copy.
+                result.updater_dependencies = {
+                    updater: [clone_from_id.get(id(mob), mob) for mob in mobjects]
+                    for updater, mobjects in v.items()
+                }
+                continue
+            if k in ("_submobjects", "_updaters"):
+                # Assign the copied plain lists through the properties.
+                k = k[1:]
             setattr(result, k, copy.deepcopy(v, clone_from_id))
         result.original_id = str(id(self))
         return result
@@ -896,12 +1024,13 @@ class Mobject:
         if self.updating_suspended:
             return self
         for updater in self.updaters:
-            if "dt" in inspect.signature(updater).parameters:
+            if _updater_uses_dt(updater):
                 updater(self, dt)
             else:
                 updater(self)
         if recursive:
-            for submob in self.submobjects:
+            # Subtrees without any updater are skipped.
+            for submob in self._get_family_updater_info()[2]:
                 submob.update(dt, recursive)
         return self
 
@@ -921,11 +1050,7 @@ class Mobject:
         :meth:`has_time_based_updater`
 
         """
-        return [
-            updater
-            for updater in self.updaters
-            if "dt" in inspect.signature(updater).parameters
-        ]
+        return [updater for updater in self.updaters if _updater_uses_dt(updater)]
 
     def has_time_based_updater(self) -> bool:
         """Test if ``self`` has a time based updater.
@@ -941,9 +1066,7 @@ class Mobject:
         :meth:`get_time_based_updaters`
 
         """
-        return any(
-            "dt" in inspect.signature(updater).parameters for updater in self.updaters
-        )
+        return any(_updater_uses_dt(updater) for updater in self.updaters)
 
     def get_updaters(self) -> list[Updater]:
         """Return all updaters.
@@ -964,11 +1087,46 @@ class Mobject:
     def get_family_updaters(self) -> list[Updater]:
         return list(it.chain(*(sm.get_updaters() for sm in self.get_family())))
 
+    def has_family_updaters(self) -> bool:
+        """Test if ``self`` or any of its submobjects, recursively, has
+        updaters.
+
+        The answer is cached until updaters or submobjects are added to or
+        removed from the family, so that the mobjects without updaters can
+        be skipped cheaply in every frame.
+
+        Returns
+        -------
+        :class:`bool`
+            ``True`` if a member of the family has updaters, ``False``
+            otherwise.
+
+        See Also
+        --------
+        :meth:`get_family_updaters`
+
+        """
+        return self._get_family_updater_info()[0]
+
+    def get_family_updater_dependencies(self) -> list[Mobject]:
+        """Return the mobjects which the updaters of ``self`` and of its
+        submobjects, recursively, depend on.
+
+        Returns
+        -------
+        List[:class:`Mobject`]
+            The mobjects passed as ``depends_on`` to :meth:`add_updater` in
+            the family of ``self``.
+
+        """
+        return self._get_family_updater_info()[1]
+
     def add_updater(
         self,
         update_function: Updater,
         index: int | None = None,
         call_updater: bool = False,
+        depends_on: Iterable[Mobject] = (),
     ) -> Self:
         """Add an update function to this mobject.
 
@@ -990,6 +1148,11 @@ class Mobject:
         call_updater
             Whether or not to call the updater initially. If ``True``, the updater will
             be called using ``dt=0``.
+        depends_on
+            Mobjects whose updaters have to run before this update function in every
+            frame, for instance the mobject which the updater moves ``self`` next to.
+            The :class:`~.Scene` updates the mobjects it contains in an order
+            respecting these dependencies.
 
         Returns
         -------
@@ -1024,6 +1187,20 @@ class Mobject:
                     self.add(square)
                     self.wait(2)
 
+        .. manim:: DependentUpdaters
+
+            class DependentUpdaters(Scene):
+                def construct(self):
+                    dot = Dot()
+                    label = Text("dot").add_updater(
+                        lambda mobject: mobject.next_to(dot, UP), depends_on=[dot]
+                    )
+                    # The label is added first, but always follows the dot
+                    # once it has moved in the current frame.
+                    self.add(label, dot)
+                    dot.add_updater(lambda mobject, dt: mobject.shift(dt * RIGHT))
+                    self.wait(2)
+
         See also
         --------
         :meth:`get_updaters`
@@ -1033,13 +1210,16 @@ class Mobject:
         :meth:`rotate`
         :attr:`~.Mobject.animate`
         """
+        # Inspect the signature once, instead of in every frame.
+        uses_dt = _updater_uses_dt(update_function)
+        if depends_on:
+            self.updater_dependencies.setdefault(update_function, []).extend(depends_on)
         if index is None:
             self.updaters.append(update_function)
         else:
             self.updaters.insert(index, update_function)
         if call_updater:
-            parameters = inspect.signature(update_function).parameters
-            if "dt" in parameters:
+            if uses_dt:
                 update_function(self, 0)
             else:
                 update_function(self)
@@ -1068,6 +1248,7 @@ class Mobject:
         :meth:`get_updaters`
 
         """
+        self.updater_dependencies.pop(update_function, None)
         while update_function in self.updaters:
             self.updaters.remove(update_function)
         return self
@@ -1092,6 +1273,7 @@ class Mobject:
         :meth:`get_updaters`
 
         """
+        self.updater_dependencies = {}
         self.updaters = []
         if recursive:
             for submob in self.submobjects:
@@ -1123,6 +1305,10 @@ class Mobject:
 
         """
         self.clear_updaters()
+        self.updater_dependencies = {
+            updater: list(mobjects)
+            for updater, mobjects in mobject.updater_dependencies.items()
+        }
         for updater in mobject.get_updaters():
             self.add_updater(updater)
         return self
@@ -2380,7 +2566,8 @@ class Mobject:
         Returns
         -------
         list[Mobject]
-            A list of mobjects in the family of the given mobject.
+            A list of mobjects in the family of the given mobject. The list is
+            cached until the hierarchy changes and must not be modified.
 
         Examples
         --------
@@ -2398,9 +2585,11 @@ class Mobject:
         :meth:`~.Mobject.family_members_with_points`, :meth:`~.Mobject.align_data`
 
         """
-        sub_families = [x.get_family() for x in self.submobjects]
-        all_mobjects = [self] + list(it.chain(*sub_families))
-        return remove_list_redundancies(all_mobjects)
+        if self._family is None:
+            sub_families = [x.get_family() for x in self.submobjects]
+            all_mobjects = [self] + list(it.chain(*sub_families))
+            self._family = remove_list_redundancies(all_mobjects)
+        return self._family
 
     def family_members_with_points(self) -> list[Self]:
         """Filters the list of family members (generated by :meth:`.get_family`) to include only mobjects with points.
@@ -3349,3 +3538,123 @@ def override_animate(method) -> types.FunctionType:
         return animation_method
 
     return decorator
+
+
+_updater_uses_dt_cache: weakref.WeakKeyDictionary[Updater, bool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _updater_uses_dt(updater: Updater) -> bool:
+    """Return whether ``updater`` takes the parameter ``dt``.
+
+    Inspecting the signature of every updater on every frame is costly, hence
+    the answer is computed once per updater.
+    """
+    try:
+        return _updater_uses_dt_cache[updater]
+    except KeyError:
+        pass
+    except TypeError:
+        # The updater cannot be referenced weakly.
+        return "dt" in inspect.signature(updater).parameters
+    uses_dt = "dt" in inspect.signature(updater).parameters
+    _updater_uses_dt_cache[updater] = uses_dt
+    return uses_dt
+
+
+class _FamilyTrackingList(list):
+    """A list owned by a mobject, whose modifications discard what the
+    mobject and its ancestors cache about their family.
+    """
+
+    __slots__ = ("mobject",)
+
+    def __init__(self, mobject: Mobject, items: Iterable = ()) -> None:
+        super().__init__(items)
+        self.mobject = mobject
+        self._added(self)
+
+    def __reduce_ex__(self, protocol):
+        # Copies are plain lists, which get wrapped again once they are
+        # assigned to a mobject.
+        return list, (list(self),)
+
+    def _added(self, items: Iterable) -> None:
+        pass
+
+    def _changed(self) -> None:
+        self.mobject._invalidate_family_info()
+
+    def append(self, item) -> None:
+        super().append(item)
+        self._added((item,))
+        self._changed()
+
+    def extend(self, items: Iterable) -> None:
+        items = list(items)
+        super().extend(items)
+        self._added(items)
+        self._changed()
+
+    def insert(self, index, item) -> None:
+        super().insert(index, item)
+        self._added((item,))
+        self._changed()
+
+    def remove(self, item) -> None:
+        super().remove(item)
+        self._changed()
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._changed()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def sort(self, *, key=None, reverse=False) -> None:
+        super().sort(key=key, reverse=reverse)
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+            super().__setitem__(index, value)
+            self._added(value)
+        else:
+            super().__setitem__(index, value)
+            self._added((value,))
+        self._changed()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, items: Iterable) -> Self:
+        self.extend(items)
+        return self
+
+    def __imul__(self, n: int) -> Self:
+        super().__imul__(n)
+        self._changed()
+        return self
+
+
+class _SubmobjectList(_FamilyTrackingList):
+    """The :attr:`~.Mobject.submobjects` of a mobject, which also records the
+    mobject as a parent of the submobjects added to it.
+    """
+
+    __slots__ = ()
+
+    def _added(self, items: Iterable) -> None:
+        for submob in items:
+            if isinstance(submob, Mobject):
+                submob._add_parent(self.mobject)
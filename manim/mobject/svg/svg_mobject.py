@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 from pathlib import Path
 from xml.etree import ElementTree as ET
@@ -11,7 +12,7 @@ import svgelements as se
 
 from manim import config, logger
 
-from ...constants import RIGHT
+from ...constants import RIGHT, RendererType
 from ...utils.bezier import get_quadratic_approximation_of_cubic
 from ...utils.images import get_full_vector_image_path
 from ...utils.iterables import hash_obj
@@ -25,6 +26,19 @@ __all__ = ["SVGMobject", "VMobjectFromSVGPath"]
 
 
 SVG_HASH_TO_MOB_MAP: dict[int, VMobject] = {}
+"""The mobjects generated from SVG files in this process, from the least to
+the most recently used."""
+
+#: Maximal total size in bytes of the point and color arrays of the mobjects
+#: kept in ``SVG_HASH_TO_MOB_MAP``. The least recently used ones are dropped
+#: beyond it.
+SVG_CACHE_MAX_MEMORY_BYTES = 128 * 1024 * 1024
+
+# Bump when the points generated from SVG files change, to invalidate the
+# files of the svg_cache_dir.
+_SVG_CACHE_VERSION = 1
+
+_svg_cache_memory_sizes: dict[int, int] = {}
 
 
 def _convert_point_to_3d(x: float, y: float) -> np.ndarray:
@@ -157,20 +171,61 @@ class SVGMobject(VMobject, metaclass=ConvertToOpenGL):
         """Checks whether the SVG has already been imported and
         generates it if not.
 
+        Imported SVGs are kept in memory in ``SVG_HASH_TO_MOB_MAP`` and, with
+        the Cairo renderer, on disk in ``config.svg_cache_dir`` so that later
+        runs do not parse them again.
+
         See also
         --------
         :meth:`.SVGMobject.generate_mobject`
         """
-        if use_svg_cache:
-            hash_val = hash_obj(self.hash_seed)
-            if hash_val in SVG_HASH_TO_MOB_MAP:
-                mob = SVG_HASH_TO_MOB_MAP[hash_val].copy()
-                self.add(*mob)
-                return
-
-        self.generate_mobject()
-        if use_svg_cache:
-            SVG_HASH_TO_MOB_MAP[hash_val] = self.copy()
+        if not use_svg_cache:
+            self.generate_mobject()
+            return
+
+        hash_val = hash_obj(self.hash_seed)
+        if hash_val in SVG_HASH_TO_MOB_MAP:
+            # Move the mobject to the end, as the most recently used.
+            SVG_HASH_TO_MOB_MAP[hash_val] = SVG_HASH_TO_MOB_MAP.pop(hash_val)
+            mob = SVG_HASH_TO_MOB_MAP[hash_val].copy()
+            self.add(*mob)
+            return
+
+        cache_file = self._get_svg_cache_file()
+        if cache_file is not None and cache_file.exists():
+            self.add(*_load_svg_cache_file(cache_file))
+        else:
+            self.generate_mobject()
+            if cache_file is not None:
+                _save_svg_cache_file(cache_file, self.submobjects)
+        _remember_svg_mobject(hash_val, self.copy())
+
+    def _get_svg_cache_file(self) -> Path | None:
+        """Returns the file of ``config.svg_cache_dir`` storing the mobject
+        generated from the SVG, or ``None`` if it cannot be stored on disk.
+        """
+        if (
+            config.renderer != RendererType.CAIRO
+            or type(self).generate_mobject is not SVGMobject.generate_mobject
+            or type(self).get_mobjects_from is not SVGMobject.get_mobjects_from
+        ):
+            return None
+        svg_cache_dir = config.get_dir("svg_cache_dir")
+        if svg_cache_dir is None:
+            return None
+        hasher = hashlib.sha256()
+        hasher.update(
+            repr(
+                (
+                    _SVG_CACHE_VERSION,
+                    self.__class__.__name__,
+                    self.svg_default,
+                    self.path_string_config,
+                )
+            ).encode()
+        )
+        hasher.update(self.get_file_path().read_bytes())
+        return svg_cache_dir / f"{hasher.hexdigest()[:32]}.npz"
 
     @property
     def hash_seed(self) -> tuple:
@@ -447,6 +502,114 @@ class SVGMobject(VMobject, metaclass=ConvertToOpenGL):
             self.set(width=self.svg_width)
 
 
+def _remember_svg_mobject(hash_val: int, mob: VMobject) -> None:
+    """Adds ``mob`` to ``SVG_HASH_TO_MOB_MAP`` and drops the least recently
+    used mobjects beyond :data:`SVG_CACHE_MAX_MEMORY_BYTES`.
+    """
+    SVG_HASH_TO_MOB_MAP[hash_val] = mob
+    _svg_cache_memory_sizes[hash_val] = sum(
+        sum(
+            array.nbytes
+            for array in (
+                sub.points,
+                getattr(sub, "fill_rgbas", None),
+                getattr(sub, "stroke_rgbas", None),
+                getattr(sub, "background_stroke_rgbas", None),
+            )
+            if isinstance(array, np.ndarray)
+        )
+        for sub in mob.get_family()
+    )
+    # Mobjects dropped from the map by clearing it directly are forgotten.
+    for key in set(_svg_cache_memory_sizes) - set(SVG_HASH_TO_MOB_MAP):
+        del _svg_cache_memory_sizes[key]
+    total = sum(_svg_cache_memory_sizes.values())
+    for key in list(SVG_HASH_TO_MOB_MAP):
+        if total <= SVG_CACHE_MAX_MEMORY_BYTES or key == hash_val:
+            break
+        del SVG_HASH_TO_MOB_MAP[key]
+        total -= _svg_cache_memory_sizes.pop(key, 0)
+
+
+def _save_svg_cache_file(cache_file: Path, mobjects: list[VMobject]) -> None:
+    """Stores the points and styles of the mobjects generated from an SVG in
+    ``cache_file``, then evicts the least recently used files of its directory
+    beyond ``config.max_svg_cache_bytes``.
+
+    Nothing is stored if the mobjects cannot be restored from their arrays,
+    e.g. if they have submobjects or are circles from ``<circle>`` elements.
+    """
+    if not all(
+        type(mob) in (VMobject, VMobjectFromSVGPath) and not mob.submobjects
+        for mob in mobjects
+    ):
+        return
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+    def get_opacities(name: str) -> np.ndarray:
+        opacities = [getattr(mob, name) for mob in mobjects]
+        return np.array([np.nan if o is None else o for o in opacities], dtype=float)
+
+    arrays = {
+        "is_path": np.array([type(mob) is VMobjectFromSVGPath for mob in mobjects]),
+        "stroke_widths": np.array([mob.stroke_width for mob in mobjects], dtype=float),
+        "fill_opacities": get_opacities("fill_opacity"),
+        "stroke_opacities": get_opacities("stroke_opacity"),
+    }
+    for name, width in (("points", 3), ("fill_rgbas", 4), ("stroke_rgbas", 4)):
+        parts = [getattr(mob, name).reshape(-1, width) for mob in mobjects]
+        arrays[name] = np.concatenate([np.zeros((0, width)), *parts])
+        arrays[f"num_{name}"] = np.array([len(part) for part in parts], dtype=int)
+    # Write to a temporary file first, so that concurrent renders never read
+    # a partially written file.
+    temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    with temp_file.open("wb") as f:
+        np.savez(f, **arrays)
+    temp_file.replace(cache_file)
+
+    max_bytes = config.max_svg_cache_bytes
+    if max_bytes < 0:
+        return
+    cached = []
+    for file in cache_file.parent.glob("*.npz"):
+        try:
+            stat = file.stat()
+        except FileNotFoundError:
+            continue
+        cached.append((stat.st_mtime, stat.st_size, file))
+    total = sum(size for _, size, _ in cached)
+    for _, size, file in sorted(cached):
+        if total <= max_bytes:
+            break
+        if file != cache_file:
+            file.unlink(missing_ok=True)
+            total -= size
+
+
+def _load_svg_cache_file(cache_file: Path) -> list[VMobject]:
+    """Restores the mobjects stored by :func:`_save_svg_cache_file`, and marks
+    ``cache_file`` as recently used.
+    """
+    with np.load(cache_file) as data:
+        arrays = {name: data[name] for name in data.files}
+    os.utime(cache_file)
+    split_arrays = {
+        name: np.split(arrays[name], np.cumsum(arrays[f"num_{name}"])[:-1])
+        for name in ("points", "fill_rgbas", "stroke_rgbas")
+    }
+    result = []
+    for i, is_path in enumerate(arrays["is_path"]):
+        mob = VMobjectFromSVGPath(se.Path()) if is_path else VMobject()
+        for name, parts in split_arrays.items():
+            setattr(mob, name, parts[i])
+        mob.stroke_width = float(arrays["stroke_widths"][i])
+        for name in ("fill_opacity", "stroke_opacity"):
+            opacity = arrays[f"{name}s"][i]
+            setattr(mob, name, None if np.isnan(opacity) else float(opacity))
+        result.append(mob)
+    return result
+
+
 class VMobjectFromSVGPath(VMobject, metaclass=ConvertToOpenGL):
     """A vectorized mobject representing an SVG path.
 
@@ -493,8 +656,6 @@ class VMobjectFromSVGPath(VMobject, metaclass=ConvertToOpenGL):
         super().__init__(**kwargs)
 
     def init_points(self) -> None:
-        # TODO: cache mobject in a re-importable way
-
         self.handle_commands()
 
         if config.renderer == "opengl":
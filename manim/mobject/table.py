@@ -81,6 +81,7 @@ from ..animation.creation import Create, Write
 from ..animation.fading import FadeIn
 from ..mobject.types.vectorized_mobject import VGroup, VMobject
 from ..utils.color import BLACK, YELLOW, ManimColor, ParsableManimColor
+from ..utils.tex_file_writing import map_with_batched_tex
 from .utils import get_vectorized_mobject_class
 
 
@@ -267,13 +268,17 @@ class Table(VGroup):
         List
             List of :class:`~.VMobject` from the entries of ``table``.
         """
-        return [
-            [
-                self.element_to_mobject(item, **self.element_to_mobject_config)
-                for item in row
-            ]
-            for row in table
-        ]
+        table = [list(row) for row in table]
+        # The TeX expressions of all the entries are compiled together.
+        mobs = iter(
+            map_with_batched_tex(
+                lambda item: self.element_to_mobject(
+                    item, **self.element_to_mobject_config
+                ),
+                it.chain.from_iterable(table),
+            )
+        )
+        return [[next(mobs) for _ in row] for row in table]
 
     def _organize_mob_table(self, table: Iterable[Iterable[VMobject]]) -> VGroup:
         """Arranges the :class:`~.VMobject` of ``table`` in a grid.
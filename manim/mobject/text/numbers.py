@@ -17,7 +17,9 @@ from manim.mobject.text.text_mobject import Text
 from manim.mobject.types.vectorized_mobject import VMobject
 from manim.mobject.value_tracker import ValueTracker
 
-string_to_mob_map = {}
+# Templates of the glyphs of numbers, keyed by their string, class, font size,
+# TeX template and keyword arguments.
+string_to_mob_map: dict[tuple, VMobject] = {}
 
 __all__ = ["DecimalNumber", "Integer", "Variable"]
 
@@ -158,6 +160,7 @@ class DecimalNumber(VMobject, metaclass=ConvertToOpenGL):
         self.submobjects = []
 
         num_string = self._get_num_string(number)
+        self._num_string = num_string
         self.add(*(map(self._string_to_mob, num_string)))
 
         # Add non-numerical bits
@@ -216,14 +219,139 @@ class DecimalNumber(VMobject, metaclass=ConvertToOpenGL):
         return num_string
 
     def _string_to_mob(self, string: str, mob_class: VMobject | None = None, **kwargs):
+        return self._get_glyph_template(string, mob_class, **kwargs).copy()
+
+    def _get_glyph_template(
+        self, string: str, mob_class: VMobject | None = None, **kwargs
+    ) -> VMobject:
+        """Returns the cached mobject of ``string`` at the font size of the
+        number, which must be copied before being modified.
+        """
         if mob_class is None:
             mob_class = self.mob_class
+        key = (
+            string,
+            mob_class,
+            self._font_size,
+            config.tex_template.body,
+            repr(sorted(kwargs.items())),
+        )
+        if key not in string_to_mob_map:
+            mob = mob_class(string, **kwargs)
+            mob.font_size = self._font_size
+            string_to_mob_map[key] = mob
+        return string_to_mob_map[key]
+
+    def _get_glyph_templates(self, num_string: str) -> list[VMobject]:
+        """Returns the templates of the submobjects of the number displaying
+        ``num_string``, as added by :meth:`_set_submobjects_from_number`.
+        """
+        templates = [self._get_glyph_template(char) for char in num_string]
+        if self.show_ellipsis:
+            templates.append(
+                self._get_glyph_template(
+                    "\\dots", SingleStringMathTex, color=self.color
+                )
+            )
+        if self.unit is not None:
+            templates.append(self._get_glyph_template(self.unit, SingleStringMathTex))
+        return templates
+
+    def _update_glyphs_in_place(self, number: float) -> bool:
+        """Updates the points of the submobjects in place when setting the
+        value to ``number``, instead of generating them again.
+
+        This is possible when the new number has as many characters as the
+        current one and its glyphs have the same structure as the glyphs they
+        replace, e.g. when only digits change. The layout of
+        :meth:`_set_submobjects_from_number` is then computed from the bounding
+        boxes of the cached glyph templates, and the points of the templates
+        are copied to the submobjects at their new positions.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the submobjects were updated. If not, they have to be
+            generated again.
+        """
+        old_string = getattr(self, "_num_string", None)
+        num_string = self._get_num_string(number)
+        if num_string == old_string:
+            self.number = number
+            return True
+        templates = self._get_glyph_templates(num_string)
+        if (
+            old_string is None
+            or isinstance(number, complex)
+            or self.include_background_rectangle
+            or len(num_string) != len(old_string)
+            or len(self.submobjects) != len(templates)
+        ):
+            return False
+        families = []
+        for mob, template in zip(self.submobjects, templates):
+            family = mob.get_family()
+            template_family = template.get_family()
+            if len(family) != len(template_family) or any(
+                len(sub.submobjects) != len(template_sub.submobjects)
+                for sub, template_sub in zip(family, template_family)
+            ):
+                return False
+            families.append((family, template_family))
+
+        # Lay out the bounding boxes of the templates as the submobjects are
+        # laid out by _set_submobjects_from_number. Global translations do
+        # not matter, as the number is moved to its edge to fix afterwards.
+        bounds = np.array(
+            [[t.get_critical_point(DL), t.get_critical_point(UR)] for t in templates]
+        )
+        offsets = np.zeros((len(templates), 3))
+        buff = self.digit_buff_per_font_unit * self._font_size
+        num_arranged = len(templates) - (self.unit is not None)
+        for i in range(1, num_arranged):
+            previous = bounds[i - 1] + offsets[i - 1]
+            offsets[i, 0] = previous[1, 0] + buff - bounds[i, 0, 0]
+            offsets[i, 1] = previous[0, 1] - bounds[i, 0, 1]
+        if self.unit is not None:
+            unit_buff = (
+                self.unit_buff_per_font_unit + self.digit_buff_per_font_unit
+            ) * self._font_size
+            placed = bounds[:-1] + offsets[:-1, None]
+            offsets[-1, 0] = placed[:, 1, 0].max() + unit_buff - bounds[-1, 0, 0]
+            offsets[-1, 1] = placed[:, 0, 1].min() - bounds[-1, 0, 1]
+        heights = bounds[:, 1, 1] - bounds[:, 0, 1]
+        for i, c in enumerate(num_string):
+            if c == "-" and len(num_string) > i + 1:
+                offsets[i, 1] = (
+                    bounds[i + 1, 1, 1]
+                    + offsets[i + 1, 1]
+                    - bounds[i, 1, 1]
+                    - heights[i + 1] / 2
+                )
+            elif c == ",":
+                offsets[i, 1] -= heights[i] / 2
+        placed = bounds + offsets[:, None]
+        if self.unit and self.unit.startswith("^"):
+            offsets[-1, 1] += placed[:, 1, 1].max() - placed[-1, 1, 1]
+            placed = bounds + offsets[:, None]
+        lower, upper = placed[:, 0].min(axis=0), placed[:, 1].max(axis=0)
+        edge_to_fix = np.asarray(self.edge_to_fix)
+        edge_point = np.where(
+            edge_to_fix > 0,
+            upper,
+            np.where(edge_to_fix < 0, lower, (lower + upper) / 2),
+        )
 
-        if string not in string_to_mob_map:
-            string_to_mob_map[string] = mob_class(string, **kwargs)
-        mob = string_to_mob_map[string].copy()
-        mob.font_size = self._font_size
-        return mob
+        # As in set_value, the number keeps its font size and edge to fix.
+        scale = self.font_size / self._font_size
+        target = self.get_edge_center(self.edge_to_fix)
+        for (family, template_family), offset in zip(families, offsets):
+            for mob, template in zip(family, template_family):
+                mob.set_points((template.points + offset - edge_point) * scale + target)
+        self.number = number
+        self._num_string = num_string
+        self.initial_height = upper[1] - lower[1]
+        return True
 
     def _get_formatter(self, **kwargs):
         """
@@ -276,6 +404,9 @@ class DecimalNumber(VMobject, metaclass=ConvertToOpenGL):
             The value that will overwrite the current number of the :class:`~.DecimalNumber`.
 
         """
+        if self._update_glyphs_in_place(number):
+            return self
+
         # creates a new number mob via `set_submobjects_from_number`
         # then matches the properties (color, font_size, etc...)
         # of the previous mobject to the new one
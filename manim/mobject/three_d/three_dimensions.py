@@ -33,6 +33,7 @@ from manim.mobject.mobject import *
 from manim.mobject.opengl.opengl_compatibility import ConvertToOpenGL
 from manim.mobject.opengl.opengl_mobject import OpenGLMobject
 from manim.mobject.types.vectorized_mobject import VectorizedPoint, VGroup, VMobject
+from manim.utils.bezier import bezier, interpolate
 from manim.utils.color import (
     ManimColor,
     ParsableManimColor,
@@ -76,6 +77,18 @@ class Surface(VGroup, metaclass=ConvertToOpenGL):
     should_make_jagged
         Changes the anchor mode of the Bézier curves from smooth to jagged.
         Defaults to ``False``.
+    use_vectorized
+        Whether to pass in the grids of ``u`` and ``v`` values to the function
+        as 2D arrays, instead of calling it for every pair of values. Only use
+        this if your function supports it. Output should be a numpy array of
+        shape ``[x_values, y_values, z_values]``, each with the shape of the grids.
+    use_mesh
+        Whether to store the faces of the :class:`Surface` as the points of a
+        single mobject, with their colors in an array, instead of creating a
+        :class:`ThreeDVMobject` for every face. The renderers then draw all the
+        faces from these arrays, which is much faster for surfaces with a high
+        resolution, but the faces are not available as submobjects and
+        :meth:`set_fill_by_value` only sets their fill colors.
 
     Examples
     --------
@@ -112,10 +125,14 @@ class Surface(VGroup, metaclass=ConvertToOpenGL):
         stroke_width: float = 0.5,
         should_make_jagged: bool = False,
         pre_function_handle_to_anchor_scale_factor: float = 0.00001,
+        use_vectorized: bool = False,
+        use_mesh: bool = False,
         **kwargs: Any,
     ) -> None:
         self.u_range = u_range
         self.v_range = v_range
+        self.use_mesh = use_mesh
+        self.face_colors: np.ndarray | None = None
         super().__init__(**kwargs)
         self.resolution = resolution
         self.surface_piece_config = surface_piece_config
@@ -133,9 +150,12 @@ class Surface(VGroup, metaclass=ConvertToOpenGL):
         self.pre_function_handle_to_anchor_scale_factor = (
             pre_function_handle_to_anchor_scale_factor
         )
+        self.use_vectorized = use_vectorized
         self._func = func
-        self._setup_in_uv_space()
-        self.apply_function(lambda p: func(p[0], p[1]))
+        if self.use_mesh:
+            self._setup_mesh()
+        else:
+            self._setup_in_uv_space()
         if self.should_make_jagged:
             self.make_jagged()
 
@@ -154,23 +174,93 @@ class Surface(VGroup, metaclass=ConvertToOpenGL):
 
         return u_values, v_values
 
+    def _get_mesh_shape(self) -> tuple[int, int]:
+        u_values, v_values = self._get_u_values_and_v_values()
+        return len(u_values) - 1, len(v_values) - 1
+
+    def _evaluate_func(self, u_values: np.ndarray, v_values: np.ndarray) -> np.ndarray:
+        """Evaluates the function of the surface at every pair of values of
+        ``u_values`` and ``v_values``, and returns an array of shape
+        ``(len(u_values), len(v_values), 3)``.
+        """
+        if self.use_vectorized:
+            u_grid, v_grid = np.meshgrid(u_values, v_values, indexing="ij")
+            x, y, z = self._func(u_grid, v_grid)
+            return np.stack(np.broadcast_arrays(x, y, z), axis=-1).astype(float)
+        return np.array(
+            [[self._func(u, v) for v in v_values] for u in u_values], dtype=float
+        )
+
+    def _get_face_points(self) -> np.ndarray:
+        """Returns the points of the faces of the surface, as an array of shape
+        ``(u_res, v_res, num_points, 3)``.
+
+        Each face is the image by the function of a rectangle of the ``u, v``
+        grid, whose edges are straight Bézier curves. The function is only
+        evaluated once at the corners and at the handles of every edge, which
+        are shared by neighbouring faces. With the Cairo renderer, the handles
+        are pulled towards their anchors before applying the function and
+        pushed out again afterwards, like :meth:`.VMobject.apply_function`
+        does, so that the edges follow the tangents of the surface.
+        """
+        u_values, v_values = self._get_u_values_and_v_values()
+        nppc = self.n_points_per_curve
+        step = nppc - 1
+        alphas = np.linspace(0, 1, nppc)[:-1]
+        scale_handles = config.renderer == RendererType.CAIRO
+        factor = self.pre_function_handle_to_anchor_scale_factor
+
+        def with_handles(values: np.ndarray) -> np.ndarray:
+            starts, ends = values[:-1, None], values[1:, None]
+            samples = interpolate(starts, ends, alphas)
+            if scale_handles:
+                samples[:, 1] = starts[:, 0] + factor * (samples[:, 1] - starts[:, 0])
+                samples[:, 2] = ends[:, 0] + factor * (samples[:, 2] - ends[:, 0])
+            return np.append(samples.ravel(), values[-1])
+
+        def push_handles(edges: np.ndarray) -> np.ndarray:
+            if scale_handles:
+                anchors = edges[::step]
+                edges[1::step] = anchors[:-1] + (edges[1::step] - anchors[:-1]) / factor
+                edges[2::step] = anchors[1:] + (edges[2::step] - anchors[1:]) / factor
+            return edges
+
+        # Points along the edges parallel to the u axis and to the v axis
+        u_edges = push_handles(self._evaluate_func(with_handles(u_values), v_values))
+        v_edges = push_handles(
+            self._evaluate_func(u_values, with_handles(v_values)).swapaxes(0, 1)
+        ).swapaxes(0, 1)
+
+        u_index, v_index = np.meshgrid(
+            np.arange(len(u_values) - 1),
+            np.arange(len(v_values) - 1),
+            indexing="ij",
+        )
+        u_index = u_index[..., None]
+        v_index = v_index[..., None]
+        k = np.arange(nppc)
+        # The edges of the face from (u1, v1) to (u2, v1), (u2, v2), (u1, v2)
+        # and back to (u1, v1).
+        return np.concatenate(
+            [
+                u_edges[step * u_index + k, v_index],
+                v_edges[u_index + 1, step * v_index + k],
+                u_edges[step * (u_index + 1) - k, v_index + 1],
+                v_edges[u_index, step * (v_index + 1) - k],
+            ],
+            axis=2,
+        )
+
     def _setup_in_uv_space(self) -> None:
         u_values, v_values = self._get_u_values_and_v_values()
+        face_points = self._get_face_points()
         faces = VGroup()
         for i in range(len(u_values) - 1):
             for j in range(len(v_values) - 1):
                 u1, u2 = u_values[i : i + 2]
                 v1, v2 = v_values[j : j + 2]
                 face = ThreeDVMobject()
-                face.set_points_as_corners(
-                    [
-                        [u1, v1, 0],
-                        [u2, v1, 0],
-                        [u2, v2, 0],
-                        [u1, v2, 0],
-                        [u1, v1, 0],
-                    ],
-                )
+                face.set_points(face_points[i, j])
                 faces.add(face)
                 face.u_index = i
                 face.v_index = j
@@ -188,6 +278,90 @@ class Surface(VGroup, metaclass=ConvertToOpenGL):
         if self.checkerboard_colors:
             self.set_fill_by_checkerboard(*self.checkerboard_colors)
 
+    def _setup_mesh(self) -> None:
+        self.shade_in_3d = True
+        self.set_points(self._get_face_points().reshape(-1, 3))
+        self.set_fill(color=self.fill_color, opacity=self.fill_opacity)
+        self.set_stroke(
+            color=self.stroke_color,
+            width=self.stroke_width,
+            opacity=self.stroke_opacity,
+        )
+        if self.checkerboard_colors:
+            self.set_fill_by_checkerboard(*self.checkerboard_colors)
+
+    def get_mesh_face_points(self) -> np.ndarray:
+        """Returns the points of the faces of a :class:`Surface` created with
+        ``use_mesh=True``, as an array of shape ``(num_faces, num_points, 3)``.
+
+        The faces are ordered by their index along ``u``, then along ``v``.
+        """
+        return self.points.reshape(-1, 4 * self.n_points_per_curve, 3)
+
+    def _get_face_midpoints(self) -> np.ndarray:
+        """Returns the point halfway along the boundary of every face of a
+        :class:`Surface` created with ``use_mesh=True``, as
+        :meth:`.VMobject.point_from_proportion` computes it for a single face.
+        """
+        nppc = self.n_points_per_curve
+        # The control points of all the edges, of shape (nppc, 4 * num_faces, 3)
+        control_points = self.get_mesh_face_points().reshape(-1, nppc, 3).swapaxes(0, 1)
+        edge = bezier(control_points)
+        samples = np.array([edge(t) for t in np.linspace(0, 1, 10)])
+        lengths = (
+            np.linalg.norm(np.diff(samples, axis=0), axis=2).sum(axis=0).reshape(-1, 4)
+        )
+        ends = np.cumsum(lengths, axis=1)
+        targets = ends[:, -1] / 2
+        faces = np.arange(len(lengths))
+        index = np.argmax(ends >= targets[:, None], axis=1)
+        length = lengths[faces, index]
+        residues = np.divide(
+            targets - (ends - lengths)[faces, index],
+            length,
+            out=np.zeros_like(length),
+            where=length != 0,
+        )
+        edges = control_points.reshape(nppc, -1, 4, 3)[:, faces, index]
+        return bezier(edges)(residues[:, None])
+
+    def _set_face_colors(self, rgbs: np.ndarray) -> None:
+        self.face_colors = rgbs
+        if config.renderer == RendererType.OPENGL:
+            rgbas = np.empty((len(self.points), 4))
+            rgbas[:, :3] = np.repeat(rgbs, 4 * self.n_points_per_curve, axis=0)
+            rgbas[:, 3] = self.get_fill_opacity()
+            self.set_rgba_array_direct(rgbas, "fill_rgba", recurse=False)
+
+    def set_fill(
+        self,
+        color: ParsableManimColor | None = None,
+        opacity: float | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Self:
+        if color is not None:
+            self.face_colors = None
+        super().set_fill(color, opacity, *args, **kwargs)
+        if self.face_colors is not None and opacity is not None:
+            self._set_face_colors(self.face_colors)
+        return self
+
+    def get_triangulation(self, normal_vector: Vector3D | None = None) -> np.ndarray:
+        if not self.use_mesh:
+            return super().get_triangulation(normal_vector)
+        if not self.needs_new_triangulation:
+            return self.triangulation
+        # The curves give the triangles along the edges of every face, and its
+        # corners two triangles covering its inside.
+        indices = np.arange(len(self.points))
+        corners = indices[:: self.n_points_per_curve].reshape(-1, 4)
+        self.triangulation = np.hstack(
+            [indices, corners[:, [0, 1, 2, 0, 2, 3]].ravel()]
+        )
+        self.needs_new_triangulation = False
+        return self.triangulation
+
     def set_fill_by_checkerboard(
         self, *colors: Iterable[ParsableManimColor], opacity: float | None = None
     ) -> Self:
@@ -208,6 +382,13 @@ class Surface(VGroup, metaclass=ConvertToOpenGL):
             The parametric surface with an alternating pattern.
         """
         n_colors = len(colors)
+        if self.use_mesh:
+            rgbs = np.array([ManimColor(color).to_rgb() for color in colors])
+            u_index, v_index = np.indices(self._get_mesh_shape())
+            self._set_face_colors(rgbs[(u_index + v_index).ravel() % n_colors])
+            if opacity is not None:
+                self.set_fill(opacity=opacity)
+            return self
         for face in self:
             c_index = (face.u_index + face.v_index) % n_colors
             face.set_fill(colors[c_index], opacity=opacity)
@@ -298,6 +479,23 @@ class Surface(VGroup, metaclass=ConvertToOpenGL):
                 step=pivot_frequency,
             )
 
+        if self.use_mesh:
+            values = axes.point_to_coords(self._get_face_midpoints())[:, axis]
+            pivots = np.asarray(pivots, dtype=float)
+            rgbs = np.array([ManimColor(color).to_rgb() for color in new_colors])
+            index = np.clip(
+                np.searchsorted(pivots, values, side="right"), 1, len(pivots) - 1
+            )
+            alphas = np.clip(
+                (values - pivots[index - 1]) / (pivots[index] - pivots[index - 1]),
+                0,
+                1,
+            )
+            self._set_face_colors(
+                interpolate(rgbs[index - 1], rgbs[index], alphas[:, None])
+            )
+            return self
+
         for mob in self.family_members_with_points():
             axis_value = axes.point_to_coords(mob.get_midpoint())[axis]
             if axis_value <= pivots[0]:
@@ -391,6 +589,8 @@ class Sphere(Surface):
 
         self.radius = radius
 
+        # The function of the sphere works on whole arrays of values
+        kwargs.setdefault("use_vectorized", type(self).func is Sphere.func)
         super().__init__(
             self.func,
             resolution=resolution,
@@ -608,6 +808,8 @@ class Cone(Surface):
         self.direction = direction
         self.theta = PI - np.arctan(base_radius / height)
 
+        # The function of the cone works on whole arrays of values
+        kwargs.setdefault("use_vectorized", type(self).func is Cone.func)
         super().__init__(
             self.func,
             v_range=v_range,
@@ -768,6 +970,8 @@ class Cylinder(Surface):
     ) -> None:
         self._height = height
         self.radius = radius
+        # The function of the cylinder works on whole arrays of values
+        kwargs.setdefault("use_vectorized", type(self).func is Cylinder.func)
         super().__init__(
             self.func,
             resolution=resolution,
@@ -104,6 +104,11 @@ class VMobject(Mobject):
 
     sheen_factor = 0.0
 
+    # The array points are appended to, which has room for more points past
+    # its end, see append_points().
+    _point_buffer: Point3D_Array | None = None
+    _point_buffer_end: int = 0
+
     def __init__(
         self,
         fill_color: ParsableManimColor | None = None,
@@ -839,12 +844,44 @@ class VMobject(Mobject):
         # or else that if len(self.points) % 4 == 1, then
         # len(new_points) % 4 == 3?
         n = len(self.points)
-        points = np.empty((n + len(new_points), self.dim))
-        points[:n] = self.points
-        points[n:] = new_points
-        self.points = points
+        start = self._get_point_buffer_start()
+        end = start + n + len(new_points)
+        if start < 0 or end > len(self._point_buffer):
+            # Double the capacity so that repeated appends take amortized
+            # constant time.
+            buffer = np.empty((max(2 * (n + len(new_points)), 16), self.dim))
+            buffer[:n] = self.points
+            self._point_buffer = buffer
+            start, end = 0, n + len(new_points)
+        self._point_buffer[start + n : end] = new_points
+        self.points = self._point_buffer[start:end]
+        self._point_buffer_end = end
         return self
 
+    def _get_point_buffer_start(self) -> int:
+        """Return the index in :attr:`_point_buffer` at which :attr:`points`
+        start, or ``-1`` if points cannot be appended in place.
+
+        This is the case when the points are a view of the buffer which ends
+        where the points last appended end, such as the points after dropping
+        some from their start. The buffer past that end is not part of any
+        points given out, so it can be written to.
+        """
+        buffer = self._point_buffer
+        points = self.points
+        if (
+            buffer is None
+            or not isinstance(points, np.ndarray)
+            or points.base is not buffer
+            or points.strides != buffer.strides
+        ):
+            return -1
+        offset = points.ctypes.data - buffer.ctypes.data
+        start = offset // buffer.strides[0]
+        if start + len(points) != self._point_buffer_end:
+            return -1
+        return start
+
     def start_new_path(self, point: Point3DLike) -> Self:
         """Append a ``point`` to the :attr:`VMobject.points`, which will be the
         beginning of a new Bézier curve in the path given by the points. If
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import multiprocessing
+import os
 import typing
 
 import numpy as np
@@ -9,11 +11,14 @@ from manim.utils.hashing import get_hash_from_play_call
 from .. import config, logger
 from ..camera.camera import Camera
 from ..mobject.mobject import Mobject, _AnimationBuilder
+from ..mobject.types.vectorized_mobject import VMobject
 from ..scene.scene_file_writer import SceneFileWriter
 from ..utils.exceptions import EndSceneEarlyException
+from ..utils.file_ops import write_to_movie
 from ..utils.iterables import list_update
 
 if typing.TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
     from typing import Any
 
     from manim.animation.animation import Animation
@@ -50,6 +55,24 @@ class CairoRenderer:
         self.num_plays = 0
         self.time = 0
         self.static_image = None
+        # Static mobjects drawn above changing ones during the current
+        # animation, see save_static_layers().
+        self.static_layers: list[tuple[tuple[slice, slice], np.ndarray]] = []
+        self.layered_mobjects: set[Mobject] = set()
+        self.layer_indices: dict[Mobject, int] = {}
+        # The mobjects drawn at every frame of the current animation which do
+        # not change, and the pixel regions covered by the changing ones in
+        # the last frame, see update_dirty_regions().
+        self.unchanged_mobjects: set[Mobject] | None = None
+        self.previous_regions: list[tuple[int, int, int, int]] | None = None
+        # Set while the frames of the current animation are rendered by a
+        # subprocess; frames then only advance the time in this process.
+        self.frames_rendered_elsewhere = False
+        self.segment_processes: list[BaseProcess] = []
+        # The hashes of the partial movie files written by subprocesses, which
+        # may not exist yet, see is_segment_cached().
+        self.segment_hashes: set[str] = set()
+        self.warned_about_forking = False
 
     def init_scene(self, scene: Scene) -> None:
         self.file_writer: Any = self._file_writer_class(
@@ -85,7 +108,7 @@ class CairoRenderer:
                     scene.animations,
                     scene.mobjects,
                 )
-                if self.file_writer.is_already_cached(hash_current_animation):
+                if self.is_segment_cached(hash_current_animation):
                     logger.info(
                         f"Animation {self.num_plays} : Using cached data (hash : %(hash_current_animation)s)",
                         {"hash_current_animation": hash_current_animation},
@@ -100,9 +123,20 @@ class CairoRenderer:
             {"h": str(self.animations_hashes[:5])},
         )
 
-        self.file_writer.begin_animation(not self.skip_animations)
-        scene.begin_animations()
+        if not self.skip_animations and self.renders_segments_in_parallel():
+            scene.begin_animations()
+            self.render_segment_in_subprocess(scene)
+            self.segment_hashes.add(hash_current_animation)
+        else:
+            self.file_writer.begin_animation(not self.skip_animations)
+            scene.begin_animations()
+            self.render_current_animation(scene)
+            self.file_writer.end_animation(not self.skip_animations)
+
+        self.num_plays += 1
 
+    def render_current_animation(self, scene: Scene) -> None:
+        """Render every frame of the animation which is currently being played."""
         # Save a static image, to avoid rendering non moving objects.
         self.save_static_frame_data(scene, scene.static_mobjects)
 
@@ -112,10 +146,110 @@ class CairoRenderer:
             # In this case, as there is only a wait, it will be the length of the wait.
             self.freeze_current_frame(scene.duration)
         else:
-            scene.play_internal()
-        self.file_writer.end_animation(not self.skip_animations)
+            self.save_static_layers(scene)
+            self.save_unchanged_mobjects(scene)
+            try:
+                scene.play_internal()
+            finally:
+                self.static_layers = []
+                self.layered_mobjects = set()
+                self.layer_indices = {}
+                self.unchanged_mobjects = None
+                self.previous_regions = None
+
+    def is_segment_cached(self, hash_invocation: str) -> bool:
+        """Whether the partial movie file of an animation is already cached, or
+        is being written by a subprocess.
+
+        Identical animations, such as consecutive ``wait()`` calls, are
+        rendered once, so that two subprocesses never write the same file.
+        """
+        return (
+            hash_invocation in self.segment_hashes
+            or self.file_writer.is_already_cached(hash_invocation)
+        )
 
-        self.num_plays += 1
+    def renders_segments_in_parallel(self) -> bool:
+        """Whether ``play()`` calls are rendered by a pool of subprocesses.
+
+        This is the case when ``config.jobs`` is different from 1, the scene is
+        written to a movie file and the platform is able to fork processes.
+        """
+        if config.jobs == 1 or not write_to_movie():
+            return False
+        if "fork" not in multiprocessing.get_all_start_methods():
+            if not self.warned_about_forking:
+                logger.warning(
+                    "Rendering animations in parallel requires forking processes, "
+                    "which is not supported on this platform. Rendering serially.",
+                )
+                self.warned_about_forking = True
+            return False
+        return True
+
+    def render_segment_in_subprocess(self, scene: Scene) -> None:
+        """Render the partial movie file of the current animation in a subprocess.
+
+        The subprocess is forked at the boundary of the ``play()`` call, so it
+        inherits a snapshot of the scene and writes the partial movie file on
+        its own.  This process then only advances the scene to the end of the
+        animation, without rasterizing or encoding any frame, and moves on to
+        the next animation.  At most ``config.jobs`` subprocesses run at once.
+        """
+        max_processes = config.jobs or os.cpu_count() or 1
+        try:
+            while len(self.segment_processes) >= max_processes:
+                self.join_segment_process(self.segment_processes.pop(0))
+
+            process = multiprocessing.get_context("fork").Process(
+                target=self._render_segment,
+                args=(scene,),
+                name=f"{scene}-animation-{self.num_plays}",
+            )
+            process.start()
+            self.segment_processes.append(process)
+
+            self.frames_rendered_elsewhere = True
+            self.render_current_animation(scene)
+        except BaseException:
+            self.terminate_segment_processes()
+            raise
+        finally:
+            self.frames_rendered_elsewhere = False
+
+    def _render_segment(self, scene: Scene) -> None:
+        # Entry point of the forked subprocess.
+        config.progress_bar = "none"
+        self.file_writer.begin_animation(True)
+        self.render_current_animation(scene)
+        self.file_writer.end_animation(True)
+
+    def join_segment_process(self, process: BaseProcess) -> None:
+        """Wait for a subprocess started by :meth:`render_segment_in_subprocess`."""
+        process.join()
+        if process.exitcode != 0:
+            raise RuntimeError(
+                f"Rendering of {process.name} failed in a subprocess "
+                f"(exit code {process.exitcode}).",
+            )
+
+    def join_segment_processes(self) -> None:
+        """Wait until all partial movie files rendered in subprocesses are written."""
+        try:
+            while self.segment_processes:
+                self.join_segment_process(self.segment_processes.pop(0))
+        finally:
+            self.terminate_segment_processes()
+
+    def terminate_segment_processes(self) -> None:
+        """Terminate and wait for the subprocesses which are still rendering
+        animations, when the scene can't be completed.
+        """
+        for process in self.segment_processes:
+            process.terminate()
+        for process in self.segment_processes:
+            process.join()
+        self.segment_processes = []
 
     def update_frame(  # TODO Description in Docstring
         self,
@@ -143,6 +277,9 @@ class CairoRenderer:
         """
         if self.skip_animations and not ignore_skipping:
             return
+        if self.frames_rendered_elsewhere:
+            return
+        self.previous_regions = None
         if not mobjects:
             mobjects = list_update(
                 scene.mobjects,
@@ -156,9 +293,126 @@ class CairoRenderer:
         kwargs["include_submobjects"] = include_submobjects
         self.camera.capture_mobjects(mobjects, **kwargs)
 
+    def update_frame_from_layers(self, moving_mobjects: list[Mobject]) -> None:
+        """Update the frame by drawing the moving mobjects between the static
+        layers saved by :meth:`save_static_layers`.
+        """
+        camera = self.camera
+        if self.static_image is not None:
+            camera.set_frame_to_background(self.static_image)
+        else:
+            camera.reset()
+        num_composited = 0
+        run: list[Mobject] = []
+        for mob in camera.get_mobjects_to_display(moving_mobjects):
+            if mob in self.layered_mobjects:
+                continue
+            # Mobjects added during the animation are drawn with the mobjects
+            # preceding them.
+            index = self.layer_indices.get(mob, num_composited)
+            if index > num_composited:
+                camera.capture_mobjects(run, include_submobjects=False)
+                run = []
+                for region, layer in self.static_layers[num_composited:index]:
+                    self.composite_layer(region, layer)
+                num_composited = index
+            run.append(mob)
+        camera.capture_mobjects(run, include_submobjects=False)
+        for region, layer in self.static_layers[num_composited:]:
+            self.composite_layer(region, layer)
+
+    def update_dirty_regions(
+        self, scene: Scene, moving_mobjects: list[Mobject]
+    ) -> None:
+        """Update the frame by redrawing only the pixel regions covered by the
+        changing mobjects, in this frame or in the previous one.
+
+        The regions are restored from the static image and the moving
+        mobjects overlapping them are drawn again, clipped to the regions. The
+        whole frame is updated instead if this is the first frame of the
+        animation or if one of the moving mobjects is not a
+        :class:`~.VMobject` drawn by cairo.
+
+        Parameters
+        ----------
+        scene
+            The scene played.
+        moving_mobjects
+            The moving mobjects of the scene.
+        """
+        camera = self.camera
+        mobjects = None
+        if self.unchanged_mobjects is not None and moving_mobjects:
+            mobjects = camera.get_mobjects_to_display(moving_mobjects)
+            if not all(
+                isinstance(mob, VMobject) and not mob.get_background_image()
+                for mob in mobjects
+            ):
+                mobjects = None
+        if mobjects is None:
+            self.update_frame(scene, moving_mobjects)
+            return
+
+        regions = [
+            camera.get_pixel_region(mob)
+            for mob in mobjects
+            if mob not in self.unchanged_mobjects
+        ]
+        regions = [
+            (x0, y0, x1, y1) for x0, y0, x1, y1 in regions if x0 < x1 and y0 < y1
+        ]
+        previous_regions = self.previous_regions
+        if previous_regions is None:
+            self.update_frame(scene, moving_mobjects)
+            self.previous_regions = regions
+            return
+        self.previous_regions = regions
+        dirty_regions = previous_regions + regions
+        if not dirty_regions:
+            # Nothing changed since the previous frame.
+            return
+        if len(dirty_regions) > 32:
+            # Restoring and clipping many small regions costs more than a
+            # single larger one.
+            x0s, y0s, x1s, y1s = zip(*dirty_regions)
+            dirty_regions = [(min(x0s), min(y0s), max(x1s), max(y1s))]
+
+        source = self.static_image
+        if source is None:
+            source = camera.background
+        for x0, y0, x1, y1 in dirty_regions:
+            camera.pixel_array[y0:y1, x0:x1] = source[y0:y1, x0:x1]
+        to_redraw = [
+            mob
+            for mob in mobjects
+            if any(
+                _regions_overlap(camera.get_pixel_region(mob), region)
+                for region in dirty_regions
+            )
+        ]
+        camera.clip_regions = dirty_regions
+        try:
+            camera.capture_mobjects(to_redraw, include_submobjects=False)
+        finally:
+            camera.clip_regions = None
+
+    def composite_layer(self, region: tuple[slice, slice], layer: np.ndarray) -> None:
+        """Draw a premultiplied RGBA layer over a region of the frame."""
+        frame = self.camera.pixel_array[region]
+        transparency = 255 - layer[..., 3:].astype(np.uint16)
+        frame[...] = layer + (frame * transparency + 127) // 255
+
     def render(self, scene, time, moving_mobjects):
-        self.update_frame(scene, moving_mobjects)
-        self.add_frame(self.get_frame())
+        if self.frames_rendered_elsewhere:
+            self.time += 1 / self.camera.frame_rate
+            return
+        if self.static_layers:
+            self.update_frame_from_layers(moving_mobjects)
+        else:
+            self.update_dirty_regions(scene, moving_mobjects)
+        # The file writer copies the frame into one of its own buffers, so
+        # there is no need to copy the pixel array here.
+        self.add_frame(self.camera.pixel_array)
 
     def get_frame(self) -> PixelArray:
         """
@@ -198,8 +452,11 @@ class CairoRenderer:
             [description]
         """
         dt = 1 / self.camera.frame_rate
+        if self.frames_rendered_elsewhere:
+            self.time += int(duration / dt) * dt
+            return
         self.add_frame(
-            self.get_frame(),
+            self.camera.pixel_array,
             num_frames=int(duration / dt),
         )
 
@@ -232,12 +489,110 @@ class CairoRenderer:
             The static image computed.
         """
         self.static_image = None
-        if not static_mobjects:
+        if not static_mobjects or self.frames_rendered_elsewhere:
             return None
         self.update_frame(scene, mobjects=static_mobjects)
         self.static_image = self.get_frame()
         return self.static_image
 
+    def save_unchanged_mobjects(self, scene: Scene) -> None:
+        """Save which moving mobjects do not change during the current
+        animation, so that frames can be updated region by region, see
+        :meth:`update_dirty_regions`.
+
+        Parameters
+        ----------
+        scene
+            The scene played.
+        """
+        camera = self.camera
+        if (
+            self.skip_animations
+            or self.frames_rendered_elsewhere
+            or self.static_layers
+            or not scene.moving_mobjects
+            or type(camera).capture_mobjects is not Camera.capture_mobjects
+            or type(camera).get_mobjects_to_display
+            is not Camera.get_mobjects_to_display
+            or type(camera).points_to_pixel_coords is not Camera.points_to_pixel_coords
+            or type(camera).transform_points_pre_display
+            is not Camera.transform_points_pre_display
+        ):
+            return
+        changing = set(scene.get_changing_mobjects(*scene.animations))
+        self.unchanged_mobjects = {
+            mob
+            for mob in camera.get_mobjects_to_display(scene.moving_mobjects)
+            if mob not in changing
+        }
+
+    def save_static_layers(self, scene: Scene) -> None:
+        """Render the static mobjects drawn above moving ones into layers.
+
+        The moving mobjects of a scene include everything drawn above the
+        first mobject which changes. The runs of static
+        :class:`~.VMobject` instances among them are rendered once into
+        premultiplied RGBA layers, cropped to the pixels they cover, which
+        are then composited with the changing mobjects at every frame instead
+        of being drawn again. Other static mobjects keep being drawn at every
+        frame.
+
+        This only applies to scenes and cameras which do not change which
+        mobjects are moving or how they are displayed, such as
+        :class:`~.MovingCameraScene` or :class:`~.ThreeDCamera`.
+
+        Parameters
+        ----------
+        scene
+            The scene played.
+        """
+        from ..scene.scene import Scene
+
+        camera = self.camera
+        if (
+            self.skip_animations
+            or self.frames_rendered_elsewhere
+            or not scene.moving_mobjects
+            or type(scene).get_moving_mobjects is not Scene.get_moving_mobjects
+            or type(camera).capture_mobjects is not Camera.capture_mobjects
+            or type(camera).get_mobjects_to_display
+            is not Camera.get_mobjects_to_display
+        ):
+            return
+        changing = set(scene.get_changing_mobjects(*scene.animations))
+        runs: list[list[Mobject]] = []
+        run: list[Mobject] = []
+        for mob in camera.get_mobjects_to_display(scene.moving_mobjects):
+            if (
+                mob not in changing
+                and isinstance(mob, VMobject)
+                and not mob.get_background_image()
+            ):
+                run.append(mob)
+                continue
+            if run:
+                runs.append(run)
+                run = []
+            self.layer_indices[mob] = len(runs)
+        if run:
+            runs.append(run)
+        if not runs:
+            return
+
+        transparent = np.zeros_like(camera.pixel_array)
+        for run in runs:
+            camera.set_pixel_array(transparent)
+            camera.capture_mobjects(run, include_submobjects=False)
+            rows, columns = np.nonzero(camera.pixel_array[..., 3])
+            region = (slice(0, 0), slice(0, 0))
+            if len(rows):
+                region = (
+                    slice(rows.min(), rows.max() + 1),
+                    slice(columns.min(), columns.max() + 1),
+                )
+            self.static_layers.append((region, camera.pixel_array[region].copy()))
+            self.layered_mobjects.update(run)
+
     def update_skipping_status(self):
         """
         This method is used internally to check if the current
@@ -264,6 +619,7 @@ class CairoRenderer:
             raise EndSceneEarlyException()
 
     def scene_finished(self, scene: Scene) -> None:
+        self.join_segment_processes()
         # If no animations in scene, render an image instead
         if self.num_plays:
             self.file_writer.finish()
@@ -278,3 +634,14 @@ class CairoRenderer:
             self.static_image = None
             self.update_frame(scene)
             self.file_writer.save_final_image(self.camera.get_image())
+
+
+def _regions_overlap(
+    region: tuple[int, int, int, int], other: tuple[int, int, int, int]
+) -> bool:
+    return (
+        region[0] < other[2]
+        and other[0] < region[2]
+        and region[1] < other[3]
+        and other[1] < region[3]
+    )
@@ -20,6 +20,7 @@ from manim.mobject.opengl.opengl_vectorized_mobject import OpenGLVMobject
 from manim.utils.caching import handle_caching_play
 from manim.utils.color import color_to_rgba
 from manim.utils.exceptions import EndSceneEarlyException
+from manim.utils.profiling import profiler
 
 from ..constants import *
 from ..scene.scene_file_writer import SceneFileWriter
@@ -33,7 +34,7 @@ from ..utils.space_ops import (
     rotation_matrix_transpose,
     rotation_matrix_transpose_from_quaternion,
 )
-from .shader import Mesh, Shader
+from .shader import Mesh, Shader, VertexBuffers
 from .vectorized_mobject_rendering import (
     render_opengl_vectorized_mobject_fill,
     render_opengl_vectorized_mobject_stroke,
@@ -251,6 +252,10 @@ class OpenGLRenderer:
         # Initialize texture map.
         self.path_to_texture_id = {}
 
+        # Buffers on the GPU of the mobjects rendered in the last frame.
+        self.vertex_buffers = {}
+        self.used_vertex_buffers = set()
+
         self.background_color = config["background_color"]
 
     def init_scene(self, scene):
@@ -340,7 +345,7 @@ class OpenGLRenderer:
         shader_wrapper_list = mobject.get_shader_wrapper_list()
 
         # Convert ShaderWrappers to Meshes.
-        for shader_wrapper in shader_wrapper_list:
+        for index, shader_wrapper in enumerate(shader_wrapper_list):
             shader = Shader(self.context, shader_wrapper.shader_folder)
 
             # Set textures.
@@ -379,10 +384,35 @@ class OpenGLRenderer:
                 indices=shader_wrapper.vert_indices,
                 use_depth_test=shader_wrapper.depth_test,
                 primitive=mobject.render_primitive,
+                buffers=self.get_vertex_buffers(id(mobject), index),
             )
             mesh.set_uniforms(self)
             mesh.render()
 
+    def get_vertex_buffers(self, *key) -> VertexBuffers:
+        """Returns the buffers on the GPU rendering some data of a mobject,
+        which are kept as long as they are used in every frame.
+
+        Parameters
+        ----------
+        key
+            The id of the mobject, followed by what it renders with the
+            buffers.
+        """
+        buffers = self.vertex_buffers.get(key)
+        if buffers is None:
+            buffers = self.vertex_buffers[key] = VertexBuffers(self.context)
+        self.used_vertex_buffers.add(key)
+        return buffers
+
+    def release_unused_vertex_buffers(self) -> None:
+        """Releases the buffers which weren't used since the last call, such as
+        the buffers of mobjects removed from the scene.
+        """
+        for key in self.vertex_buffers.keys() - self.used_vertex_buffers:
+            self.vertex_buffers.pop(key).release()
+        self.used_vertex_buffers = set()
+
     def get_texture_id(self, path):
         if repr(path) not in self.path_to_texture_id:
             tid = len(self.path_to_texture_id)
@@ -478,18 +508,22 @@ class OpenGLRenderer:
                 self.window.swap_buffers()
 
     def update_frame(self, scene):
-        self.frame_buffer_object.clear(*self.background_color)
-        self.refresh_perspective_uniforms(scene.camera)
-
-        for mobject in scene.mobjects:
-            if not mobject.should_render:
-                continue
-            self.render_mobject(mobject)
-
-        for obj in scene.meshes:
-            for mesh in obj.get_meshes():
-                mesh.set_uniforms(self)
-                mesh.render()
+        with profiler.span("capture", "frame"):
+            self.frame_buffer_object.clear(*self.background_color)
+            self.refresh_perspective_uniforms(scene.camera)
+
+            for mobject in scene.mobjects:
+                if not mobject.should_render:
+                    continue
+                with profiler.measure("draw", type(mobject).__name__):
+                    self.render_mobject(mobject)
+
+            for obj in scene.meshes:
+                for mesh in obj.get_meshes():
+                    mesh.set_uniforms(self)
+                    mesh.render()
+
+            self.release_unused_vertex_buffers()
 
         self.animation_elapsed_time = time.time() - self.animation_start_time
 
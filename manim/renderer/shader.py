@@ -20,6 +20,7 @@ __all__ = [
     "Object3D",
     "Mesh",
     "Shader",
+    "VertexBuffers",
     "FullScreenQuad",
 ]
 
@@ -68,6 +69,116 @@ def filter_attributes(unfiltered_attributes, attributes):
     return filtered_attributes
 
 
+class VertexBuffers:
+    """The buffers holding the vertices and the indices of a mesh on the GPU,
+    with the vertex array object reading them, which are kept between frames.
+
+    Data is only uploaded when it differs from the data of the last render, and
+    then only the range of bytes which changed. A buffer is orphaned when the
+    size of its data changes, so that the vertex array object stays valid.
+
+    Parameters
+    ----------
+    context
+        The OpenGL context of the buffers.
+    """
+
+    def __init__(self, context):
+        self.context = context
+        self.vertex_buffer_object = None
+        self.index_buffer_object = None
+        self.vertex_array_object = None
+        self.vertex_data = b""
+        self.index_data = b""
+        self.program = None
+        self.attribute_names = None
+        self.indexed = False
+
+    def render(self, program, attributes, indices=None, primitive=moderngl.TRIANGLES):
+        """Uploads the attributes and indices which changed since the last
+        render, and renders them with the program.
+
+        Parameters
+        ----------
+        program
+            The shader program rendering the vertices.
+        attributes
+            The structured array of the vertices, with one field per attribute
+            of the program.
+        indices
+            The indices of the vertices to render, if any.
+        primitive
+            The primitive to render.
+        """
+        vertex_data = attributes.tobytes()
+        index_data = b"" if indices is None else indices.astype("i4").tobytes()
+        if not vertex_data:
+            return
+
+        self.vertex_buffer_object = self._write(
+            self.vertex_buffer_object, self.vertex_data, vertex_data
+        )
+        self.vertex_data = vertex_data
+        if index_data:
+            self.index_buffer_object = self._write(
+                self.index_buffer_object, self.index_data, index_data
+            )
+        self.index_data = index_data
+
+        attribute_names = attributes.dtype.names
+        indexed = bool(index_data)
+        if (
+            self.vertex_array_object is None
+            or program is not self.program
+            or attribute_names != self.attribute_names
+            or indexed != self.indexed
+        ):
+            if self.vertex_array_object is not None:
+                self.vertex_array_object.release()
+            self.vertex_array_object = self.context.simple_vertex_array(
+                program,
+                self.vertex_buffer_object,
+                *attribute_names,
+                index_buffer=self.index_buffer_object if indexed else None,
+            )
+            self.program = program
+            self.attribute_names = attribute_names
+            self.indexed = indexed
+
+        num_vertices = len(index_data) // 4 if indexed else len(attributes)
+        self.vertex_array_object.render(primitive, vertices=num_vertices)
+
+    def _write(self, buffer, old_data, data):
+        if buffer is None:
+            return self.context.buffer(data, dynamic=True)
+        if len(data) != len(old_data):
+            buffer.orphan(len(data))
+            buffer.write(data)
+        elif data != old_data:
+            changed = np.flatnonzero(
+                np.frombuffer(data, dtype=np.uint8)
+                != np.frombuffer(old_data, dtype=np.uint8)
+            )
+            start, end = changed[0], changed[-1] + 1
+            buffer.write(data[start:end], offset=start)
+        return buffer
+
+    def release(self):
+        """Releases the buffers and the vertex array object."""
+        for gl_object in (
+            self.vertex_array_object,
+            self.vertex_buffer_object,
+            self.index_buffer_object,
+        ):
+            if gl_object is not None:
+                gl_object.release()
+        self.vertex_array_object = None
+        self.vertex_buffer_object = None
+        self.index_buffer_object = None
+        self.vertex_data = b""
+        self.index_data = b""
+
+
 class Object3D:
     def __init__(self, *children):
         self.model_matrix = np.eye(4)
@@ -259,6 +370,7 @@ class Mesh(Object3D):
         indices=None,
         use_depth_test=True,
         primitive=moderngl.TRIANGLES,
+        buffers=None,
     ):
         super().__init__()
         if shader is not None and attributes is not None:
@@ -276,6 +388,9 @@ class Mesh(Object3D):
             )
         self.use_depth_test = use_depth_test
         self.primitive = primitive
+        # The buffers of the mesh on the GPU, which can be shared with the
+        # meshes drawing the same mobject in other frames.
+        self.buffers = buffers
         self.skip_render = False
         self.init_updaters()
 
@@ -321,26 +436,14 @@ class Mesh(Object3D):
                 shader_attributes.append(k)
         shader_attributes = filter_attributes(self.attributes, shader_attributes)
 
-        vertex_buffer_object = self.shader.context.buffer(shader_attributes.tobytes())
-        if self.indices is None:
-            index_buffer_object = None
-        else:
-            vert_index_data = self.indices.astype("i4").tobytes()
-            if vert_index_data:
-                index_buffer_object = self.shader.context.buffer(vert_index_data)
-            else:
-                index_buffer_object = None
-        vertex_array_object = self.shader.context.simple_vertex_array(
+        if self.buffers is None:
+            self.buffers = VertexBuffers(self.shader.context)
+        self.buffers.render(
             self.shader.shader_program,
-            vertex_buffer_object,
-            *shader_attributes.dtype.names,
-            index_buffer=index_buffer_object,
+            shader_attributes,
+            self.indices,
+            self.primitive,
         )
-        vertex_array_object.render(self.primitive)
-        vertex_buffer_object.release()
-        vertex_array_object.release()
-        if index_buffer_object is not None:
-            index_buffer_object.release()
 
 
 class Shader:
@@ -87,15 +87,8 @@ def render_mobject_fills_with_matrix(renderer, model_matrix, mobjects):
         renderer.scene.camera.projection_matrix,
     )
 
-    vbo = renderer.context.buffer(attributes.tobytes())
-    vao = renderer.context.simple_vertex_array(
-        fill_shader.shader_program,
-        vbo,
-        *attributes.dtype.names,
-    )
-    vao.render()
-    vao.release()
-    vbo.release()
+    vertex_buffers = renderer.get_vertex_buffers(id(mobjects[0]), "fill")
+    vertex_buffers.render(fill_shader.shader_program, attributes)
 
 
 def triangulate_mobject(mob):
@@ -282,11 +275,6 @@ def render_mobject_strokes_with_matrix(renderer, model_matrix, mobjects):
     shader.set_uniform("u_projection_matrix", renderer.scene.camera.projection_matrix)
     shader.set_uniform("manim_unit_normal", tuple(-mobjects[0].unit_normal[0]))
 
-    vbo = renderer.context.buffer(stroke_data.tobytes())
-    vao = renderer.context.simple_vertex_array(
-        shader.shader_program, vbo, *stroke_data.dtype.names
-    )
+    vertex_buffers = renderer.get_vertex_buffers(id(mobjects[0]), "stroke")
     renderer.frame_buffer_object.use()
-    vao.render()
-    vao.release()
-    vbo.release()
+    vertex_buffers.render(shader.shader_program, stroke_data)
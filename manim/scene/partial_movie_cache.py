@@ -0,0 +1,405 @@
+"""Bookkeeping of the partial movie files cached between renders."""
+
+from __future__ import annotations
+
+__all__ = [
+    "PartialMovieCacheIndex",
+    "PartialMovieCacheBackend",
+    "LocalCacheBackend",
+    "SharedDirectoryCacheBackend",
+    "HTTPCacheBackend",
+    "get_cache_backend",
+]
+
+import os
+import shutil
+import sqlite3
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import BinaryIO
+
+from manim.typing import StrPath
+
+from .. import logger
+
+
+class PartialMovieCacheIndex:
+    """A persistent index of the partial movie files stored in a directory.
+
+    For every cached partial movie file, the index records its size, the last
+    time it was used to build a movie and the scene which rendered it. This
+    allows to look up cached files and to evict the least recently used ones
+    without listing the directory and calling ``stat()`` on every file in it.
+
+    The index is an SQLite database living next to the partial movie files,
+    so that it can safely be shared by several processes rendering into the
+    same directory.
+
+    Parameters
+    ----------
+    directory
+        The directory holding the partial movie files.
+    scene_name
+        The name of the scene whose files are recorded by this instance.
+    """
+
+    #: Name of the database file, created in the partial movie directory.
+    file_name = "partial_movie_cache.db"
+
+    def __init__(self, directory: StrPath, scene_name: str = "") -> None:
+        self.directory = Path(directory)
+        self.scene_name = str(scene_name)
+        self._connection: sqlite3.Connection | None = None
+        self._connection_pid: int | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The connection to the index database, opened on first use.
+
+        SQLite connections cannot be shared with forked processes, hence a
+        new connection is opened by every process using the index.
+        """
+        if self._connection is None or self._connection_pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.directory / self.file_name,
+                timeout=30,
+                isolation_level=None,
+            )
+            self._connection_pid = os.getpid()
+            self._create_tables()
+        return self._connection
+
+    def _create_tables(self) -> None:
+        with self._connection:
+            self._connection.execute("BEGIN IMMEDIATE")
+            created = not self._connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'partial_movies'"
+            ).fetchone()
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS partial_movies ("
+                "name TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+                "last_used REAL NOT NULL, scene TEXT NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS partial_movies_by_last_used "
+                "ON partial_movies (last_used)"
+            )
+            if created:
+                # Files cached before the index existed are recorded once.
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO partial_movies VALUES (?, ?, ?, ?)",
+                    (
+                        (path.name, stat.st_size, stat.st_atime, "")
+                        for path, stat in self._scan_directory()
+                    ),
+                )
+
+    def _scan_directory(self) -> Iterable[tuple[Path, os.stat_result]]:
+        for path in self.directory.iterdir():
+            if path.name.startswith(self.file_name) or not path.is_file():
+                continue
+            if path.name == "partial_movie_file_list.txt":
+                continue
+            yield path, path.stat()
+
+    def close(self) -> None:
+        """Close the connection to the index database, if any."""
+        if self._connection is not None and self._connection_pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+        self._connection_pid = None
+
+    def add(self, file_path: StrPath) -> None:
+        """Record a newly written partial movie file.
+
+        Parameters
+        ----------
+        file_path
+            The path of the partial movie file.
+        """
+        file_path = Path(file_path)
+        self.connection.execute(
+            "INSERT OR REPLACE INTO partial_movies VALUES (?, ?, ?, ?)",
+            (file_path.name, file_path.stat().st_size, time.time(), self.scene_name),
+        )
+
+    def contains(self, file_name: str) -> bool:
+        """Check whether a partial movie file is cached.
+
+        Entries whose file has been removed behind the back of the index are
+        dropped, and files missing from the index are recorded.
+
+        Parameters
+        ----------
+        file_name
+            The name of the partial movie file, relative to the directory.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the file is cached.
+        """
+        indexed = self.connection.execute(
+            "SELECT 1 FROM partial_movies WHERE name = ?", (file_name,)
+        ).fetchone()
+        exists = (self.directory / file_name).exists()
+        if indexed and not exists:
+            self.connection.execute(
+                "DELETE FROM partial_movies WHERE name = ?", (file_name,)
+            )
+        elif exists and not indexed:
+            self.add(self.directory / file_name)
+        return exists
+
+    def touch(self, file_paths: Iterable[StrPath]) -> None:
+        """Mark partial movie files as used now.
+
+        Parameters
+        ----------
+        file_paths
+            The paths of the partial movie files.
+        """
+        now = time.time()
+        with self.connection:
+            self.connection.execute("BEGIN")
+            self.connection.executemany(
+                "UPDATE partial_movies SET last_used = ? WHERE name = ?",
+                ((now, Path(file_path).name) for file_path in file_paths),
+            )
+
+    def usage(self) -> tuple[int, int]:
+        """Return the number of cached files and their total size in bytes."""
+        count, size = self.connection.execute(
+            "SELECT COUNT(*), TOTAL(size) FROM partial_movies"
+        ).fetchone()
+        return count, int(size)
+
+    def evict(self, max_files: float, max_bytes: float) -> tuple[int, int]:
+        """Remove the least recently used files until the cache fits in the
+        given bounds.
+
+        Parameters
+        ----------
+        max_files
+            The maximal number of cached files, or infinity.
+        max_bytes
+            The maximal total size of the cached files in bytes, or infinity.
+
+        Returns
+        -------
+        tuple[:class:`int`, :class:`int`]
+            The number of removed files and their total size in bytes.
+        """
+        with self.connection:
+            self.connection.execute("BEGIN IMMEDIATE")
+            count, size = self.usage()
+            to_evict = []
+            if count > max_files or size > max_bytes:
+                for name, file_size in self.connection.execute(
+                    "SELECT name, size FROM partial_movies ORDER BY last_used"
+                ):
+                    if count <= max_files and size <= max_bytes:
+                        break
+                    to_evict.append((name, file_size))
+                    count -= 1
+                    size -= file_size
+                self.connection.executemany(
+                    "DELETE FROM partial_movies WHERE name = ?",
+                    ((name,) for name, _ in to_evict),
+                )
+        for name, _ in to_evict:
+            (self.directory / name).unlink(missing_ok=True)
+        return len(to_evict), sum(file_size for _, file_size in to_evict)
+
+    def clear(self) -> int:
+        """Remove every cached partial movie file.
+
+        Returns
+        -------
+        :class:`int`
+            The number of removed files.
+        """
+        with self.connection:
+            self.connection.execute("BEGIN IMMEDIATE")
+            self.connection.execute("DELETE FROM partial_movies")
+        deleted = 0
+        for path, _ in self._scan_directory():
+            path.unlink()
+            deleted += 1
+        return deleted
+
+
+class PartialMovieCacheBackend(ABC):
+    """A store through which partial movie files are shared between machines.
+
+    The partial movie files rendered locally are always cached in the partial
+    movie directory. A backend is only asked for the files missing there, and
+    is handed every newly rendered file, so that render nodes using the same
+    backend never render an identical segment twice.
+
+    Files are identified by keys of the form ``"<resolution>/<file name>"``.
+    Subclasses implement :meth:`fetch` and :meth:`store`.
+    """
+
+    @abstractmethod
+    def fetch(self, key: str, destination: Path) -> bool:
+        """Copy the file stored under ``key`` to ``destination``.
+
+        Parameters
+        ----------
+        key
+            The key of the partial movie file.
+        destination
+            The local path to copy the file to.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the backend holds the file.
+        """
+
+    @abstractmethod
+    def store(self, key: str, file_path: Path) -> None:
+        """Make the local file ``file_path`` available under ``key``.
+
+        Parameters
+        ----------
+        key
+            The key of the partial movie file.
+        file_path
+            The local path of the file.
+        """
+
+
+class LocalCacheBackend(PartialMovieCacheBackend):
+    """The default backend, which does not share partial movie files."""
+
+    def fetch(self, key: str, destination: Path) -> bool:
+        return False
+
+    def store(self, key: str, file_path: Path) -> None:
+        pass
+
+
+def _write_atomically(source_file: BinaryIO, destination: Path) -> None:
+    # Readers running concurrently must never see a partially copied file.
+    with NamedTemporaryFile(
+        dir=destination.parent, prefix=f".{destination.name}", delete=False
+    ) as temporary_file:
+        temporary_path = Path(temporary_file.name)
+        try:
+            shutil.copyfileobj(source_file, temporary_file)
+        except BaseException:
+            temporary_file.close()
+            temporary_path.unlink(missing_ok=True)
+            raise
+    try:
+        temporary_path.replace(destination)
+    except BaseException:
+        temporary_path.unlink(missing_ok=True)
+        raise
+
+
+def _copy_atomically(source: Path, destination: Path) -> None:
+    with source.open("rb") as source_file:
+        _write_atomically(source_file, destination)
+
+
+class SharedDirectoryCacheBackend(PartialMovieCacheBackend):
+    """A backend storing partial movie files in a directory, typically
+    mounted over the network on every render node.
+
+    Parameters
+    ----------
+    directory
+        The shared directory.
+    """
+
+    def __init__(self, directory: StrPath) -> None:
+        self.directory = Path(directory)
+
+    def fetch(self, key: str, destination: Path) -> bool:
+        source = self.directory / key
+        if not source.is_file():
+            return False
+        _copy_atomically(source, destination)
+        return True
+
+    def store(self, key: str, file_path: Path) -> None:
+        destination = self.directory / key
+        if destination.exists():
+            return
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        _copy_atomically(file_path, destination)
+
+
+class HTTPCacheBackend(PartialMovieCacheBackend):
+    """A backend storing partial movie files on an HTTP server.
+
+    Files are downloaded with ``GET <url>/<key>`` and uploaded with
+    ``PUT <url>/<key>``, which is understood by most artifact stores and
+    WebDAV servers.
+
+    Parameters
+    ----------
+    url
+        The base URL of the store.
+    timeout
+        The timeout of every request, in seconds.
+    """
+
+    def __init__(self, url: str, timeout: float = 30) -> None:
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def _url(self, key: str) -> str:
+        return f"{self.url}/{urllib.parse.quote(key)}"
+
+    def fetch(self, key: str, destination: Path) -> bool:
+        try:
+            response = urllib.request.urlopen(self._url(key), timeout=self.timeout)
+        except urllib.error.HTTPError as error:
+            if error.code == 404:
+                return False
+            raise
+        with response:
+            _write_atomically(response, destination)
+        return True
+
+    def store(self, key: str, file_path: Path) -> None:
+        request = urllib.request.Request(
+            self._url(key),
+            data=file_path.read_bytes(),
+            method="PUT",
+            headers={"Content-Type": "application/octet-stream"},
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+
+def get_cache_backend(location: str) -> PartialMovieCacheBackend:
+    """Return the backend sharing partial movie files through ``location``.
+
+    Parameters
+    ----------
+    location
+        An ``http://`` or ``https://`` URL, a directory, or an empty string
+        to not share partial movie files.
+
+    Returns
+    -------
+    :class:`PartialMovieCacheBackend`
+        The corresponding backend.
+    """
+    if not location:
+        return LocalCacheBackend()
+    if urllib.parse.urlparse(location).scheme in ("http", "https"):
+        return HTTPCacheBackend(location)
+    logger.debug("Sharing partial movie files through %s", location)
+    return SharedDirectoryCacheBackend(location)
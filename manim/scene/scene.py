@@ -10,6 +10,7 @@ __all__ = ["Scene"]
 
 import copy
 import datetime
+import heapq
 import inspect
 import platform
 import random
@@ -51,6 +52,7 @@ from ..utils.family import extract_mobject_family_members
 from ..utils.family_ops import restructure_list_to_exclude_certain_family_members
 from ..utils.file_ops import open_media_file
 from ..utils.iterables import list_difference_update, list_update
+from ..utils.profiling import profiler
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Sequence
@@ -207,20 +209,35 @@ class Scene:
         preview
             If true, opens scene in a file viewer.
         """
-        self.setup()
+        if config.profile:
+            profiler.start(str(self))
         try:
-            self.construct()
-        except EndSceneEarlyException:
-            pass
-        except RerunSceneException:
-            self.remove(*self.mobjects)
-            # TODO: The CairoRenderer does not have the method clear_screen()
-            self.renderer.clear_screen()  # type: ignore[union-attr]
-            self.renderer.num_plays = 0
-            return True
-        self.tear_down()
-        # We have to reset these settings in case of multiple renders.
-        self.renderer.scene_finished(self)
+            self.setup()
+            try:
+                self.construct()
+            except EndSceneEarlyException:
+                pass
+            except RerunSceneException:
+                self.remove(*self.mobjects)
+                # TODO: The CairoRenderer does not have the method clear_screen()
+                self.renderer.clear_screen()  # type: ignore[union-attr]
+                self.renderer.num_plays = 0
+                return True
+            except BaseException:
+                if isinstance(self.renderer, CairoRenderer):
+                    self.renderer.terminate_segment_processes()
+                raise
+            self.tear_down()
+            # We have to reset these settings in case of multiple renders.
+            self.renderer.scene_finished(self)
+            if profiler.enabled:
+                profiler.stop()
+                self.renderer.file_writer.save_profile()
+        finally:
+            # The profiler must not keep recording later renders of the same
+            # process when this one fails.
+            if profiler.enabled:
+                profiler.stop()
 
         # Show info only if animations are rendered or to get image
         if (
@@ -330,9 +347,76 @@ class Scene:
         dt
             Change in time between updates. Defaults (mostly) to 1/frames_per_second
         """
-        for mobj in self.mobjects:
+        for mobj in self.get_mobjects_to_update():
             mobj.update(dt)
 
+    def get_mobjects_to_update(self) -> list[Mobject]:
+        """Return the mobjects of the scene updated in every frame, in the
+        order of their updates.
+
+        Mobjects without any updater in their family are skipped. The others
+        are updated in the order in which they were added to the scene, except
+        that mobjects whose updaters depend on other mobjects (see the
+        ``depends_on`` parameter of :meth:`.Mobject.add_updater`) are updated
+        after the mobjects containing these.
+
+        Returns
+        -------
+        list
+            The mobjects to update.
+
+        Raises
+        ------
+        ValueError
+            If the dependencies of the updaters are circular.
+        """
+        mobjects = [
+            mob
+            for mob in self.mobjects
+            if not isinstance(mob, Mobject) or mob.has_family_updaters()
+        ]
+        dependencies = [
+            mob.get_family_updater_dependencies() if isinstance(mob, Mobject) else []
+            for mob in mobjects
+        ]
+        if not any(dependencies):
+            return mobjects
+
+        # Sort the mobjects topologically, keeping the order of the scene
+        # whenever the dependencies allow it.
+        index_of_family_member = {}
+        for i, mob in enumerate(mobjects):
+            for member in mob.get_family():
+                index_of_family_member.setdefault(id(member), i)
+        dependents: list[set[int]] = [set() for _ in mobjects]
+        dependency_counts = [0] * len(mobjects)
+        for i, mob_dependencies in enumerate(dependencies):
+            for dependency in mob_dependencies:
+                j = index_of_family_member.get(id(dependency))
+                # Dependencies on mobjects without updaters or within the
+                # same family do not constrain the order.
+                if j is not None and j != i and i not in dependents[j]:
+                    dependents[j].add(i)
+                    dependency_counts[i] += 1
+        ready = [i for i, count in enumerate(dependency_counts) if count == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            i = heapq.heappop(ready)
+            order.append(i)
+            for j in dependents[i]:
+                dependency_counts[j] -= 1
+                if dependency_counts[j] == 0:
+                    heapq.heappush(ready, j)
+        if len(order) < len(mobjects):
+            circular = [
+                mobjects[i] for i, count in enumerate(dependency_counts) if count
+            ]
+            raise ValueError(
+                f"The updaters of {circular} have circular dependencies.",
+            )
+        return [mobjects[i] for i in order]
+
     def update_meshes(self, dt: float) -> None:
         for obj in self.meshes:
             for mesh in obj.get_family():  # type: ignore[no-untyped-call]
@@ -855,6 +939,46 @@ class Scene:
                 return mobjects[i:]
         return []
 
+    def get_changing_mobjects(self, *animations: Animation) -> list[Mobject]:
+        """
+        Gets the family members of the scene which may change at every frame
+        of the passed animation(s).
+
+        Unlike :meth:`get_moving_mobjects`, this does not include the mobjects
+        which are only drawn above changing ones. All family members are
+        returned if the scene or one of its mobjects has updaters, which may
+        move any mobject, or if one of the animations may change other
+        mobjects than its own, such as :class:`~.UpdateFromFunc` or an
+        animation defined outside of manim.
+
+        Parameters
+        ----------
+        *animations
+            The animations to check for changing mobjects.
+
+        Returns
+        ------
+        list
+            The list of the family members of the animated mobjects and of
+            the foreground mobjects.
+        """
+        mobjects = self.get_mobject_family_members()
+        if self.updaters or any(mob.has_family_updaters() for mob in mobjects):
+            return mobjects
+        animation_mobjects: list[Mobject] = []
+        for anim in animations:
+            animated_mobjects = _get_animated_mobjects(anim)
+            if animated_mobjects is None:
+                return mobjects
+            animation_mobjects.extend(animated_mobjects)
+        changing: set[Mobject] = set()
+        for mob in mobjects:
+            if mob in changing:
+                continue
+            if mob in animation_mobjects or mob in self.foreground_mobjects:
+                changing.update(mob.get_family())
+        return [mob for mob in mobjects if mob in changing]
+
     def get_moving_and_static_mobjects(
         self, animations: Iterable[Animation]
     ) -> tuple[list[Mobject], list[Mobject]]:
@@ -1119,7 +1243,8 @@ class Scene:
             return
 
         start_time = self.time
-        self.renderer.play(self, *args, **kwargs)
+        with profiler.span("play", "play", num_plays=self.renderer.num_plays):
+            self.renderer.play(self, *args, **kwargs)
         run_time = self.time - start_time
         if subcaption:
             if subcaption_duration is None:
@@ -1294,9 +1419,10 @@ class Scene:
             self.duration,
         )
         for t in self.time_progression:
-            self.update_to_time(t)
-            if not skip_rendering and not self.skip_animation_preview:
-                self.renderer.render(self, t, self.moving_mobjects)
+            with profiler.span("frame", "frame", t=t):
+                self.update_to_time(t)
+                if not skip_rendering and not self.skip_animation_preview:
+                    self.renderer.render(self, t, self.moving_mobjects)
             if self.stop_condition is not None and self.stop_condition():
                 self.time_progression.close()
                 break
@@ -1547,13 +1673,15 @@ class Scene:
         dt = t - self.last_t
         self.last_t = t
         assert self.animations is not None
-        for animation in self.animations:
-            animation.update_mobjects(dt)
-            alpha = t / animation.run_time
-            animation.interpolate(alpha)
-        self.update_mobjects(dt)
-        self.update_meshes(dt)
-        self.update_self(dt)
+        with profiler.span("interpolate", "frame"):
+            for animation in self.animations:
+                animation.update_mobjects(dt)
+                alpha = t / animation.run_time
+                animation.interpolate(alpha)
+        with profiler.span("updaters", "frame"):
+            self.update_mobjects(dt)
+            self.update_meshes(dt)
+            self.update_self(dt)
 
     def add_subcaption(
         self, content: str, duration: float = 1, offset: float = 0
@@ -1805,3 +1933,43 @@ class Scene:
     def on_mouse_press(self, point: Point3D, button: int, modifiers: int) -> None:
         for func in self.mouse_press_callbacks:
             func()
+
+
+def _get_animated_mobjects(animation: Animation) -> list[Mobject] | None:
+    """Return the mobjects whose families an animation changes at every frame,
+    or ``None`` if it may change any mobject.
+
+    Only the animations built into manim are trusted to change nothing but
+    their :attr:`~.Animation.mobject`, or the mobjects of their subanimations.
+    Animations calling functions given by the user, such as
+    :class:`~.UpdateFromFunc`, and animations computing their frames with
+    methods defined outside of manim may move any other mobject.
+    """
+    from ..animation.composition import AnimationGroup
+    from ..animation.speedmodifier import ChangeSpeed
+    from ..animation.updaters.update import UpdateFromFunc
+
+    cls = type(animation)
+    if isinstance(animation, UpdateFromFunc) or any(
+        not method.__module__.startswith("manim.")
+        for method in (
+            cls.interpolate,
+            cls.interpolate_mobject,
+            cls.interpolate_submobject,
+            cls.update_mobjects,
+        )
+    ):
+        return None
+    if isinstance(animation, AnimationGroup):
+        subanimations = animation.animations
+    elif isinstance(animation, ChangeSpeed):
+        subanimations = [animation.anim]
+    else:
+        return [animation.mobject]
+    mobjects = [animation.mobject]
+    for anim in subanimations:
+        animated_mobjects = _get_animated_mobjects(anim)
+        if animated_mobjects is None:
+            return None
+        mobjects.extend(animated_mobjects)
+    return mobjects
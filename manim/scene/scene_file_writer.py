@@ -8,7 +8,7 @@ import json
 import shutil
 from fractions import Fraction
 from pathlib import Path
-from queue import Queue
+from queue import Empty, Queue
 from tempfile import NamedTemporaryFile
 from threading import Thread
 from typing import TYPE_CHECKING, Any
@@ -31,10 +31,15 @@ from ..utils.file_ops import (
     guarantee_existence,
     is_gif_format,
     is_png_format,
-    modify_atime,
     write_to_movie,
 )
+from ..utils.profiling import profiler
 from ..utils.sounds import get_full_sound_file_path
+from .partial_movie_cache import (
+    PartialMovieCacheBackend,
+    PartialMovieCacheIndex,
+    get_cache_backend,
+)
 from .section import DefaultSectionType, Section
 
 if TYPE_CHECKING:
@@ -100,10 +105,17 @@ class SceneFileWriter:
             The file-type extension of the outputted video.
         "partial_movie_files"
             List of all the partial-movie files.
+        "cache_backend" (:class:`.PartialMovieCacheBackend`)
+            The store through which partial-movie files are shared with
+            other machines, chosen from ``config.shared_cache``.
 
     """
 
     force_output_as_scene_name = False
+    #: Number of preallocated frame buffers which are shared between the
+    #: renderer and the encoding thread. Rendering blocks as soon as all of
+    #: them hold frames waiting to be encoded.
+    frame_buffer_count = 8
 
     def __init__(
         self,
@@ -115,6 +127,7 @@ class SceneFileWriter:
         self.init_output_directories(scene_name)
         self.init_audio()
         self.frame_count = 0
+        self.frame_buffers: list[PixelArray | None] = [None] * self.frame_buffer_count
         self.partial_movie_files: list[str] = []
         self.subcaptions: list[srt.Subtitle] = []
         self.sections: list[Section] = []
@@ -194,6 +207,12 @@ class SceneFileWriter:
                     module_name=module_name,
                 ),
             )
+            self.cache_index = PartialMovieCacheIndex(
+                self.partial_movie_directory, str(scene_name)
+            )
+            self.cache_backend: PartialMovieCacheBackend = get_cache_backend(
+                config.shared_cache
+            )
 
             if config["log_to_file"]:
                 log_dir = guarantee_existence(config.get_dir("log_dir"))
@@ -413,27 +432,73 @@ class SceneFileWriter:
             self.close_partial_movie_stream()
 
     def listen_and_write(self):
-        """For internal use only: blocks until new frame is available on the queue."""
-        while True:
-            num_frames, frame_data = self.queue.get()
-            if frame_data is None:
-                break
+        """For internal use only: blocks until new frame is available on the queue.
 
-            self.encode_and_write_frame(frame_data, num_frames)
+        An error raised while encoding stops the thread and is stored in
+        :attr:`writer_error`, to be raised again in the rendering thread.
+        """
+        try:
+            while True:
+                num_frames, buffer_index = self.queue.get()
+                if buffer_index is None:
+                    break
+
+                with profiler.span("encode", "encode", num_frames=num_frames):
+                    self.encode_and_write_frame(
+                        self.frame_buffers[buffer_index], num_frames
+                    )
+                self.free_frame_buffers.put(buffer_index)
+        except BaseException as error:
+            self.writer_error = error
+
+    def raise_writer_error(self) -> None:
+        """For internal use only: raises the error which stopped the encoding
+        thread, if any.
+        """
+        if self.writer_error is not None:
+            raise self.writer_error
+        if not self.writer_thread.is_alive():
+            raise RuntimeError("The encoding thread stopped unexpectedly.")
+
+    def get_free_frame_buffer(self) -> int:
+        """For internal use only: waits until the encoding thread is done with
+        one of the frame buffers and returns its index.
+        """
+        while True:
+            try:
+                return self.free_frame_buffers.get(timeout=0.1)
+            except Empty:
+                self.raise_writer_error()
+
+    def convert_frame(self, frame: PixelArray) -> av.VideoFrame:
+        """For internal use only: converts a frame in ``np.ndarray`` format to
+        the size and pixel format of the video stream.
+        """
+        return av.VideoFrame.from_ndarray(frame, format="rgba").reformat(
+            width=self.video_stream.width,
+            height=self.video_stream.height,
+            format=self.video_stream.pix_fmt,
+        )
 
     def encode_and_write_frame(self, frame: PixelArray, num_frames: int) -> None:
         """
         For internal use only: takes a given frame in ``np.ndarray`` format and
-        write it to the stream
+        write it ``num_frames`` times to the stream.
+
+        The frame is converted only once, so that a frame held for a long time,
+        e.g. by a static :meth:`~.Scene.wait`, is not converted again for every
+        repetition. The encoder receives the same converted frame with the
+        timestamp of each repetition, and encodes the repetitions as frames
+        which only refer to the previous one.
         """
+        av_frame = self.convert_frame(frame)
         for _ in range(num_frames):
             # Notes: precomputing reusing packets does not work!
             # I.e., you cannot do `packets = encode(...)`
             # and reuse it, as it seems that `mux(...)`
             # consumes the packet.
-            # The same issue applies for `av_frame`,
-            # reusing it renders weird-looking frames.
-            av_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+            av_frame.pts = self.num_encoded_frames
+            self.num_encoded_frames += 1
             for packet in self.video_stream.encode(av_frame):
                 self.video_container.mux(packet)
 
@@ -458,8 +523,12 @@ class SceneFileWriter:
                 else frame_or_renderer
             )
 
-            msg = (num_frames, frame)
-            self.queue.put(msg)
+            with profiler.span("write_frame", "frame"):
+                # Wait until the encoding thread is done with one of the buffers,
+                # so that memory usage stays bounded when encoding is slow.
+                buffer_index = self.get_free_frame_buffer()
+                np.copyto(self.get_frame_buffer(buffer_index, frame), frame)
+                self.queue.put((num_frames, buffer_index))
 
         if is_png_format() and not config["dry_run"]:
             image: Image = (
@@ -476,6 +545,16 @@ class SceneFileWriter:
                 config["zero_pad"],
             )
 
+    def get_frame_buffer(self, index: int, frame: PixelArray) -> PixelArray:
+        """For internal use only: returns the preallocated frame buffer with the
+        given index, (re)allocating it if it cannot hold ``frame``.
+        """
+        buffer = self.frame_buffers[index]
+        if buffer is None or buffer.shape != frame.shape or buffer.dtype != frame.dtype:
+            buffer = np.empty(frame.shape, dtype=frame.dtype)
+            self.frame_buffers[index] = buffer
+        return buffer
+
     def output_image(self, image: Image.Image, target_dir, ext, zero_pad: bool):
         if zero_pad:
             image.save(f"{target_dir}{str(self.frame_count).zfill(zero_pad)}{ext}")
@@ -511,7 +590,8 @@ class SceneFileWriter:
         frame in the default image directory.
         """
         if write_to_movie():
-            self.combine_to_movie()
+            with profiler.span("combine", "finish"):
+                self.combine_to_movie()
             if config.save_sections:
                 self.combine_to_section_videos()
             if config["flush_cache"]:
@@ -565,9 +645,16 @@ class SceneFileWriter:
 
             self.video_container = video_container
             self.video_stream = stream
-
-            self.queue: Queue[tuple[int, PixelArray | None]] = Queue()
-            self.writer_thread = Thread(target=self.listen_and_write, args=())
+            self.num_encoded_frames = 0
+
+            self.queue: Queue[tuple[int, int | None]] = Queue()
+            self.free_frame_buffers: Queue[int] = Queue()
+            for buffer_index in range(self.frame_buffer_count):
+                self.free_frame_buffers.put(buffer_index)
+            self.writer_error: BaseException | None = None
+            self.writer_thread = Thread(
+                target=self.listen_and_write, args=(), name="encoder"
+            )
             self.writer_thread.start()
 
     def close_partial_movie_stream(self) -> None:
@@ -579,11 +666,15 @@ class SceneFileWriter:
         """
         self.queue.put((-1, None))
         self.writer_thread.join()
+        if self.writer_error is not None:
+            raise self.writer_error
 
         for packet in self.video_stream.encode():
             self.video_container.mux(packet)
 
         self.video_container.close()
+        self.cache_index.add(self.partial_movie_file_path)
+        self.share_partial_movie_file(Path(self.partial_movie_file_path))
 
         logger.info(
             f"Animation {self.renderer.num_plays} : Partial movie file written in %(path)s",
@@ -605,11 +696,61 @@ class SceneFileWriter:
         """
         if not hasattr(self, "partial_movie_directory") or not write_to_movie():
             return False
-        path = (
-            self.partial_movie_directory
-            / f"{hash_invocation}{config['movie_file_extension']}"
-        )
-        return path.exists()
+        file_name = f"{hash_invocation}{config['movie_file_extension']}"
+        if self.cache_index.contains(file_name):
+            return True
+        return self.fetch_shared_partial_movie_file(file_name)
+
+    def get_shared_cache_key(self, file_name: str) -> str:
+        """Return the key identifying a partial movie file in the cache backend.
+
+        The hash of an animation does not depend on the resolution and frame
+        rate, which are therefore part of the key.
+        """
+        return f"{self.get_resolution_directory()}/{file_name}"
+
+    def fetch_shared_partial_movie_file(self, file_name: str) -> bool:
+        """Try to copy a partial movie file rendered elsewhere from the cache
+        backend into the partial movie directory.
+
+        Parameters
+        ----------
+        file_name
+            The name of the partial movie file.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the file could be fetched.
+        """
+        path = self.partial_movie_directory / file_name
+        try:
+            fetched = self.cache_backend.fetch(
+                self.get_shared_cache_key(file_name), path
+            )
+        except OSError as error:
+            logger.warning(
+                f"Could not fetch {file_name} from the shared cache: {error}"
+            )
+            return False
+        if fetched:
+            self.cache_index.add(path)
+        return fetched
+
+    def share_partial_movie_file(self, path: Path) -> None:
+        """Hand a newly rendered partial movie file to the cache backend.
+
+        Parameters
+        ----------
+        path
+            The path of the partial movie file.
+        """
+        if path.name.startswith("uncached_"):
+            return
+        try:
+            self.cache_backend.store(self.get_shared_cache_key(path.name), path)
+        except OSError as error:
+            logger.warning(f"Could not store {path.name} in the shared cache: {error}")
 
     def combine_files(
         self,
@@ -816,9 +957,8 @@ class SceneFileWriter:
 
         self.print_file_ready_message(str(movie_file_path))
         if write_to_movie():
-            for file_path in partial_movie_files:
-                # We have to modify the accessed time so if we have to clean the cache we remove the one used the longest.
-                modify_atime(file_path)
+            # Record the use of the files so that if we have to clean the cache we remove the ones used the longest ago.
+            self.cache_index.touch(partial_movie_files)
 
     def combine_to_section_videos(self) -> None:
         """Concatenate partial movie files for each section."""
@@ -837,41 +977,42 @@ class SceneFileWriter:
             json.dump(sections_index, file, indent=4)
 
     def clean_cache(self):
-        """Will clean the cache by removing the oldest partial_movie_files."""
-        cached_partial_movies = [
-            (self.partial_movie_directory / file_name)
-            for file_name in self.partial_movie_directory.iterdir()
-            if file_name != "partial_movie_file_list.txt"
-        ]
-        if len(cached_partial_movies) > config["max_files_cached"]:
-            number_files_to_delete = (
-                len(cached_partial_movies) - config["max_files_cached"]
-            )
-            oldest_files_to_delete = sorted(
-                cached_partial_movies,
-                key=lambda path: path.stat().st_atime,
-            )[:number_files_to_delete]
-            for file_to_delete in oldest_files_to_delete:
-                file_to_delete.unlink()
+        """Will clean the cache by removing the least recently used partial_movie_files.
+
+        The cache is bounded by both ``config.max_files_cached`` and
+        ``config.max_bytes_cached``. Sizes and usage times are read from the
+        cache index, so that the partial movie directory doesn't have to be
+        scanned.
+        """
+        number_files_to_delete, number_bytes_deleted = self.cache_index.evict(
+            config["max_files_cached"], config["max_bytes_cached"]
+        )
+        if number_files_to_delete:
             logger.info(
-                f"The partial movie directory is full (> {config['max_files_cached']} files). Therefore, manim has removed the {number_files_to_delete} oldest file(s)."
-                " You can change this behaviour by changing max_files_cached in config.",
+                f"The partial movie directory is full (> {config['max_files_cached']} files or > {config['max_bytes_cached']} bytes). Therefore, manim has removed the {number_files_to_delete} oldest file(s) ({number_bytes_deleted} bytes)."
+                " You can change this behaviour by changing max_files_cached or max_bytes_cached in config.",
             )
 
     def flush_cache_directory(self):
         """Delete all the cached partial movie files"""
-        cached_partial_movies = [
-            self.partial_movie_directory / file_name
-            for file_name in self.partial_movie_directory.iterdir()
-            if file_name != "partial_movie_file_list.txt"
-        ]
-        for f in cached_partial_movies:
-            f.unlink()
+        number_files_deleted = self.cache_index.clear()
         logger.info(
-            f"Cache flushed. {len(cached_partial_movies)} file(s) deleted in %(par_dir)s.",
+            f"Cache flushed. {number_files_deleted} file(s) deleted in %(par_dir)s.",
             {"par_dir": self.partial_movie_directory},
         )
 
+    def save_profile(self) -> None:
+        """Writes the timings recorded with ``--profile`` next to the output
+        file, with the extension ``.trace.json``.
+        """
+        if config["dry_run"]:
+            return
+        if write_to_movie():
+            output_path = Path(self.movie_file_path)
+        else:
+            output_path = Path(self.image_file_path)
+        profiler.save(output_path.with_suffix(".trace.json"))
+
     def write_subcaption_file(self):
         """Writes the subcaption file."""
         if config.output_file is None:
@@ -4,17 +4,20 @@ from __future__ import annotations
 
 import collections
 import copy
+import functools
+import hashlib
 import inspect
 import json
 import typing
 import zlib
 from time import perf_counter
-from types import FunctionType, MappingProxyType, MethodType, ModuleType
+from types import CodeType, FunctionType, MappingProxyType, MethodType, ModuleType
 from typing import Any
 
 import numpy as np
 
 from manim._config import config, logger
+from manim.utils.profiling import profiler
 
 if typing.TYPE_CHECKING:
     from manim.animation.animation import Animation
@@ -32,6 +35,12 @@ KEYS_TO_FILTER_OUT = {
     "background",
     "pixel_array",
     "pixel_array_to_cairo_context",
+    "cairo_path_cache",
+    "_parents",
+    "_family",
+    "_family_updater_info",
+    "_interpolation_plan",
+    "_point_buffer",
 }
 
 
@@ -322,6 +331,150 @@ def get_json(obj: dict):
     return json.dumps(obj, cls=_CustomEncoder)
 
 
+@functools.cache
+def _get_source_code(code: CodeType) -> str:
+    """Return the source code of a code object, or an empty string if it is not
+    available. Code objects are immutable, so their source is looked up once.
+    """
+    try:
+        return inspect.getsource(code)
+    except (OSError, TypeError):
+        # See the corresponding note in _CustomEncoder.default.
+        return ""
+
+
+class _StructuralHasher:
+    """Computes content digests of arbitrary object graphs.
+
+    Contrary to :func:`get_json`, nothing is serialized to text: NumPy arrays
+    contribute their raw buffers in full (they are never truncated), and
+    containers and objects are combined Merkle-style, i.e. the digest of an
+    object is computed from the digests of its attributes.  The digest of every
+    object is memoized for the lifetime of the hasher, so that an object which is
+    referenced several times (for instance a mobject which is both in the scene
+    and animated) is only processed once.
+    """
+
+    DIGEST_SIZE = 8
+
+    def __init__(self, placeholders: typing.Iterable[Any] = ()) -> None:
+        self._digests: dict[int, bytes] = {}
+        self._in_progress: dict[int, int] = {}
+        # Keep the hashed objects alive, so that their ids cannot be reused.
+        self._hashed_objects: list[Any] = []
+        for obj in placeholders:
+            self._digests[id(obj)] = b"placeholder"
+            self._hashed_objects.append(obj)
+
+    def hexdigest(self, obj: Any) -> str:
+        """Return the digest of ``obj`` as a hexadecimal string."""
+        hasher = hashlib.blake2b(digest_size=self.DIGEST_SIZE)
+        self._update(hasher, obj)
+        return hasher.hexdigest()
+
+    def _update(self, hasher: hashlib._Hash, obj: Any) -> None:
+        if obj is None or isinstance(obj, (bool, int, float, complex, str)):
+            hasher.update(f"{type(obj).__name__}:{obj!r};".encode())
+            return
+        if isinstance(obj, np.ndarray):
+            self._update_with_array(hasher, obj)
+            return
+        if isinstance(obj, np.generic):
+            hasher.update(f"{obj.dtype.str}:{obj!r};".encode())
+            return
+        if isinstance(obj, (bytes, bytearray)):
+            hasher.update(b"bytes:%d;" % len(obj))
+            hasher.update(obj)
+            return
+
+        key = id(obj)
+        digest = self._digests.get(key)
+        if digest is None:
+            if key in self._in_progress:
+                # Circular reference: refer to the depth at which obj was met.
+                hasher.update(f"cycle:{self._in_progress[key]};".encode())
+                return
+            self._in_progress[key] = len(self._in_progress)
+            obj_hasher = hashlib.blake2b(digest_size=self.DIGEST_SIZE)
+            self._update_with_composite(obj_hasher, obj)
+            del self._in_progress[key]
+            digest = obj_hasher.digest()
+            self._digests[key] = digest
+            self._hashed_objects.append(obj)
+            if (
+                len(self._digests) == _Memoizer.THRESHOLD_WARNING
+                and not config.disable_caching_warning
+            ):
+                logger.warning(
+                    "It looks like the scene contains a lot of sub-mobjects. Caching "
+                    "is sometimes not suited to handle such large scenes, you might "
+                    "consider disabling caching with --disable_caching to potentially "
+                    "speed up the rendering process.",
+                )
+        hasher.update(b"ref:")
+        hasher.update(digest)
+
+    def _update_with_array(self, hasher: hashlib._Hash, array: np.ndarray) -> None:
+        hasher.update(f"ndarray:{array.dtype.str}:{array.shape};".encode())
+        if array.dtype.hasobject:
+            self._update(hasher, array.tolist())
+        else:
+            hasher.update(np.ascontiguousarray(array).data)
+
+    def _update_with_composite(self, hasher: hashlib._Hash, obj: Any) -> None:
+        if isinstance(obj, ModuleType):
+            hasher.update(f"module:{obj.__name__};".encode())
+        elif isinstance(obj, (list, tuple)):
+            hasher.update(f"{type(obj).__name__}:{len(obj)};".encode())
+            for item in obj:
+                self._update(hasher, item)
+        elif isinstance(obj, dict):
+            hasher.update(f"dict:{len(obj)};".encode())
+            for key, value in obj.items():
+                if key in KEYS_TO_FILTER_OUT:
+                    continue
+                self._update(hasher, key)
+                self._update(hasher, value)
+        elif isinstance(obj, (set, frozenset)):
+            # The iteration order of sets changes between runs.
+            item_digests = sorted(self.hexdigest(item) for item in obj)
+            hasher.update(f"set:{','.join(item_digests)};".encode())
+        elif isinstance(obj, (FunctionType, MethodType)):
+            self._update_with_function(hasher, obj)
+        elif isinstance(obj, type):
+            hasher.update(f"class:{obj.__module__}.{obj.__qualname__};".encode())
+        elif isinstance(obj, MappingProxyType):
+            hasher.update(b"MappingProxy;")
+        elif hasattr(obj, "__dict__"):
+            cls = type(obj)
+            hasher.update(f"{cls.__module__}.{cls.__qualname__};".encode())
+            self._update(hasher, obj.__dict__)
+        else:
+            hasher.update(str(type(obj)).encode())
+
+    def _update_with_function(
+        self, hasher: hashlib._Hash, func: FunctionType | MethodType
+    ) -> None:
+        code = getattr(getattr(func, "__func__", func), "__code__", None)
+        if code is None:
+            hasher.update(f"callable:{func!r};".encode())
+            return
+        hasher.update(_get_source_code(code).encode())
+        try:
+            closure_vars = inspect.getclosurevars(func)
+        except TypeError:
+            return
+        variables = {**closure_vars.globals, **closure_vars.nonlocals}
+        self._update(
+            hasher,
+            {
+                name: value
+                for name, value in variables.items()
+                if not isinstance(value, ModuleType)
+            },
+        )
+
+
 def get_hash_from_play_call(
     scene_object: Scene,
     camera_object: Camera | OpenGLCamera,
@@ -330,6 +483,9 @@ def get_hash_from_play_call(
 ) -> str:
     """Take the list of animations and a list of mobjects and output their hashes. This is meant to be used for `scene.play` function.
 
+    The hashes are structural digests computed by :class:`_StructuralHasher`,
+    so that the full content of every array is taken into account.
+
     Parameters
     -----------
     scene_object
@@ -351,18 +507,14 @@ def get_hash_from_play_call(
     """
     logger.debug("Hashing ...")
     t_start = perf_counter()
-    _Memoizer.mark_as_processed(scene_object)
-    camera_json = get_json(camera_object)
-    animations_list_json = [get_json(x) for x in sorted(animations_list, key=str)]
-    current_mobjects_list_json = [get_json(x) for x in current_mobjects_list]
-    hash_camera, hash_animations, hash_current_mobjects = (
-        zlib.crc32(repr(json_val).encode())
-        for json_val in [camera_json, animations_list_json, current_mobjects_list_json]
-    )
+    with profiler.span("hash", "play"):
+        # The scene is referenced by many closures (updaters, ...) but is not hashed.
+        hasher = _StructuralHasher(placeholders=[scene_object])
+        hash_camera = hasher.hexdigest(camera_object)
+        hash_animations = hasher.hexdigest(sorted(animations_list, key=str))
+        hash_current_mobjects = hasher.hexdigest(list(current_mobjects_list))
     hash_complete = f"{hash_camera}_{hash_animations}_{hash_current_mobjects}"
     t_end = perf_counter()
     logger.debug("Hashing done in %(time)s s.", {"time": str(t_end - t_start)[:8]})
-    # End of the hashing for the animation, reset all the memoize.
-    _Memoizer.reset_already_processed()
     logger.debug("Hash generated :  %(h)s", {"h": hash_complete})
     return hash_complete
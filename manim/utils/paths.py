@@ -25,6 +25,24 @@ if TYPE_CHECKING:
 STRAIGHT_PATH_THRESHOLD = 0.01
 
 
+def _pointwise(path_func: PathFuncType) -> PathFuncType:
+    """Mark a path function as moving every point independently of the others.
+
+    :class:`~.Transform` passes the points of all the members of a family to
+    such path functions at once. Custom path functions opt in by setting
+    their ``pointwise`` attribute to ``True``.
+    """
+    path_func.pointwise = True
+    return path_func
+
+
+def _is_pointwise(path_func: PathFuncType) -> bool:
+    """Return whether a path function moves every point independently of the
+    others, see :func:`_pointwise`.
+    """
+    return path_func is interpolate or getattr(path_func, "pointwise", False)
+
+
 def straight_path() -> PathFuncType:
     """Simplest path function. Each point in a set goes in a straight path toward its destination.
 
@@ -149,6 +167,9 @@ def path_along_circles(
             rot_matrix.T,
         )
 
+    if np.ndim(circles_centers) == 1:
+        # With a single center, the path of a point does not depend on its index.
+        _pointwise(path)
     return path
 
 
@@ -218,7 +239,7 @@ def path_along_arc(arc_angle: float, axis: Vector3D = OUT) -> PathFuncType:
         rot_matrix = rotation_matrix(alpha * arc_angle, unit_axis)
         return centers + np.dot(start_points - centers, rot_matrix.T)
 
-    return path
+    return _pointwise(path)
 
 
 def clockwise_path() -> PathFuncType:
@@ -375,4 +396,4 @@ def spiral_path(angle: float, axis: Vector3D = OUT) -> PathFuncType:
         rot_matrix = rotation_matrix((alpha - 1) * angle, unit_axis)
         return start_points + alpha * np.dot(end_points - start_points, rot_matrix.T)
 
-    return path
+    return _pointwise(path)
@@ -0,0 +1,227 @@
+"""Timing of the stages of the render pipeline, enabled with ``--profile``.
+
+While a scene is rendered with ``config.profile`` enabled, the render pipeline
+records how long each ``play()`` call, each frame and each of their stages
+(animation interpolation, updaters, capturing mobjects, encoding, hashing...)
+takes, as well as the time spent drawing each type of mobject. The recording
+is written next to the output file as a trace in the Chrome trace event
+format, which can be opened with ``chrome://tracing`` or https://ui.perfetto.dev.
+"""
+
+from __future__ import annotations
+
+__all__ = ["Profiler", "profiler"]
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from .. import logger
+
+
+class _NullSpan:
+    """Context manager returned while the profiler is disabled."""
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(
+        self, profiler: Profiler, name: str, category: str, args: dict[str, Any]
+    ) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info: object) -> None:
+        end = time.perf_counter_ns()
+        self.profiler.add_event(self.name, self.category, self.start, end, self.args)
+
+
+class _Measurement:
+    def __init__(self, totals: list[int]) -> None:
+        self.totals = totals
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.totals[0] += 1
+        self.totals[1] += time.perf_counter_ns() - self.start
+
+
+class Profiler:
+    """Records the time spent in the stages of the render pipeline.
+
+    The profiler is disabled until :meth:`start` is called; while disabled,
+    :meth:`span` and :meth:`measure` return a shared context manager doing
+    nothing, so that instrumented code paths stay cheap.
+
+    Examples
+    --------
+    ::
+
+        with profiler.span("capture", "frame"):
+            camera.capture_mobjects(mobjects)
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.name = ""
+        self.events: list[dict[str, Any]] = []
+        self.thread_names: dict[int, str] = {}
+        self.measurements: defaultdict[tuple[str, str], list[int]] = defaultdict(
+            lambda: [0, 0]
+        )
+        self.origin = 0
+
+    def start(self, name: str) -> None:
+        """Discard previous recordings and start recording.
+
+        Parameters
+        ----------
+        name
+            The name of what is profiled, usually a scene.
+        """
+        self.enabled = True
+        self.name = name
+        self.events = []
+        self.thread_names = {}
+        self.measurements.clear()
+        self.origin = time.perf_counter_ns()
+
+    def stop(self) -> None:
+        """Stop recording."""
+        self.enabled = False
+
+    def span(self, name: str, category: str, **args: Any) -> _Span | _NullSpan:
+        """Return a context manager recording the time spent in its block as
+        one event of the trace.
+
+        Parameters
+        ----------
+        name
+            The name of the event, e.g. the stage of the pipeline.
+        category
+            The category of the event, e.g. ``"frame"``.
+        args
+            Additional data stored with the event.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    def measure(self, category: str, name: str) -> _Measurement | _NullSpan:
+        """Return a context manager adding the time spent in its block to the
+        total of ``name``, without recording an individual event.
+
+        This is meant for very frequent operations, such as drawing one
+        mobject.
+
+        Parameters
+        ----------
+        category
+            The category of the measurement, e.g. ``"draw"``.
+        name
+            What is measured, e.g. the type of the drawn mobject.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Measurement(self.measurements[category, name])
+
+    def add_event(
+        self, name: str, category: str, start: int, end: int, args: dict[str, Any]
+    ) -> None:
+        """Record an event which started and ended at the given
+        :func:`time.perf_counter_ns` values.
+        """
+        thread_id = threading.get_ident()
+        if thread_id not in self.thread_names:
+            self.thread_names[thread_id] = threading.current_thread().name
+        # list.append is atomic, so the encoding thread can record events too.
+        self.events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self.origin) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": os.getpid(),
+                "tid": thread_id,
+                "args": args,
+            }
+        )
+
+    def get_trace(self) -> dict[str, Any]:
+        """Return the recording in the Chrome trace event format."""
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": thread_id,
+                "args": {"name": thread_name},
+            }
+            for thread_id, thread_name in self.thread_names.items()
+        ]
+        measurements: dict[str, dict[str, dict[str, float]]] = defaultdict(dict)
+        for (category, name), (count, total) in sorted(self.measurements.items()):
+            measurements[category][name] = {
+                "count": count,
+                "total_ms": total / 1e6,
+            }
+        return {
+            "traceEvents": metadata + self.events,
+            "displayTimeUnit": "ms",
+            "otherData": {"name": self.name, "measurements": measurements},
+        }
+
+    def get_stage_totals(self) -> dict[str, tuple[int, float]]:
+        """Return the number of events and their total duration in
+        milliseconds for each event name.
+        """
+        totals: dict[str, tuple[int, float]] = {}
+        for event in self.events:
+            count, duration = totals.get(event["name"], (0, 0.0))
+            totals[event["name"]] = (count + 1, duration + event["dur"] / 1000)
+        return totals
+
+    def save(self, file_path: Path) -> None:
+        """Write the recording to ``file_path`` and log a summary of it.
+
+        Parameters
+        ----------
+        file_path
+            The path of the trace file.
+        """
+        with file_path.open("w", encoding="utf-8") as file:
+            json.dump(self.get_trace(), file)
+        summary = ", ".join(
+            f"{name}: {duration:.1f} ms ({count}x)"
+            for name, (count, duration) in sorted(
+                self.get_stage_totals().items(), key=lambda item: -item[1][1]
+            )
+        )
+        logger.info(
+            "Profile written to %(path)s\n%(summary)s",
+            {"path": f"'{file_path}'", "summary": summary},
+        )
+
+
+#: The profiler used by the render pipeline.
+profiler = Profiler()
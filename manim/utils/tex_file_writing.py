@@ -8,20 +8,47 @@
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
+import os
 import re
 import subprocess
 import unicodedata
-from collections.abc import Generator, Iterable, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from pathlib import Path
 from re import Match
-from typing import Any
+from typing import Any, TypeVar
 
-from manim.utils.tex import TexTemplate
+from manim.utils.tex import TexTemplate, _texcode_for_environment
 
 from .. import config, logger
 
-__all__ = ["tex_to_svg_file"]
+__all__ = ["tex_to_svg_file", "tex_to_svg_files", "map_with_batched_tex"]
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+#: Maximal number of expressions compiled as pages of the same document.
+TEX_BATCH_SIZE = 64
+
+_STANDALONE_DOCUMENTCLASS = re.compile(
+    r"\\documentclass(?:\[(?P<options>[^\]]*)\])?\{standalone\}"
+)
+_BATCH_PAGE_ENVIRONMENT = "manimbatchpage"
+
+# The expressions requested while collecting them with map_with_batched_tex,
+# as (tex file, expression, environment, template) tuples.
+_pending_expressions: ContextVar[
+    list[tuple[Path, str, str | None, TexTemplate]] | None
+] = ContextVar("_pending_expressions", default=None)
+
+
+class _PendingTexExpression(Exception):
+    """Raised by :func:`tex_to_svg_file` while collecting expressions, when the
+    requested expression has not been compiled yet.
+    """
 
 
 def tex_hash(expression: Any) -> str:
@@ -61,6 +88,10 @@ def tex_to_svg_file(
     svg_file = tex_file.with_suffix(".svg")
     if svg_file.exists():
         return svg_file
+    pending = _pending_expressions.get()
+    if pending is not None:
+        pending.append((tex_file, expression, environment, tex_template))
+        raise _PendingTexExpression(expression)
 
     dvi_file = compile_tex(
         tex_file,
@@ -73,6 +104,264 @@ def tex_to_svg_file(
     return svg_file
 
 
+def tex_to_svg_files(
+    expressions: Iterable[tuple[str, str | None]],
+    tex_template: TexTemplate | None = None,
+    max_workers: int | None = None,
+) -> list[Path]:
+    r"""Takes many tex expressions and returns the svg versions of the compiled tex.
+
+    The expressions which have not been compiled yet are typeset as the pages
+    of a few documents, each compiled with a single run of LaTeX and dvisvgm,
+    instead of running both programs for every expression. Independent
+    documents are compiled in parallel.
+
+    Parameters
+    ----------
+    expressions
+        Pairs of a TeX expression and of the environment in which it should be
+        typeset (or ``None``), as passed to :func:`tex_to_svg_file`.
+    tex_template
+        Template class used to typesetting. If not set, use default template set via `config["tex_template"]`
+    max_workers
+        Maximal number of documents compiled at once. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    :class:`list[Path]`
+        Paths to the generated SVG files, in the order of ``expressions``.
+    """
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    expressions = list(expressions)
+    tex_files = [
+        generate_tex_file(expression, environment, tex_template)
+        for expression, environment in expressions
+    ]
+    pending: dict[Path, tuple[str, str | None]] = {}
+    for tex_file, entry in zip(tex_files, expressions):
+        if not tex_file.with_suffix(".svg").exists():
+            pending.setdefault(tex_file, entry)
+    if pending:
+        _compile_tex_batches(
+            [(tex_file, *entry) for tex_file, entry in pending.items()],
+            tex_template,
+            max_workers,
+        )
+    return [tex_to_svg_file(*entry, tex_template) for entry in expressions]
+
+
+def map_with_batched_tex(
+    function: Callable[[T], U],
+    items: Iterable[T],
+    max_workers: int | None = None,
+) -> list[U]:
+    """Applies ``function`` to every item, compiling in batches the TeX
+    expressions needed by the calls.
+
+    The calls are first made while collecting the expressions requested from
+    :func:`tex_to_svg_file` which have not been compiled yet. These
+    expressions are compiled together with :func:`tex_to_svg_files` and the
+    interrupted calls are made again, until they do not need new expressions.
+    This is useful to create many :class:`~.MathTex` at once, e.g. the entries
+    of a :class:`~.Table`.
+
+    Parameters
+    ----------
+    function
+        The function to apply, e.g. the constructor of a mobject.
+    items
+        The arguments of the calls of ``function``.
+    max_workers
+        Maximal number of documents compiled at once. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    :class:`list`
+        The results of the calls, in the order of ``items``.
+    """
+    items = list(items)
+    results: list[Any] = [None] * len(items)
+    remaining = list(range(len(items)))
+    attempted: set[Path] = set()
+    while remaining and _pending_expressions.get() is None:
+        pending: list[tuple[Path, str, str | None, TexTemplate]] = []
+        token = _pending_expressions.set(pending)
+        interrupted = []
+        try:
+            for index in remaining:
+                try:
+                    results[index] = function(items[index])
+                except _PendingTexExpression:
+                    interrupted.append(index)
+        finally:
+            _pending_expressions.reset(token)
+        remaining = interrupted
+        new_entries = {}
+        for tex_file, *entry in pending:
+            if tex_file not in attempted:
+                new_entries[tex_file] = entry
+        if not new_entries:
+            # The expressions failed to compile in batch, the calls below
+            # compile them one by one and report the errors.
+            break
+        attempted.update(new_entries)
+        templates: list[TexTemplate] = []
+        groups: list[list[tuple[Path, str, str | None]]] = []
+        for tex_file, (expression, environment, tex_template) in new_entries.items():
+            if tex_template not in templates:
+                templates.append(tex_template)
+                groups.append([])
+            groups[templates.index(tex_template)].append(
+                (tex_file, expression, environment)
+            )
+        for tex_template, group in zip(templates, groups):
+            _compile_tex_batches(group, tex_template, max_workers)
+    for index in remaining:
+        results[index] = function(items[index])
+    return results
+
+
+def _compile_tex_batches(
+    entries: Sequence[tuple[Path, str, str | None]],
+    tex_template: TexTemplate,
+    max_workers: int | None = None,
+) -> None:
+    """Compiles the expressions of ``entries`` in batches of at most
+    :data:`TEX_BATCH_SIZE` expressions, in parallel.
+
+    Expressions of a batch which cannot be compiled are left uncompiled, so
+    that compiling them one by one reports the error.
+    """
+    if _get_batch_template(tex_template) is None:
+        batches = [[entry] for entry in entries]
+    else:
+        batches = [
+            list(entries[i : i + TEX_BATCH_SIZE])
+            for i in range(0, len(entries), TEX_BATCH_SIZE)
+        ]
+    max_workers = min(len(batches), max_workers or os.cpu_count() or 1)
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(
+                executor.map(
+                    lambda batch: _compile_tex_batch(batch, tex_template), batches
+                )
+            )
+    else:
+        for batch in batches:
+            _compile_tex_batch(batch, tex_template)
+    if not config["no_latex_cleanup"]:
+        delete_nonsvg_files()
+
+
+def _get_batch_template(tex_template: TexTemplate) -> TexTemplate | None:
+    """Returns a copy of ``tex_template`` producing one page for each
+    ``manimbatchpage`` environment, or ``None`` if the template is not based
+    on the ``standalone`` document class.
+    """
+    body = tex_template.body
+    match = _STANDALONE_DOCUMENTCLASS.search(body)
+    if match is None:
+        return None
+    options = [
+        option
+        for option in (match["options"] or "").split(",")
+        if option.strip() and not option.strip().startswith("multi")
+    ]
+    options.append(f"multi={_BATCH_PAGE_ENVIRONMENT}")
+    documentclass = r"\documentclass[" + ",".join(options) + r"]{standalone}"
+    page_environment = r"\newenvironment{" + _BATCH_PAGE_ENVIRONMENT + "}{}{}"
+    batch_template = tex_template.copy()
+    batch_template.body = "".join(
+        [
+            body[: match.start()],
+            documentclass,
+            "\n",
+            page_environment,
+            body[match.end() :],
+        ]
+    )
+    return batch_template
+
+
+def _compile_tex_batch(
+    batch: Sequence[tuple[Path, str, str | None]], tex_template: TexTemplate
+) -> None:
+    """Compiles the expressions of ``batch`` as the pages of a single
+    document and splits it into the SVG files of the expressions.
+
+    Templates not based on the ``standalone`` document class only support
+    batches of a single expression, whose own TeX file is compiled.
+    """
+    tex_dir = config.get_dir("tex_dir")
+    batch_template = _get_batch_template(tex_template)
+    if batch_template is None:
+        ((tex_file, _, _),) = batch
+    else:
+        pages = []
+        for _, expression, environment in batch:
+            if environment is not None:
+                begin, end = _texcode_for_environment(environment)
+                expression = "\n".join([begin, expression, end])
+            pages.append(
+                "\n".join(
+                    [
+                        r"\begin{" + _BATCH_PAGE_ENVIRONMENT + "}",
+                        expression,
+                        r"\end{" + _BATCH_PAGE_ENVIRONMENT + "}",
+                    ]
+                )
+            )
+        output = batch_template.get_texcode_for_expression("\n".join(pages))
+        tex_file = tex_dir / f"batch_{tex_hash(output)}.tex"
+        tex_file.write_text(output, encoding="utf-8")
+        logger.info(
+            "Writing %(count)d expressions to %(path)s",
+            {"count": len(batch), "path": f"{tex_file}"},
+        )
+
+    # Errors are not reported here: the expressions which are left
+    # uncompiled are compiled again one by one by tex_to_svg_file.
+    output_format = tex_template.output_format
+    command = make_tex_compilation_command(
+        tex_template.tex_compiler, output_format, tex_file, tex_dir
+    )
+    cp = subprocess.run(command, stdout=subprocess.DEVNULL)
+    dvi_file = tex_file.with_suffix(output_format)
+    if cp.returncode != 0 or not dvi_file.exists():
+        return
+    if batch_template is None:
+        with contextlib.suppress(ValueError):
+            convert_to_svg(dvi_file, output_format)
+        return
+
+    command = [
+        "dvisvgm",
+        *(["--pdf"] if output_format == ".pdf" else []),
+        "--page=1-",
+        "--no-fonts",
+        "--verbosity=0",
+        f"--output={(tex_dir / (tex_file.stem + '-%p.svg')).as_posix()}",
+        f"{dvi_file.as_posix()}",
+    ]
+    subprocess.run(command, stdout=subprocess.DEVNULL)
+    page_files = {
+        int(page_file.stem.rpartition("-")[2]): page_file
+        for page_file in tex_dir.glob(tex_file.stem + "-*.svg")
+    }
+    if sorted(page_files) == list(range(1, len(batch) + 1)):
+        for page, (entry_file, _, _) in enumerate(batch, start=1):
+            page_files[page].replace(entry_file.with_suffix(".svg"))
+    else:
+        # Some expressions did not produce a page, so that the pages cannot
+        # be matched with the expressions.
+        for page_file in page_files.values():
+            page_file.unlink()
+    if not config["no_latex_cleanup"]:
+        tex_file.unlink()
+
+
 def generate_tex_file(
     expression: str,
     environment: str | None = None,
@@ -0,0 +1,322 @@
+"""Benchmarks of the hot paths of the render pipeline.
+
+Run the benchmarks and store their timings as JSON::
+
+    python scripts/benchmark.py run -o results.json
+
+Compare the timings with those of a baseline, e.g. from the previous release,
+and exit with a nonzero status if a benchmark became slower::
+
+    python scripts/benchmark.py compare baseline.json results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable
+
+import numpy as np
+
+import manim
+from manim import (
+    Circle,
+    MathTex,
+    Scene,
+    Square,
+    Surface,
+    Text,
+    Transform,
+    VGroup,
+    tempconfig,
+)
+from manim.camera.camera import Camera
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.hashing import get_hash_from_play_call
+
+#: Version of the JSON format written by ``run`` and read by ``compare``.
+FORMAT_VERSION = 1
+
+BENCHMARKS: dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+class SkipBenchmark(Exception):
+    """Raised by the setup of a benchmark which cannot run in this environment."""
+
+
+def benchmark(func: Callable[[], Callable[[], object]]):
+    """Register a benchmark.
+
+    The decorated function sets the benchmark up and returns the function
+    whose execution is timed.
+    """
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+def _vmobject_grid(n: int) -> VGroup:
+    return (
+        VGroup(*(Circle(radius=0.1) for _ in range(n)))
+        .arrange_in_grid(buff=0.05)
+        .set_fill(opacity=0.5)
+    )
+
+
+@benchmark
+def cairo_vmobject_frame():
+    camera = Camera()
+    mobjects = [_vmobject_grid(1000)]
+
+    def run():
+        camera.reset()
+        camera.capture_mobjects(mobjects)
+
+    return run
+
+
+@benchmark
+def mathtex_construction():
+    try:
+        MathTex(r"\sum_{n=1}^\infty \frac{1}{n^2} = \frac{\pi^2}{6}")
+    except Exception as error:
+        raise SkipBenchmark(f"LaTeX is not available: {error}") from error
+
+    def run():
+        # The SVG file is cached after the first compilation, so this times
+        # parsing it and building the mobjects.
+        MathTex(r"\sum_{n=1}^\infty \frac{1}{n^2} = \frac{\pi^2}{6}")
+
+    return run
+
+
+@benchmark
+def text_construction():
+    def run():
+        Text("The quick brown fox jumps over the lazy dog")
+
+    return run
+
+
+@benchmark
+def transform_interpolation():
+    source = VGroup(*(Square() for _ in range(200))).arrange_in_grid()
+    target = VGroup(*(Circle() for _ in range(200))).arrange_in_grid()
+    animation = Transform(source, target)
+    animation.begin()
+    alphas = np.linspace(0, 1, 30)
+
+    def run():
+        for alpha in alphas:
+            animation.interpolate(alpha)
+
+    return run
+
+
+@benchmark
+def surface_construction():
+    def run():
+        Surface(
+            lambda u, v: np.array([u, v, np.sin(u) * np.cos(v)]),
+            u_range=[-3, 3],
+            v_range=[-3, 3],
+            resolution=(32, 32),
+        )
+
+    return run
+
+
+@benchmark
+def play_hashing():
+    scene = Scene()
+    mobjects = [_vmobject_grid(200)]
+    animations = [Transform(mobjects[0], _vmobject_grid(200))]
+
+    def run():
+        get_hash_from_play_call(scene, scene.renderer.camera, animations, mobjects)
+
+    return run
+
+
+@benchmark
+def partial_movie_encoding():
+    rng = np.random.default_rng(0)
+    frames = [
+        rng.integers(0, 256, size=(480, 854, 4), dtype=np.uint8) for _ in range(15)
+    ]
+
+    def run():
+        with tempconfig({"write_to_movie": True}):
+            file_writer = SceneFileWriter(SimpleNamespace(num_plays=0), "Benchmark")
+            partial_movie_files = []
+            for i in range(4):
+                path = file_writer.partial_movie_directory / f"{i}.mp4"
+                file_writer.open_partial_movie_stream(file_path=path)
+                for frame in frames:
+                    file_writer.write_frame(frame)
+                file_writer.write_frame(frames[0], num_frames=15)
+                file_writer.close_partial_movie_stream()
+                partial_movie_files.append(str(path))
+            file_writer.combine_files(
+                partial_movie_files, file_writer.partial_movie_directory / "movie.mp4"
+            )
+
+    return run
+
+
+@benchmark
+def opengl_standalone_rendering():
+    try:
+        import moderngl
+
+        moderngl.create_standalone_context().release()
+    except Exception as error:
+        raise SkipBenchmark(f"No standalone OpenGL context: {error}") from error
+
+    class OpenGLBenchmarkScene(Scene):
+        def construct(self):
+            grid = _vmobject_grid(200)
+            self.add(grid)
+            self.play(grid.animate.rotate(1), run_time=1)
+
+    def run():
+        with tempconfig({"renderer": "opengl", "write_to_movie": False}):
+            OpenGLBenchmarkScene().render()
+
+    return run
+
+
+def run_benchmark(name: str, repeat: int) -> dict:
+    try:
+        func = BENCHMARKS[name]()
+        # The first execution fills caches and is not taken into account.
+        func()
+    except SkipBenchmark as error:
+        return {"skipped": str(error)}
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {
+        "repeat": repeat,
+        "times": times,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+    }
+
+
+def run(args: argparse.Namespace) -> int:
+    names = [name for name in BENCHMARKS if not args.k or args.k in name]
+    results = {}
+    with (
+        tempfile.TemporaryDirectory() as media_dir,
+        tempconfig(
+            {
+                "media_dir": media_dir,
+                "quality": "low_quality",
+                "disable_caching": True,
+                "progress_bar": "none",
+                "verbosity": "WARNING",
+            }
+        ),
+    ):
+        for name in names:
+            result = run_benchmark(name, args.repeat)
+            if "skipped" in result:
+                print(f"{name:<32} skipped ({result['skipped']})")
+            else:
+                print(f"{name:<32} {result['min'] * 1000:10.2f} ms")
+            results[name] = result
+
+    output = {
+        "format_version": FORMAT_VERSION,
+        "manim_version": manim.__version__,
+        "python_version": platform.python_version(),
+        "numpy_version": np.__version__,
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+    if args.output:
+        with Path(args.output).open("w", encoding="utf-8") as file:
+            json.dump(output, file, indent=2)
+    return 0
+
+
+def _load_results(path: str) -> dict:
+    with Path(path).open(encoding="utf-8") as file:
+        results = json.load(file)
+    if results.get("format_version") != FORMAT_VERSION:
+        raise SystemExit(f"{path} has an unsupported format version.")
+    return results["benchmarks"]
+
+
+def compare(args: argparse.Namespace) -> int:
+    baseline = _load_results(args.baseline)
+    current = _load_results(args.current)
+    regressions = []
+    print(f"{'benchmark':<32} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in current.items():
+        reference = baseline.get(name)
+        if "skipped" in result or reference is None or "skipped" in reference:
+            print(f"{name:<32} {'-':>12} {'-':>12} {'n/a':>8}")
+            continue
+        # The minimum is the timing least affected by noise.
+        change = result["min"] / reference["min"] - 1
+        print(
+            f"{name:<32} {reference['min'] * 1000:10.2f}ms "
+            f"{result['min'] * 1000:10.2f}ms {change:+8.1%}"
+        )
+        if change > args.threshold:
+            regressions.append(name)
+    if regressions:
+        print(
+            f"\n{len(regressions)} benchmark(s) slower by more than "
+            f"{args.threshold:.0%}: {', '.join(regressions)}"
+        )
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmarks of the render pipeline of Manim."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks.")
+    run_parser.add_argument("-o", "--output", help="Write the timings to this file.")
+    run_parser.add_argument(
+        "-k", help="Only run the benchmarks whose name contains this string."
+    )
+    run_parser.add_argument(
+        "--repeat", type=int, default=5, help="Timed executions per benchmark."
+    )
+    run_parser.set_defaults(func=run)
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare timings with those of a baseline."
+    )
+    compare_parser.add_argument("baseline", help="Timings of the baseline.")
+    compare_parser.add_argument("current", help="Timings to compare.")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown above which a benchmark is a regression.",
+    )
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
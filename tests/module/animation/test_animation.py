@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from manim import FadeIn, Scene
+from manim import Animation, FadeIn, Scene, Square, VGroup
 
 
 def test_animation_zero_total_run_time():
@@ -55,3 +55,32 @@ def test_wait_until_invalid_max_time(max_time):
     test_scene = Scene()
     with pytest.raises(ValueError, match="The max_time must be a positive number."):
         test_scene.wait_until(lambda: True, max_time)
+
+
+@pytest.mark.parametrize("lag_ratio", [0, 0.3])
+@pytest.mark.parametrize("reverse_rate_function", [False, True])
+def test_interpolation_plan_sub_alphas(lag_ratio, reverse_rate_function):
+    group = VGroup(*(Square() for _ in range(4)))
+    anim = Animation(
+        group, lag_ratio=lag_ratio, reverse_rate_function=reverse_rate_function
+    )
+    anim.begin()
+    plan = anim._interpolation_plan
+    for alpha in (0, 0.25, 0.6, 1):
+        expected = [anim.get_sub_alpha(alpha, i, 4) for i in range(4)]
+        assert plan.get_sub_alphas(anim, alpha) == pytest.approx(expected)
+
+
+def test_interpolation_plan_follows_hierarchy():
+    group = VGroup(Square(), Square())
+    anim = Animation(group)
+    anim.begin()
+    plan = anim._interpolation_plan
+    anim.interpolate(0.5)
+    assert anim._interpolation_plan is plan
+
+    group.add(Square())
+    anim.starting_mobject.add(Square())
+    anim.interpolate(0.5)
+    assert anim._interpolation_plan is not plan
+    assert len(anim._interpolation_plan.families) == 3
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from manim import (
+    BLUE,
+    PI,
+    RED,
+    RIGHT,
+    Circle,
+    Square,
+    Star,
+    Transform,
+    Triangle,
+    VGroup,
+)
+
+
+@pytest.mark.parametrize("path_arc", [0, PI / 2])
+def test_batched_transform_matches_submobject_interpolation(path_arc):
+    source = VGroup(Square(), Circle(color=RED, fill_opacity=0.5), Triangle())
+    target = VGroup(Circle().shift(RIGHT), Square(stroke_width=8), Star(color=BLUE))
+    anim = Transform(source, target, path_arc=path_arc)
+    anim.begin()
+    assert anim._get_batched_interpolation() is not None
+    anim.interpolate(0.4)
+
+    sub_alpha = anim.rate_func(0.4)
+    expected = anim.starting_mobject.copy()
+    for mob, start, end in zip(
+        expected.family_members_with_points(),
+        anim.starting_mobject.family_members_with_points(),
+        anim.target_copy.family_members_with_points(),
+    ):
+        mob.interpolate(start, end, sub_alpha, anim.path_func)
+    for mob, expected_mob in zip(
+        source.family_members_with_points(), expected.family_members_with_points()
+    ):
+        np.testing.assert_allclose(mob.points, expected_mob.points)
+        np.testing.assert_allclose(mob.fill_rgbas, expected_mob.fill_rgbas)
+        np.testing.assert_allclose(mob.stroke_rgbas, expected_mob.stroke_rgbas)
+        assert mob.stroke_width == pytest.approx(expected_mob.stroke_width)
+
+
+def test_transform_with_lag_ratio_is_not_batched():
+    anim = Transform(
+        VGroup(Square(), Square()), VGroup(Circle(), Circle()), lag_ratio=0.5
+    )
+    anim.begin()
+    assert anim._get_batched_interpolation() is None
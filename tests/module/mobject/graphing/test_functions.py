@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import numpy as np
+
+from manim import FunctionGraph, ParametricFunction
+
+
+def test_adaptive_sampling_stays_within_tolerance():
+    tolerance = 0.01
+    t_samples = []
+
+    def func(t):
+        t_samples.append(np.array(t, dtype=float))
+        return (t, np.sin(3 * t), 0 * t)
+
+    curve = ParametricFunction(
+        func,
+        t_range=(-4, 4, 0.5),
+        use_vectorized=True,
+        use_adaptive_sampling=True,
+        sampling_tolerance=tolerance,
+        use_smoothing=False,
+    )
+    anchors = np.vstack([curve.get_start_anchors(), curve.get_end_anchors()[-1:]])
+    assert len(curve.get_subpaths()) == 1
+    assert len(anchors) < len(np.arange(-4, 4, 0.01))
+
+    # Every sample of the function is within the tolerance of the polyline.
+    t = np.concatenate(t_samples)
+    samples = np.column_stack([t, np.sin(3 * t), np.zeros_like(t)])
+    starts, chords = anchors[:-1], anchors[1:] - anchors[:-1]
+    alphas = np.clip(
+        np.einsum("ijk,jk->ij", samples[:, None] - starts, chords)
+        / np.einsum("jk,jk->j", chords, chords),
+        0,
+        1,
+    )
+    distances = np.linalg.norm(
+        samples[:, None] - starts - alphas[..., None] * chords, axis=2
+    ).min(axis=1)
+    assert distances.max() <= tolerance + 1e-9
+
+
+def test_adaptive_sampling_splits_at_jumps():
+    graph = FunctionGraph(
+        lambda x: np.floor(x),
+        x_range=(-2.5, 2.5, 0.5),
+        use_adaptive_sampling=True,
+    )
+    subpaths = graph.get_subpaths()
+    assert len(subpaths) == 6
+    for subpath in subpaths:
+        np.testing.assert_allclose(subpath[:, 1], subpath[0, 1])
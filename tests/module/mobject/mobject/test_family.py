@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import numpy as np
 
-from manim import RIGHT, Circle, Mobject
+from manim import RIGHT, Circle, Mobject, VGroup
 
 
 def test_family():
@@ -90,3 +90,36 @@ def test_shift_family():
 
     for m in family:
         np.testing.assert_allclose(positions_before[m] + RIGHT, positions_after[m])
+
+
+def test_family_cache_invalidation():
+    """Check that changes of the hierarchy are reflected by the cached family."""
+    leaf = Mobject()
+    child = Mobject().add(leaf)
+    mob = Mobject().add(child)
+    assert mob.get_family() == [mob, child, leaf]
+    assert mob.get_family() is mob.get_family()
+
+    # Changes deep in the hierarchy reach the ancestors.
+    new_leaf = Mobject()
+    child.add(new_leaf)
+    assert mob.get_family() == [mob, child, leaf, new_leaf]
+    child.remove(leaf)
+    assert mob.get_family() == [mob, child, new_leaf]
+    child.insert(0, leaf)
+    assert mob.get_family() == [mob, child, leaf, new_leaf]
+    child.submobjects[1] = Mobject()
+    assert new_leaf not in mob.get_family()
+    child.submobjects = []
+    assert mob.get_family() == [mob, child]
+
+    group = VGroup(Circle())
+    assert len(group.get_family()) == 2
+    group.become(VGroup(Circle(), Circle()))
+    assert len(group.get_family()) == 3
+
+    # Copies have their own cache.
+    copy = mob.copy()
+    copy.submobjects[0].add(Mobject())
+    assert len(copy.get_family()) == 3
+    assert mob.get_family() == [mob, child]
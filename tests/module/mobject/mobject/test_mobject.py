@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import copy
+import pickle
+
 import numpy as np
 import pytest
 
@@ -168,3 +171,77 @@ def test_mobject_dimensions_has_points_and_children():
     assert inner_rect.width == 2
     assert inner_rect.height == 1
     assert inner_rect.depth == 0
+
+
+def test_mobject_family_updaters():
+    calls = []
+    group = VGroup(Square(), VGroup(Circle(), Square()))
+    nested = group.submobjects[1]
+    assert not group.has_family_updaters()
+
+    nested.submobjects[0].add_updater(lambda mob, dt: calls.append(dt))
+    assert group.has_family_updaters()
+    assert nested.has_family_updaters()
+    assert not group.submobjects[0].has_family_updaters()
+    group.update(0.5)
+    assert calls == [0.5]
+
+    # Modifying the lists directly is noticed as well.
+    nested.submobjects[0].updaters.clear()
+    assert not group.has_family_updaters()
+    inner = Square().add_updater(lambda mob: calls.append("inner"))
+    nested.submobjects.append(inner)
+    assert group.has_family_updaters()
+    group.update(0.5)
+    assert calls == [0.5, "inner"]
+
+    copied = group.copy()
+    assert copied.has_family_updaters()
+    copied.clear_updaters()
+    assert not copied.has_family_updaters()
+    assert group.has_family_updaters()
+
+
+def test_mobject_updater_dependencies():
+    leader = Mobject()
+    follower = Mobject().add_updater(lambda mob: None, depends_on=[leader])
+    group = Mobject().add(leader, follower)
+    assert group.get_family_updater_dependencies() == [leader]
+
+    copied = group.copy()
+    copied_leader, copied_follower = copied.submobjects
+    assert copied_follower.get_family_updater_dependencies() == [copied_leader]
+    assert follower.copy().get_family_updater_dependencies() == [leader]
+
+    follower.clear_updaters()
+    assert group.get_family_updater_dependencies() == []
+
+    def follow(mob):
+        pass
+
+    follower.add_updater(follow, depends_on=[leader])
+    assert group.get_family_updater_dependencies() == [leader]
+    follower.remove_updater(follow)
+    assert group.get_family_updater_dependencies() == []
+    assert follower.updater_dependencies == {}
+
+
+def test_mobject_shallow_copy_and_pickle_track_their_family():
+    group = VGroup(Square(), Circle())
+    assert not group.has_family_updaters()
+
+    shallow = copy.copy(group)
+    assert shallow.submobjects is not group.submobjects
+    shallow.submobjects[0].add_updater(lambda mob: None)
+    assert shallow.has_family_updaters()
+    assert group.has_family_updaters()
+    shallow.add(Square())
+    assert len(group.submobjects) == 2
+    assert len(shallow.get_family()) == 4
+
+    unpickled = pickle.loads(pickle.dumps(VGroup(Square(), Circle())))
+    assert not unpickled.has_family_updaters()
+    unpickled.submobjects[1].add_updater(lambda mob: None)
+    assert unpickled.has_family_updaters()
+    unpickled.add(Square())
+    assert len(unpickled.get_family()) == 4
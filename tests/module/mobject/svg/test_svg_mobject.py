@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from manim import *
 from tests.helpers.path_utils import get_svg_resource
 
@@ -202,3 +204,32 @@ def test_close_command_closes_last_move_not_the_starting_one():
         ),
         decimal=5,
     )
+
+
+@pytest.fixture
+def empty_svg_memory_cache():
+    from manim.mobject.svg import svg_mobject
+
+    svg_mobject.SVG_HASH_TO_MOB_MAP.clear()
+    svg_mobject._svg_cache_memory_sizes.clear()
+    yield svg_mobject
+    svg_mobject.SVG_HASH_TO_MOB_MAP.clear()
+    svg_mobject._svg_cache_memory_sizes.clear()
+
+
+def test_svg_cache_file_restores_mobject(config, tmp_path, empty_svg_memory_cache):
+    svg_mobject = empty_svg_memory_cache
+    config.media_dir = tmp_path
+    svg = SVGMobject(get_svg_resource("heart.svg"), fill_color=RED)
+    assert list(config.get_dir("svg_cache_dir").glob("*.npz"))
+
+    svg_mobject.SVG_HASH_TO_MOB_MAP.clear()
+    svg_mobject._svg_cache_memory_sizes.clear()
+    cached = SVGMobject(get_svg_resource("heart.svg"), fill_color=RED)
+    assert len(cached.submobjects) == len(svg.submobjects)
+    for mob, cached_mob in zip(svg.submobjects, cached.submobjects):
+        assert type(cached_mob) is type(mob)
+        np.testing.assert_allclose(cached_mob.points, mob.points)
+        np.testing.assert_allclose(cached_mob.fill_rgbas, mob.fill_rgbas)
+        np.testing.assert_allclose(cached_mob.stroke_rgbas, mob.stroke_rgbas)
+        assert cached_mob.stroke_width == mob.stroke_width
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import numpy as np
+
+from manim import GREEN, RED, YELLOW, Surface, ThreeDAxes, ThreeDVMobject, VGroup
+
+
+def saddle(u, v):
+    return np.array([u, v, np.sin(u) * np.cos(2 * v)])
+
+
+def test_surface_matches_function_applied_to_faces():
+    surface = Surface(saddle, u_range=[-1, 1], v_range=[0, 2], resolution=(4, 3))
+
+    faces = VGroup()
+    for face in surface:
+        expected_face = ThreeDVMobject()
+        expected_face.set_points_as_corners(
+            [
+                [face.u1, face.v1, 0],
+                [face.u2, face.v1, 0],
+                [face.u2, face.v2, 0],
+                [face.u1, face.v2, 0],
+                [face.u1, face.v1, 0],
+            ]
+        )
+        faces.add(expected_face)
+    faces.pre_function_handle_to_anchor_scale_factor = (
+        surface.pre_function_handle_to_anchor_scale_factor
+    )
+    faces.apply_function(lambda p: saddle(p[0], p[1]))
+
+    assert len(surface) == 12
+    for face, expected_face in zip(surface, faces):
+        np.testing.assert_allclose(face.points, expected_face.points, atol=1e-6)
+
+
+def test_vectorized_surface_matches_scalar_surface():
+    scalar = Surface(saddle, resolution=5)
+    vectorized = Surface(saddle, resolution=5, use_vectorized=True)
+    for face, vectorized_face in zip(scalar, vectorized):
+        np.testing.assert_allclose(face.points, vectorized_face.points)
+
+
+def test_mesh_surface_matches_faces():
+    surface = Surface(saddle, u_range=[-1, 1], v_range=[0, 2], resolution=(4, 3))
+    mesh = Surface(
+        saddle, u_range=[-1, 1], v_range=[0, 2], resolution=(4, 3), use_mesh=True
+    )
+
+    assert mesh.submobjects == []
+    np.testing.assert_allclose(
+        mesh.get_mesh_face_points(), [face.points for face in surface]
+    )
+    np.testing.assert_allclose(
+        mesh.face_colors, [face.get_fill_color().to_rgb() for face in surface]
+    )
+
+
+def test_mesh_surface_fill_by_value_matches_faces():
+    axes = ThreeDAxes(x_range=(0, 5, 1), y_range=(0, 5, 1), z_range=(-1, 1, 0.5))
+    colorscale = [(RED, -0.5), (YELLOW, 0), (GREEN, 0.5)]
+    surfaces = [
+        Surface(
+            lambda u, v: axes.c2p(u, v, np.sin(u) * np.cos(v)),
+            u_range=[0, 5],
+            v_range=[0, 5],
+            resolution=8,
+            use_mesh=use_mesh,
+        ).set_fill_by_value(axes=axes, colorscale=colorscale)
+        for use_mesh in (False, True)
+    ]
+    surface, mesh = surfaces
+
+    np.testing.assert_allclose(
+        mesh.face_colors,
+        [face.get_fill_color().to_rgb() for face in surface],
+        atol=1e-6,
+    )
+
+    mesh.set_fill(opacity=0.5)
+    assert mesh.face_colors is not None
+    mesh.set_fill(RED)
+    assert mesh.face_colors is None
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from manim import RED, DecimalNumber, Integer
+import numpy as np
+import pytest
+
+from manim import LEFT, RED, RIGHT, DecimalNumber, Integer
 
 
 def test_font_size():
@@ -47,3 +50,27 @@ def test_color_when_number_of_digits_changes():
     assert all(
         submob.stroke_color.to_hex() == RED.to_hex() for submob in mob.submobjects
     )
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "kwargs"),
+    [
+        (12.34, 12.58, {}),
+        (-1.5, -2.7, {"unit": r"\text{m}"}),
+        (1234.5, 9876.5, {"include_sign": True, "show_ellipsis": True}),
+    ],
+)
+def test_set_value_updates_glyphs_in_place(start, end, kwargs):
+    """Test that changing digits of a DecimalNumber keeps its submobjects and
+    gives the same points as a new DecimalNumber.
+    """
+    num = DecimalNumber(start, font_size=30, **kwargs).scale(2).shift(RIGHT)
+    submobjects = list(num.submobjects)
+    left = num.get_left()
+    num.set_value(end)
+    assert num.submobjects == submobjects
+    assert num.get_value() == end
+
+    expected = DecimalNumber(end, font_size=60, **kwargs).move_to(left, LEFT)
+    for mob, expected_mob in zip(num.get_family(), expected.get_family()):
+        np.testing.assert_allclose(mob.points, expected_mob.points, atol=1e-6)
@@ -6,6 +6,7 @@ import numpy as np
 import pytest
 
 from manim import MathTex, SingleStringMathTex, Tex, TexTemplate, tempconfig
+from manim.utils.tex_file_writing import map_with_batched_tex, tex_to_svg_files
 
 
 def test_MathTex(config):
@@ -32,6 +33,17 @@ def test_tex(config):
     assert Path(config.media_dir, "Tex", "c3945e23e546c95a.svg").exists()
 
 
+def test_batched_tex_compilation(config):
+    tex_strings = [f"x_{{{i}}}" for i in range(5)]
+    svg_files = tex_to_svg_files([(s, "align*") for s in tex_strings[:3]])
+    assert all(svg_file.exists() for svg_file in svg_files)
+
+    mobs = map_with_batched_tex(MathTex, tex_strings)
+    assert [mob.tex_string for mob in mobs] == tex_strings
+    for svg_file, mob in zip(svg_files, mobs):
+        assert Path(mob.file_name) == svg_file
+
+
 def test_tex_temp_directory(tmpdir, monkeypatch):
     # Adds a test for #3060
     # It's not possible to reproduce the issue normally, because we use
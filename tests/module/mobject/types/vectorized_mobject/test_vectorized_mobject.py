@@ -548,3 +548,38 @@ def test_pointwise_become_partial_where_vmobject_is_self():
         ]
     )
     np.testing.assert_allclose(sq.points, expected_points)
+
+
+def test_vmobject_append_points_in_place():
+    """Test that appended points grow a buffer which is only reallocated
+    when it is full or when the points were replaced.
+    """
+    vmob = VMobject()
+    vmob.start_new_path(np.zeros(3))
+    buffers = set()
+    for i in range(1, 200):
+        point = np.array([i, 0, 0])
+        vmob.add_line_to(point)
+        buffers.add(id(vmob._point_buffer))
+    assert len(vmob.points) == 1 + 3 * 199
+    np.testing.assert_allclose(vmob.points[3::3, 0], np.arange(1, 200))
+    assert len(buffers) < 10
+
+    # Points held elsewhere are not overwritten by later appends.
+    old_points = vmob.points
+    vmob.points = vmob.points[:-3]
+    vmob.add_line_to(np.array([-1, 0, 0]))
+    np.testing.assert_allclose(old_points[-1], [199, 0, 0])
+    np.testing.assert_allclose(vmob.points[-1], [-1, 0, 0])
+
+    # Dropping points from the start keeps appending in place.
+    buffer = vmob._point_buffer
+    vmob.points = vmob.points[4:]
+    vmob.add_line_to(np.array([-2, 0, 0]))
+    assert vmob._point_buffer is buffer
+    np.testing.assert_allclose(vmob.points[-1], [-2, 0, 0])
+
+    # Copies do not share the buffer.
+    copy = vmob.copy()
+    copy.add_line_to(np.array([-3, 0, 0]))
+    np.testing.assert_allclose(vmob.points[-1], [-2, 0, 0])
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import shutil
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from manim.scene.partial_movie_cache import (
+    HTTPCacheBackend,
+    LocalCacheBackend,
+    SharedDirectoryCacheBackend,
+    get_cache_backend,
+)
+
+
+class _StoreHandler(BaseHTTPRequestHandler):
+    files: dict[str, bytes] = {}
+
+    def do_GET(self):
+        data = self.files.get(self.path)
+        if data is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_PUT(self):
+        length = int(self.headers["Content-Length"])
+        self.files[self.path] = self.rfile.read(length)
+        self.send_response(201)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def store_url():
+    _StoreHandler.files = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StoreHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/cache/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_cache_backend(tmp_path):
+    assert isinstance(get_cache_backend(""), LocalCacheBackend)
+    assert isinstance(get_cache_backend(str(tmp_path)), SharedDirectoryCacheBackend)
+    assert isinstance(get_cache_backend("https://example.com"), HTTPCacheBackend)
+
+
+def test_shared_directory_cache_backend(tmp_path):
+    backend = SharedDirectoryCacheBackend(tmp_path / "shared")
+    rendered = tmp_path / "rendered.mp4"
+    rendered.write_bytes(b"partial movie")
+    fetched = tmp_path / "fetched.mp4"
+
+    assert not backend.fetch("480p15/rendered.mp4", fetched)
+    backend.store("480p15/rendered.mp4", rendered)
+    assert backend.fetch("480p15/rendered.mp4", fetched)
+    assert fetched.read_bytes() == b"partial movie"
+    assert not backend.fetch("1080p60/rendered.mp4", fetched)
+
+
+def test_failed_copy_leaves_no_temporary_file(tmp_path, monkeypatch):
+    backend = SharedDirectoryCacheBackend(tmp_path / "shared")
+    rendered = tmp_path / "rendered.mp4"
+    rendered.write_bytes(b"partial movie")
+
+    def copyfileobj(source, destination):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(shutil, "copyfileobj", copyfileobj)
+    with pytest.raises(OSError, match="No space left on device"):
+        backend.store("480p15/rendered.mp4", rendered)
+    assert list((tmp_path / "shared" / "480p15").iterdir()) == []
+
+
+def test_http_cache_backend(tmp_path, store_url):
+    backend = HTTPCacheBackend(store_url)
+    rendered = tmp_path / "rendered.mp4"
+    rendered.write_bytes(b"partial movie")
+    fetched = tmp_path / "fetched.mp4"
+
+    assert not backend.fetch("480p15/rendered.mp4", fetched)
+    assert not fetched.exists()
+    backend.store("480p15/rendered.mp4", rendered)
+    assert _StoreHandler.files == {"/cache/480p15/rendered.mp4": b"partial movie"}
+    assert backend.fetch("480p15/rendered.mp4", fetched)
+    assert fetched.read_bytes() == b"partial movie"
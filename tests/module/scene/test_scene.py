@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import datetime
 
+import numpy as np
 import pytest
 
-from manim import Circle, FadeIn, Group, Mobject, Scene, Square
-from manim.animation.animation import Wait
+from manim import LEFT, RED, RIGHT, Circle, FadeIn, Group, Mobject, Scene, Square
+from manim.animation.animation import Animation, Wait
+from manim.animation.updaters.update import UpdateFromFunc
+from manim.utils.profiling import profiler
 
 
 def test_scene_add_remove(dry_run):
@@ -101,3 +104,207 @@ def test_replace(dry_run):
     scene.replace(second, beta)
     assert_names(scene.mobjects, ["alpha", "group", "fourth"])
     assert_names(scene.mobjects[1], ["beta", "third"])
+
+
+def test_mobjects_to_update(dry_run):
+    scene = Scene()
+    order = []
+    static = Square()
+    label = Circle().add_updater(lambda mob: order.append("label"))
+    dot = Mobject().add_updater(lambda mob: order.append("dot"))
+    scene.add(static, label, dot)
+    assert scene.get_mobjects_to_update() == [label, dot]
+
+    label.clear_updaters()
+    label.add_updater(lambda mob: order.append("label"), depends_on=[dot])
+    assert scene.get_mobjects_to_update() == [dot, label]
+    scene.update_mobjects(0)
+    assert order == ["dot", "label"]
+
+    def follow_label(mob):
+        pass
+
+    dot.add_updater(follow_label, depends_on=[label])
+    with pytest.raises(ValueError, match="circular dependencies"):
+        scene.get_mobjects_to_update()
+
+    # Removing an updater removes its dependencies.
+    dot.remove_updater(follow_label)
+    assert scene.get_mobjects_to_update() == [dot, label]
+    label.clear_updaters()
+    dot.add_updater(follow_label, depends_on=[label])
+    label.add_updater(lambda mob: None)
+    assert scene.get_mobjects_to_update() == [label, dot]
+
+
+def test_changing_mobjects(dry_run):
+    scene = Scene()
+    below, moving, above = Square(), Circle(), Square()
+    scene.add(below, moving, above)
+    animation = Animation(moving)
+    assert scene.get_moving_mobjects(animation) == [moving, above]
+    assert scene.get_changing_mobjects(animation) == [moving]
+
+    # An updater may move any mobject of the scene.
+    follower = Square().add_updater(lambda mob: None)
+    scene.add(follower)
+    assert scene.get_changing_mobjects(animation) == [
+        below,
+        moving,
+        above,
+        follower,
+    ]
+
+
+def test_static_layers_match_full_frame(dry_run):
+    scene = Scene()
+    bottom = Square(fill_opacity=1)
+    top = Circle(color=RED, fill_opacity=0.5)
+    scene.add(bottom, top)
+    scene.animations = [Animation(bottom)]
+    scene.begin_animations()
+    assert scene.moving_mobjects == [bottom, top]
+
+    renderer = scene.renderer
+    renderer.save_static_frame_data(scene, scene.static_mobjects)
+    renderer.save_static_layers(scene)
+    assert renderer.layered_mobjects == {top}
+    renderer.update_frame_from_layers(scene.moving_mobjects)
+    frame = renderer.get_frame()
+
+    renderer.static_image = None
+    renderer.update_frame(scene)
+    np.testing.assert_allclose(frame, renderer.get_frame(), atol=2)
+
+
+def test_static_layers_with_scene_updater(dry_run):
+    scene = Scene()
+    bottom = Square(fill_opacity=1)
+    top = Circle(color=RED, fill_opacity=0.5)
+    scene.add(bottom, top)
+    scene.add_updater(lambda dt: top.shift(0.5 * RIGHT))
+    scene.animations = [Animation(bottom)]
+    scene.begin_animations()
+    assert scene.get_changing_mobjects(*scene.animations) == [bottom, top]
+
+    renderer = scene.renderer
+    renderer.save_static_frame_data(scene, scene.static_mobjects)
+    renderer.save_static_layers(scene)
+    assert renderer.layered_mobjects == set()
+    scene.update_self(1 / 15)
+    renderer.update_frame_from_layers(scene.moving_mobjects)
+    frame = renderer.get_frame()
+
+    renderer.static_image = None
+    renderer.update_frame(scene)
+    np.testing.assert_allclose(frame, renderer.get_frame(), atol=2)
+
+
+def test_static_layers_with_mobject_updater_moving_another(dry_run):
+    scene = Scene()
+    bottom = Square(fill_opacity=1)
+    top = Circle(color=RED, fill_opacity=0.5)
+    driver = Square(side_length=0.5).shift(3 * LEFT)
+    driver.add_updater(lambda mob: top.move_to(mob.get_center() + RIGHT))
+    scene.add(bottom, top, driver)
+    scene.animations = [Animation(bottom)]
+    scene.begin_animations()
+
+    renderer = scene.renderer
+    renderer.save_static_frame_data(scene, scene.static_mobjects)
+    renderer.save_static_layers(scene)
+    assert renderer.layered_mobjects == set()
+    driver.update()
+    renderer.update_frame_from_layers(scene.moving_mobjects)
+    frame = renderer.get_frame()
+
+    renderer.static_image = None
+    renderer.update_frame(scene)
+    np.testing.assert_allclose(frame, renderer.get_frame(), atol=2)
+
+
+def test_dirty_regions_match_full_frame(dry_run):
+    scene = Scene()
+    static = Square(fill_opacity=1).shift(2 * LEFT)
+    moving = Circle(color=RED, fill_opacity=0.5)
+    scene.add(static, moving)
+    scene.animations = [Animation(moving)]
+    scene.begin_animations()
+
+    renderer = scene.renderer
+    renderer.save_static_frame_data(scene, scene.static_mobjects)
+    renderer.save_unchanged_mobjects(scene)
+    assert renderer.unchanged_mobjects == set()
+    renderer.update_dirty_regions(scene, scene.moving_mobjects)
+    assert renderer.previous_regions is not None
+    for _ in range(3):
+        moving.shift(0.5 * RIGHT)
+        renderer.update_dirty_regions(scene, scene.moving_mobjects)
+    frame = renderer.get_frame()
+
+    renderer.update_frame(scene, scene.moving_mobjects)
+    np.testing.assert_allclose(frame, renderer.get_frame(), atol=2)
+
+
+def test_dirty_regions_with_update_from_func(dry_run):
+    scene = Scene()
+    static = Square(fill_opacity=1).shift(2 * LEFT)
+    moving = Circle(color=RED, fill_opacity=0.5)
+    follower = Square(side_length=1, fill_opacity=1)
+    scene.add(static, moving, follower)
+    scene.animations = [
+        Animation(moving),
+        UpdateFromFunc(moving, lambda mob: follower.shift(0.5 * RIGHT)),
+    ]
+    scene.begin_animations()
+    assert follower in scene.get_changing_mobjects(*scene.animations)
+
+    renderer = scene.renderer
+    renderer.save_static_frame_data(scene, scene.static_mobjects)
+    renderer.save_unchanged_mobjects(scene)
+    assert renderer.unchanged_mobjects == set()
+    renderer.update_dirty_regions(scene, scene.moving_mobjects)
+    for _ in range(3):
+        scene.animations[1].interpolate(0.5)
+        renderer.update_dirty_regions(scene, scene.moving_mobjects)
+    frame = renderer.get_frame()
+
+    renderer.update_frame(scene, scene.moving_mobjects)
+    np.testing.assert_allclose(frame, renderer.get_frame(), atol=2)
+
+
+def test_dirty_regions_with_mobject_updater_moving_another(dry_run):
+    scene = Scene()
+    static = Square(fill_opacity=1).shift(2 * LEFT)
+    moving = Circle(color=RED, fill_opacity=0.5)
+    follower = Square(side_length=1, fill_opacity=1)
+    driver = Square(side_length=0.5).shift(3 * RIGHT)
+    driver.add_updater(lambda mob: follower.shift(0.5 * RIGHT))
+    scene.add(static, moving, follower, driver)
+    scene.animations = [Animation(moving)]
+    scene.begin_animations()
+    assert follower in scene.get_changing_mobjects(*scene.animations)
+
+    renderer = scene.renderer
+    renderer.save_static_frame_data(scene, scene.static_mobjects)
+    renderer.save_unchanged_mobjects(scene)
+    assert renderer.unchanged_mobjects == set()
+    renderer.update_dirty_regions(scene, scene.moving_mobjects)
+    for _ in range(3):
+        driver.update()
+        renderer.update_dirty_regions(scene, scene.moving_mobjects)
+    frame = renderer.get_frame()
+
+    renderer.update_frame(scene, scene.moving_mobjects)
+    np.testing.assert_allclose(frame, renderer.get_frame(), atol=2)
+
+
+def test_profiler_stops_when_construct_fails(config, dry_run):
+    class FailingScene(Scene):
+        def construct(self):
+            raise ValueError("construct failed")
+
+    config.profile = True
+    with pytest.raises(ValueError, match="construct failed"):
+        FailingScene().render()
+    assert not profiler.enabled
@@ -1,4 +1,6 @@
-from manim import Circle, Square, ThreeDScene
+import numpy as np
+
+from manim import DEGREES, OUT, RIGHT, Circle, Prism, Sphere, Square, ThreeDScene
 
 
 def test_fixed_mobjects():
@@ -15,3 +17,46 @@ def test_fixed_mobjects():
     assert set(scene.camera.fixed_orientation_mobjects) == {s}
     scene.remove_fixed_orientation_mobjects(s)
     assert len(scene.camera.fixed_orientation_mobjects) == 0
+
+
+def sort_by_reference_points(mobjects, rot_matrix):
+    return sorted(
+        mobjects,
+        key=lambda mob: (
+            np.dot(mob.get_z_index_reference_point(), rot_matrix.T)[2]
+            if getattr(mob, "shade_in_3d", False)
+            else np.inf
+        ),
+    )
+
+
+def test_depth_sorting_matches_reference_points():
+    scene = ThreeDScene()
+    scene.set_camera_orientation(phi=70 * DEGREES, theta=30 * DEGREES)
+    camera = scene.camera
+    camera.reset_rotation_matrix()
+    rot_matrix = camera.get_rotation_matrix()
+    sphere = Sphere(resolution=(6, 4))
+    prism = Prism(dimensions=[1, 2, 3]).shift(RIGHT)
+    mobjects = [Square(), *sphere, *prism, Circle()]
+
+    expected = sort_by_reference_points(mobjects, rot_matrix)
+    assert camera.get_mobjects_to_display(mobjects) == expected
+    # The order follows the points when they move.
+    sphere.shift(2 * OUT)
+    expected = sort_by_reference_points(mobjects, rot_matrix)
+    assert camera.get_mobjects_to_display(mobjects) == expected
+
+
+def test_mesh_faces_are_sorted_like_faces():
+    scene = ThreeDScene()
+    scene.set_camera_orientation(phi=70 * DEGREES, theta=30 * DEGREES)
+    camera = scene.camera
+    camera.reset_rotation_matrix()
+    faces = list(Sphere(resolution=(6, 4)))
+    mesh = Sphere(resolution=(6, 4), use_mesh=True)
+
+    np.testing.assert_array_equal(
+        camera.get_mesh_face_order(mesh),
+        np.argsort(camera.get_depth_keys(faces), kind="stable"),
+    )
@@ -159,3 +159,62 @@ def test_hash_consistency():
     assert_two_objects_produce_same_hash(Square(), Square())
     s = Square()
     assert_two_objects_produce_same_hash(s, s.copy())
+
+
+def test_structural_hash_consistency():
+    def structural_hash(obj):
+        return hashing._StructuralHasher().hexdigest(obj)
+
+    assert structural_hash(Square()) == structural_hash(Square())
+    s = Square()
+    assert structural_hash(s) == structural_hash(s.copy())
+    assert structural_hash(s) != structural_hash(s.copy().shift([1, 0, 0]))
+
+
+def test_structural_hash_with_big_np_array():
+    import numpy as np
+
+    a = np.zeros((1000, 1000))
+    b = a.copy()
+    b[-1, -1] = 1
+    hasher = hashing._StructuralHasher()
+    # Arrays are never truncated, so a difference in the last element counts.
+    assert hasher.hexdigest(a) != hasher.hexdigest(b)
+
+
+def test_structural_hash_with_function_and_external_val():
+    external = 2
+
+    def test(uhu):
+        uhu += external
+        return uhu
+
+    hash1 = hashing._StructuralHasher().hexdigest(test)
+    external = 3
+    hash2 = hashing._StructuralHasher().hexdigest(test)
+    assert hash1 != hash2
+
+
+def test_structural_hash_with_circular_references():
+    class T:
+        def __init__(self) -> None:
+            self.a = None
+
+    o = T()
+    o.a = o
+    other = T()
+    other.a = other
+    assert hashing._StructuralHasher().hexdigest(
+        o
+    ) == hashing._StructuralHasher().hexdigest(other)
+
+
+def test_structural_hash_placeholders():
+    class T:
+        def __init__(self, scene) -> None:
+            self.scene = scene
+
+    scene1, scene2 = [1, 2], [3]
+    assert hashing._StructuralHasher(placeholders=[scene1]).hexdigest(
+        T(scene1)
+    ) == hashing._StructuralHasher(placeholders=[scene2]).hexdigest(T(scene2))
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from manim import Scene, tempconfig
+from manim import RIGHT, Circle, Scene, Square, tempconfig
 from manim.mobject.opengl.opengl_mobject import OpenGLMobject
 
 
@@ -34,3 +34,29 @@ def test_scene_add_remove(using_opengl_renderer):
 
         # Check that Scene.remove() returns the instance (for chained calls)
         assert scene.add(OpenGLMobject()) is scene
+
+
+def test_vertex_buffers_are_kept_between_frames(using_opengl_renderer):
+    with tempconfig({"dry_run": True}):
+        scene = Scene()
+        renderer = scene.renderer
+        square = Square(fill_opacity=1)
+        circle = Circle()
+        scene.add(square, circle)
+        renderer.update_frame(scene)
+        buffers = dict(renderer.vertex_buffers)
+        vertex_buffer_objects = {
+            key: vertex_buffers.vertex_buffer_object
+            for key, vertex_buffers in buffers.items()
+        }
+        assert any(key[0] == id(circle) for key in buffers)
+
+        square.shift(RIGHT)
+        renderer.update_frame(scene)
+        assert renderer.vertex_buffers == buffers
+        for key, vertex_buffers in buffers.items():
+            assert vertex_buffers.vertex_buffer_object is vertex_buffer_objects[key]
+
+        scene.remove(circle)
+        renderer.update_frame(scene)
+        assert all(key[0] != id(circle) for key in renderer.vertex_buffers)
@@ -1,6 +1,23 @@
 from __future__ import annotations
 
-from manim import MovingCamera, Square
+import numpy as np
+
+from manim import (
+    BLUE,
+    DOWN,
+    LEFT,
+    RED,
+    RIGHT,
+    UP,
+    Camera,
+    Circle,
+    Line,
+    MovingCamera,
+    Square,
+    Surface,
+    ThreeDCamera,
+    VGroup,
+)
 
 
 def test_movingcamera_auto_zoom():
@@ -9,3 +26,68 @@ def test_movingcamera_auto_zoom():
     margin = 0.5
     camera.auto_zoom([square], margin=margin, animate=False)
     assert camera.frame.height == square.height + margin
+
+
+def test_cairo_path_matches_subpaths():
+    camera = Camera()
+    mobjects = VGroup(Square(), Circle().shift(RIGHT), Line(LEFT, UP))
+    for mob in mobjects.family_members_with_points():
+        path = camera.get_cairo_path(mob, mob.points)
+        subpaths = mob.get_subpaths()
+        assert len(path) == len(subpaths)
+        for (start, curves, closed), subpath in zip(path, subpaths):
+            np.testing.assert_allclose(start, subpath[0, :2])
+            assert len(curves) == len(subpath) // mob.n_points_per_cubic_curve
+            np.testing.assert_allclose(curves[-1][-2:], subpath[-1, :2])
+            assert closed == mob.consider_points_equals_2d(subpath[0], subpath[-1])
+
+
+def test_cairo_path_cache_is_invalidated():
+    camera = Camera()
+    square = Square()
+    path = camera.get_cairo_path(square, square.points)
+    assert camera.get_cairo_path(square, square.points) is path
+
+    square.shift(RIGHT)
+    path = camera.get_cairo_path(square, square.points)
+    np.testing.assert_allclose(path[0][0], square.points[0, :2])
+
+    square.points[0] += UP
+    path = camera.get_cairo_path(square, square.points)
+    np.testing.assert_allclose(path[0][0], square.points[0, :2])
+
+
+def test_mobjects_outside_frame_are_not_captured():
+    camera = MovingCamera()
+    camera.frame.set(width=4)
+    inside = Square(side_length=1)
+    outside = Square(side_length=1).shift(5 * RIGHT)
+    # The stroke of a mobject just outside of the frame may still be visible.
+    stroke = Line(2.05 * LEFT + UP, 2.05 * LEFT + DOWN, stroke_width=20)
+    mobjects = [inside, outside, stroke]
+    assert camera.remove_mobjects_outside_frame(mobjects) == [inside, stroke]
+
+    camera.frame.set(width=14)
+    assert camera.remove_mobjects_outside_frame(mobjects) == mobjects
+    assert ThreeDCamera().remove_mobjects_outside_frame(mobjects) == mobjects
+
+
+def test_mesh_surface_faces_are_displayed():
+    camera = Camera()
+    surface = Surface(
+        lambda u, v: np.array([u, v, 0]),
+        u_range=[-1, 1],
+        v_range=[-1, 1],
+        resolution=4,
+        checkerboard_colors=[RED, BLUE],
+        stroke_width=0,
+        use_mesh=True,
+    )
+    camera.capture_mobject(surface)
+
+    centers = [[-0.75, -0.75, 0], [-0.75, -0.25, 0]]
+    pixels = camera.points_to_pixel_coords(surface, np.array(centers))
+    for (x, y), color in zip(pixels, [RED, BLUE]):
+        np.testing.assert_allclose(
+            camera.pixel_array[y, x, :3], color.to_int_rgb(), atol=1
+        )
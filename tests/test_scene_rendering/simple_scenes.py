@@ -47,6 +47,14 @@ class SceneWithMultipleWaitCalls(Scene):
         self.wait(1)
 
 
+class SceneWithRepeatedWaits(Scene):
+    def construct(self):
+        self.play(Create(Square()))
+        self.wait(1)
+        self.wait(1)
+        self.wait(1)
+
+
 class NoAnimations(Scene):
     def construct(self):
         dot = Dot().set_color(GREEN)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import sys
 
 import numpy as np
@@ -114,6 +115,59 @@ def test_n_flag(tmp_path, simple_scenes_path):
     assert exit_code == 0, err
 
 
+@pytest.mark.slow
+@video_comparison(
+    "SceneWithMultipleWaitCallsWithNFlag.json",
+    "videos/simple_scenes/480p15/SceneWithMultipleWaitCalls.mp4",
+)
+def test_jobs_flag(tmp_path, simple_scenes_path):
+    scene_name = "SceneWithMultipleWaitCalls"
+    command = [
+        sys.executable,
+        "-m",
+        "manim",
+        "-ql",
+        "-n",
+        "3",
+        "--jobs",
+        "2",
+        "--media_dir",
+        str(tmp_path),
+        str(simple_scenes_path),
+        scene_name,
+    ]
+    _, err, exit_code = capture(command)
+    assert exit_code == 0, err
+
+
+@pytest.mark.slow
+def test_jobs_flag_with_repeated_animations(tmp_path, simple_scenes_path):
+    scene_name = "SceneWithRepeatedWaits"
+    metadata = []
+    for jobs in ["1", "2"]:
+        media_dir = tmp_path / f"jobs_{jobs}"
+        command = [
+            sys.executable,
+            "-m",
+            "manim",
+            "-ql",
+            "--jobs",
+            jobs,
+            "--media_dir",
+            str(media_dir),
+            str(simple_scenes_path),
+            scene_name,
+        ]
+        _, err, exit_code = capture(command)
+        assert exit_code == 0, err
+        video_path = (
+            media_dir / "videos" / "simple_scenes" / "480p15" / f"{scene_name}.mp4"
+        )
+        metadata.append(get_video_metadata(video_path))
+    assert metadata[1]["nb_frames"] == metadata[0]["nb_frames"] == "60"
+    assert metadata[1]["duration"] == metadata[0]["duration"]
+
+
 @pytest.mark.slow
 def test_s_flag_no_animations(tmp_path, manim_cfg_file, simple_scenes_path):
     scene_name = "NoAnimations"
@@ -251,6 +305,62 @@ def test_a_flag(tmp_path, manim_cfg_file, infallible_scenes_path):
     )
 
 
+@pytest.mark.slow
+def test_scene_jobs_flag(tmp_path, manim_cfg_file, infallible_scenes_path):
+    command = [
+        sys.executable,
+        "-m",
+        "manim",
+        "-ql",
+        "--media_dir",
+        str(tmp_path),
+        "-a",
+        "--scene_jobs",
+        "2",
+        str(infallible_scenes_path),
+    ]
+    out, err, exit_code = capture(command)
+    assert exit_code == 0, err
+    assert "Rendered scenes" in out
+
+    video_dir = tmp_path / "videos" / "infallible_scenes" / "480p15"
+    assert (video_dir / "Wait1.mp4").is_file()
+    assert (video_dir / "Wait3.mp4").is_file()
+    assert (
+        tmp_path / "images" / "infallible_scenes" / f"Wait2_ManimCE_v{__version__}.png"
+    ).is_file()
+
+
+@pytest.mark.slow
+def test_profile_flag(tmp_path, manim_cfg_file, simple_scenes_path):
+    scene_name = "SquareToCircle"
+    command = [
+        sys.executable,
+        "-m",
+        "manim",
+        "-ql",
+        "--profile",
+        "--media_dir",
+        str(tmp_path),
+        str(simple_scenes_path),
+        scene_name,
+    ]
+    _, err, exit_code = capture(command)
+    assert exit_code == 0, err
+
+    trace_path = (
+        tmp_path / "videos" / "simple_scenes" / "480p15" / "SquareToCircle.trace.json"
+    )
+    trace = json.loads(trace_path.read_text())
+    event_names = {event["name"] for event in trace["traceEvents"]}
+    for stage in ("play", "hash", "frame", "interpolate", "capture", "encode"):
+        assert stage in event_names
+    frames = [event for event in trace["traceEvents"] if event["name"] == "frame"]
+    assert len(frames) == 15
+    draw_costs = trace["otherData"]["measurements"]["draw"]
+    assert draw_costs["Square"]["count"] > 0
+
+
 @pytest.mark.slow
 def test_custom_folders(tmp_path, manim_cfg_file, simple_scenes_path):
     scene_name = "SquareToCircle"
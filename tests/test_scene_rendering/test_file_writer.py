@@ -7,7 +7,7 @@ import numpy as np
 import pytest
 
 from manim import DR, Circle, Create, Scene, Star, tempconfig
-from manim.scene.scene_file_writer import to_av_frame_rate
+from manim.scene.scene_file_writer import SceneFileWriter, to_av_frame_rate
 from manim.utils.commands import capture, get_video_metadata
 
 
@@ -147,6 +147,149 @@ def test_codecs(config, tmp_path, format, transparent, codec, pixel_format):
     np.testing.assert_allclose(first_frame[-1, -1], target_rgba_center, atol=5)
 
 
+@pytest.mark.slow
+def test_bounded_frame_buffers(config, tmp_path, monkeypatch):
+    monkeypatch.setattr(SceneFileWriter, "frame_buffer_count", 2)
+    with tempconfig(
+        {
+            "media_dir": tmp_path,
+            "quality": "low_quality",
+            "output_file": "bounded_frame_buffers",
+        }
+    ):
+        scene = StarScene()
+        scene.render()
+
+    assert len(scene.renderer.file_writer.frame_buffers) == 2
+    video_path = tmp_path / "videos" / "480p15" / "bounded_frame_buffers.mp4"
+    with av.open(video_path) as container:
+        frames = [frame.to_ndarray() for frame in container.decode(video=0)]
+    assert len(frames) == 30
+    # Frames of the Create animation must not be overwritten by later frames
+    # while they wait to be encoded.
+    assert not np.array_equal(frames[1], frames[14])
+    np.testing.assert_allclose(frames[15], frames[29], atol=2)
+
+
+class HoldScene(Scene):
+    def construct(self):
+        self.add(Circle(fill_opacity=1, color="#ff0000"))
+        self.wait(2)
+
+
+@pytest.mark.slow
+def test_held_frame_is_converted_once(config, tmp_path, monkeypatch):
+    conversions = []
+    convert_frame = SceneFileWriter.convert_frame
+
+    def counting_convert_frame(self, frame):
+        conversions.append(frame)
+        return convert_frame(self, frame)
+
+    monkeypatch.setattr(SceneFileWriter, "convert_frame", counting_convert_frame)
+    with tempconfig(
+        {
+            "media_dir": tmp_path,
+            "quality": "low_quality",
+            "output_file": "held_frame",
+        }
+    ):
+        HoldScene().render()
+
+    assert len(conversions) == 1
+    video_path = tmp_path / "videos" / "480p15" / "held_frame.mp4"
+    with av.open(video_path) as container:
+        stream = container.streams.video[0]
+        frames = list(container.decode(stream))
+        time_base = stream.time_base
+    duration = (frames[-1].pts - frames[0].pts) * time_base + Fraction(1, 15)
+    assert len(frames) == 30
+    assert duration == 2
+    first_frame = frames[0].to_ndarray(format="rgb24")
+    np.testing.assert_allclose(
+        frames[-1].to_ndarray(format="rgb24"), first_frame, atol=2
+    )
+
+
+def test_encoding_error_is_raised(config, tmp_path, monkeypatch):
+    def encode_and_write_frame(self, frame, num_frames):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(SceneFileWriter, "frame_buffer_count", 2)
+    monkeypatch.setattr(
+        SceneFileWriter, "encode_and_write_frame", encode_and_write_frame
+    )
+    with (
+        tempconfig({"media_dir": tmp_path, "quality": "low_quality"}),
+        pytest.raises(OSError, match="No space left on device"),
+    ):
+        StarScene().render()
+
+
+@pytest.mark.slow
+def test_partial_movie_cache_index(config, tmp_path):
+    with tempconfig({"media_dir": tmp_path, "quality": "low_quality"}):
+        scene = StarScene()
+        scene.render()
+        file_writer = scene.renderer.file_writer
+
+        partial_movie_files = [
+            path
+            for path in file_writer.partial_movie_directory.iterdir()
+            if path.suffix == ".mp4"
+        ]
+        assert len(partial_movie_files) == 2
+        assert file_writer.cache_index.usage() == (
+            2,
+            sum(path.stat().st_size for path in partial_movie_files),
+        )
+        assert file_writer.is_already_cached(partial_movie_files[0].stem)
+
+        config.max_bytes_cached = max(
+            path.stat().st_size for path in partial_movie_files
+        )
+        file_writer.clean_cache()
+        assert file_writer.cache_index.usage()[0] == 1
+
+        config.max_bytes_cached = 0
+        file_writer.clean_cache()
+        assert file_writer.cache_index.usage() == (0, 0)
+        assert not any(path.exists() for path in partial_movie_files)
+        assert not file_writer.is_already_cached(partial_movie_files[0].stem)
+
+
+@pytest.mark.slow
+def test_shared_cache(config, tmp_path, monkeypatch):
+    shared_cache = tmp_path / "shared"
+    with tempconfig(
+        {
+            "media_dir": tmp_path / "first_node",
+            "quality": "low_quality",
+            "shared_cache": shared_cache,
+        }
+    ):
+        StarScene().render()
+    assert len(list((shared_cache / "480p15").iterdir())) == 2
+
+    def open_partial_movie_stream(self, file_path=None):
+        raise AssertionError("cached animations must not be rendered again")
+
+    monkeypatch.setattr(
+        SceneFileWriter, "open_partial_movie_stream", open_partial_movie_stream
+    )
+    with tempconfig(
+        {
+            "media_dir": tmp_path / "second_node",
+            "quality": "low_quality",
+            "shared_cache": shared_cache,
+        }
+    ):
+        scene = StarScene()
+        scene.render()
+    assert scene.renderer.file_writer.cache_index.usage()[0] == 2
+    assert (tmp_path / "second_node" / "videos" / "480p15" / "StarScene.mp4").exists()
+
+
 def test_scene_with_non_raw_or_wav_audio(config, manim_caplog):
     class SceneWithMP3(Scene):
         def construct(self):